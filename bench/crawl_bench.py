@@ -0,0 +1,215 @@
+"""크롤 처리량 벤치마크: 로컬 모의 서버(bench/sim_server.py)를 띄우고 crawl_fmkorea / crawl_dcinside /
+crawl_theqoo 를 실제 코드 그대로 돌린다 (HTTP 경로, 속도 제한, 병렬 상세 포함).
+
+    python bench/crawl_bench.py                                  # 세 사이트, 기본 서버 설정
+    python bench/crawl_bench.py --sites DCInside --hours 6 --latency-ms 120 --throttle-rate 0.01
+    python bench/crawl_bench.py --save bench/baseline.json       # 기준값 저장
+    python bench/crawl_bench.py --baseline bench/baseline.json   # pages/min 이 기준보다 tolerance 이상 떨어지면 실패
+    python bench/crawl_bench.py --error-rate 0.05 --throttle-rate 0.03 --past-end repeat   # 오류 주입
+
+사이트마다 새 프로세스에서 돌려 최대 RSS 를 따로 잰다. 시간은 스레드-초 합계로
+sleep(속도 제한 대기) / fetch(HTTP 요청) / parse(파싱 + 행 만들기) / browser(브라우저 폴백) 로 나눈다.
+모의 서버에는 브라우저가 필요 없으므로 기본값은 브라우저 폴백을 그 페이지의 실패로 센다
+(--browser 로 실제 Chrome 사용). 실패한 페이지가 있어도 수집은 계속하고, 중간에 멈추면 그때까지 모은 행을 센다.
+"""
+import os, sys, json, time, argparse, threading, subprocess
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import sim_server  # noqa: E402
+
+SITES = {
+    "FMKorea":  "/fmkorea/best",
+    "DCInside": "/dcinside/board/lists/?id=bench",
+    "TheQoo":   "/theqoo/hot",
+}
+PHASES = ("sleep", "fetch", "parse", "browser")
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:                      # Windows
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / 2**20
+        except Exception:
+            return None
+    r = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return r / (2**20 if sys.platform == "darwin" else 1024)
+
+
+class PhaseTimer:
+    """스레드별로 fetch() 안에서 쓴 시간을 나눠 센다. parse = fetch() 전체 - 대기 - 요청 - 브라우저."""
+    def __init__(self):
+        self.totals = dict.fromkeys(PHASES + ("fetch_call",), 0.0)
+        self.browser_fallbacks = 0
+        self._lock = threading.Lock()
+
+    def add(self, key, dt):
+        with self._lock: self.totals[key] += dt
+
+    def wrap(self, owner, name, key):
+        orig = getattr(owner, name)
+        def timed(*a, **kw):
+            t0 = time.perf_counter()
+            try: return orig(*a, **kw)
+            finally: self.add(key, time.perf_counter() - t0)
+        setattr(owner, name, timed)
+
+    def result(self):
+        t = dict(self.totals)
+        t["parse"] = max(0.0, t.pop("fetch_call") - t["sleep"] - t["fetch"] - t["browser"])
+        return {k: round(v, 3) for k, v in t.items()}
+
+
+class BrowserDisabled(RuntimeError):
+    """벤치에서 끈 브라우저 폴백 → 그 페이지의 실패 (상세는 재시도 큐, 목록은 그 앞까지만)."""
+
+
+class RowTap:
+    """crawl_* 의 sink 자리: 페이지마다 기록된 행을 모은다 (수집이 예외로 끝나도 그때까지의 행이 남는다)."""
+    def __init__(self):
+        self.rows = []
+
+    def write_rows(self, rows):
+        self.rows.extend(rows)
+
+
+def run_child(args):
+    """한 사이트를 이 프로세스에서 수집 → 결과 JSON 한 줄 출력."""
+    sys.path.insert(0, ROOT)
+    import crawler_core, crawler_http, crawler_rate
+    from crawler_limits import Limits
+    from crawler_metrics import METRICS
+    timer = PhaseTimer()
+    timer.wrap(crawler_rate.RateLimiter, "wait", "sleep")
+    timer.wrap(crawler_http.HttpEngine, "get", "fetch")
+    timer.wrap(crawler_core.Fetcher, "fetch", "fetch_call")
+    if not args.browser:
+        def no_browser(self, url):
+            with timer._lock: timer.browser_fallbacks += 1
+            raise BrowserDisabled(f"브라우저 폴백 (벤치에서는 끔): {url}")
+        crawler_core.Fetcher._browser_get = no_browser
+    timer.wrap(crawler_core.Fetcher, "_browser_get", "browser")
+    if args.rate_max:
+        crawler_rate.RATE_LIMITER.max_rate = args.rate_max
+    crawler_core.SELECTOR_STATS = None     # 모의 서버 게시판의 선택자 통계는 남기지 않는다 (매번 같은 조건)
+
+    logs = []
+    # stdout 은 결과 JSON 한 줄만 (자세히 보기 로그는 stderr 로 → 부모가 그대로 흘려보낸다)
+    log = (lambda msg: print(msg, file=sys.stderr, flush=True)) if args.verbose else logs.append
+    crawl = {"FMKorea": crawler_core.crawl_fmkorea, "DCInside": crawler_core.crawl_dcinside,
+             "TheQoo": crawler_core.crawl_theqoo}[args.child]
+    cutoff = datetime.now() - timedelta(hours=args.hours)
+    tap, limits = RowTap(), Limits()
+    t0 = time.perf_counter()
+    error = None
+    try:
+        crawl(args.base + SITES[args.child], cutoff, False, log, args.workers, sink=tap, limits=limits)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    wall = time.perf_counter() - t0
+    rows = tap.rows
+    counters = next(iter(METRICS.report()["counters"].values()), {})
+    print(json.dumps({"site": args.child, "wall_s": round(wall, 3), "rows": len(rows),
+                      "unique": len({r["Link"] for r in rows}), "peak_rss_mb": peak_rss_mb(),
+                      "phases": timer.result(), "browser_fallbacks": timer.browser_fallbacks,
+                      "failed_pages": counters.get("list_failed", 0) + counters.get("detail_failed", 0),
+                      "partial": limits.reason, "error": error, "log_lines": len(logs)}))
+    return 0
+
+
+def run_site(srv, site, args):
+    before = dict(srv.stats)
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", site, "--base", srv.base_url,
+           "--hours", str(args.hours), "--workers", str(args.workers)]
+    if args.rate_max: cmd += ["--rate-max", str(args.rate_max)]
+    if args.browser: cmd.append("--browser")
+    if args.verbose: cmd.append("--verbose")
+    out = subprocess.run(cmd, cwd=ROOT, stdout=subprocess.PIPE, stderr=None if args.verbose else subprocess.PIPE,
+                         text=True)
+    if out.returncode != 0:
+        raise RuntimeError(f"{site} 벤치 프로세스 실패:\n{out.stderr or '(위 출력 참고)'}")
+    r = json.loads(out.stdout.strip().splitlines()[-1]) if out.stdout else {}
+    served = {k: srv.stats[k] - before[k] for k in srv.stats}
+    pages = served["list"] + served["detail"]
+    mins = r["wall_s"] / 60
+    r.update(served=served, pages=pages,
+             pages_per_min=round(pages / mins, 1) if mins else 0.0,
+             rows_per_min=round(r["rows"] / mins, 1) if mins else 0.0)
+    return r
+
+
+def report(results):
+    print(f"{'site':9s} {'wall':>7s} {'pages':>6s} {'rows':>6s} {'pages/min':>10s} {'rows/min':>10s} {'RSS MB':>7s}  "
+          + "  ".join(f"{p:>7s}" for p in PHASES))
+    for r in results:
+        rss = f"{r['peak_rss_mb']:.0f}" if r.get("peak_rss_mb") else "-"
+        print(f"{r['site']:9s} {r['wall_s']:6.1f}s {r['pages']:6d} {r['rows']:6d} {r['pages_per_min']:10.1f} "
+              f"{r['rows_per_min']:10.1f} {rss:>7s}  " + "  ".join(f"{r['phases'][p]:6.1f}s" for p in PHASES))
+        s = r["served"]
+        print(f"  목록 {s['list']} / 상세 {s['detail']} / 500 {s['error']} / 429 {s['throttled']} / 404 {s['missing']}"
+              f" | 중복 행 {r['rows'] - r['unique']} | 브라우저 폴백 {r['browser_fallbacks']}"
+              f" | 실패 페이지 {r.get('failed_pages', 0)}"
+              + (f" | 중단: {r['partial']}" if r.get("partial") else "")
+              + (f" | 오류: {r['error']}" if r.get("error") else ""))
+
+
+def compare(results, baseline, tolerance):
+    """기준보다 pages/min 이 tolerance 비율 넘게 떨어진 사이트 목록."""
+    base = {r["site"]: r for r in baseline["results"]}
+    worse = []
+    for r in results:
+        b = base.get(r["site"])
+        if not b or not b["pages_per_min"]: continue
+        change = r["pages_per_min"] / b["pages_per_min"] - 1
+        print(f"{r['site']:9s} pages/min {b['pages_per_min']:.1f} → {r['pages_per_min']:.1f} ({change:+.0%})")
+        if change < -tolerance: worse.append(r["site"])
+    return worse
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sites", nargs="+", choices=list(SITES), default=list(SITES))
+    ap.add_argument("--hours", type=float, default=2.0, help="수집 구간 (cutoff = 지금 - hours)")
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--rate-max", type=float, help="호스트별 최대 요청/초 (기본: crawler_rate.RATE_MAX)")
+    ap.add_argument("--browser", action="store_true", help="브라우저 폴백 허용")
+    ap.add_argument("--save", help="결과 JSON 저장 경로")
+    ap.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    ap.add_argument("--tolerance", type=float, default=0.15, help="허용하는 pages/min 감소 비율")
+    ap.add_argument("--verbose", action="store_true", help="크롤러 로그 출력")
+    ap.add_argument("--child", choices=list(SITES), help=argparse.SUPPRESS)
+    ap.add_argument("--base", help=argparse.SUPPRESS)
+    sim_server.add_args(ap)
+    ap.set_defaults(post_rate=5.0)
+    args = ap.parse_args(argv)
+    if args.child:
+        return run_child(args)
+
+    cfg = sim_server.config_from(args)
+    srv = sim_server.start(cfg)
+    try:
+        results = [run_site(srv, site, args) for site in args.sites]
+    finally:
+        srv.shutdown()
+    report(results)
+    doc = {"when": datetime.now().isoformat(timespec="seconds"), "config": vars(cfg),
+           "hours": args.hours, "workers": args.workers, "results": results}
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(doc, f, ensure_ascii=False, indent=1)
+    ok = not any(r.get("error") for r in results)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            worse = compare(results, json.load(f), args.tolerance)
+        if worse:
+            print(f"실패: 처리량 감소 {', '.join(worse)}"); ok = False
+    print("OK" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
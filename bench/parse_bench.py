@@ -0,0 +1,125 @@
+"""파서 벤치마크 + 회귀 검사 (WebDriver/네트워크 없이 bench/fixtures 의 HTML 만 사용).
+
+    python bench/parse_bench.py                      # 기대 결과 검사 + 사이트/종류별 pages/s, rows/s
+    python bench/parse_bench.py --processes 4        # 프로세스 풀로도 측정
+    python bench/parse_bench.py --min-pages-per-s 50 # 이보다 느린 파서가 있으면 실패
+    python bench/parse_bench.py --update             # 현재 파서 결과로 manifest 의 기대값 갱신 (셀렉터를 바꾼 뒤)
+
+기대 결과와 다르거나(셀렉터 회귀) 처리량이 하한보다 낮으면 종료 코드 1.
+"""
+import os, sys, json, time, argparse
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import crawler_parse  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "bench", "fixtures")
+MANIFEST = os.path.join(FIXTURES, "manifest.json")
+FIELDS = ("Link", "Title", "Date", "Views")   # 실행 시각에 따라 바뀌는 _dt 등은 비교하지 않음
+
+
+def load_manifest():
+    with open(MANIFEST, encoding="utf-8") as f:
+        items = json.load(f)
+    for it in items:
+        with open(os.path.join(FIXTURES, it["file"]), encoding="utf-8") as f:
+            it["html"] = f.read()
+    return items
+
+
+def normalize(result):
+    """파서 결과 → 비교용 행 목록."""
+    if result is None: return []
+    if isinstance(result, tuple):                        # FMK 상세 (제목, 날짜, 조회수)
+        return [dict(zip(("Title", "Date", "Views"), result))]
+    if isinstance(result, dict): result = [result]
+    rows = []
+    for r in result:
+        if isinstance(r, tuple):                         # DC 목록 (href, 제목, 날짜, 조회수)
+            r = dict(zip(FIELDS, r))
+        rows.append({k: r[k] for k in FIELDS if k in r})
+    return rows
+
+
+def _parse_one(args):
+    site, kind, html, url = args
+    return len(normalize(crawler_parse.parse(site, kind, html, url)))
+
+
+def check(items):
+    bad = 0
+    for it in items:
+        got = normalize(crawler_parse.parse(it["site"], it["kind"], it["html"], it["url"]))
+        if got != it.get("expected"):
+            bad += 1
+            exp = it.get("expected") or []
+            print(f"  불일치: {it['file']} (행 {len(got)} / 기대 {len(exp)})")
+            for g, e in zip(got, exp):
+                if g != e:
+                    print(f"    결과 {g}\n    기대 {e}"); break
+    return bad
+
+
+def bench(items, seconds):
+    """(site, kind) → (pages/s, rows/s). 페이지마다 최소 seconds 동안 반복."""
+    out = {}
+    for it in items:
+        key = (it["site"], it["kind"])
+        n = rows = 0; t0 = time.perf_counter()
+        while True:
+            rows += len(normalize(crawler_parse.parse(it["site"], it["kind"], it["html"], it["url"])))
+            n += 1
+            el = time.perf_counter() - t0
+            if el >= seconds: break
+        p, r, t = out.get(key, (0, 0, 0.0))
+        out[key] = (p + n, r + rows, t + el)
+    return {k: (p / t, r / t) for k, (p, r, t) in out.items()}
+
+
+def bench_processes(items, procs, repeat):
+    jobs = [(it["site"], it["kind"], it["html"], it["url"]) for it in items] * repeat
+    with ProcessPoolExecutor(procs) as ex:
+        list(ex.map(_parse_one, jobs[:procs]))            # 워커 기동/import 는 측정에서 뺀다
+        t0 = time.perf_counter()
+        rows = sum(ex.map(_parse_one, jobs, chunksize=max(1, len(jobs) // (procs * 4))))
+        el = time.perf_counter() - t0
+    return len(jobs) / el, rows / el
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--seconds", type=float, default=0.5, help="페이지당 측정 시간")
+    ap.add_argument("--processes", type=int, default=0)
+    ap.add_argument("--repeat", type=int, default=50, help="--processes 측정 때 코퍼스 반복 횟수")
+    ap.add_argument("--min-pages-per-s", type=float, default=0)
+    ap.add_argument("--update", action="store_true")
+    args = ap.parse_args(argv)
+
+    items = load_manifest()
+    if args.update:
+        for it in items:
+            it["expected"] = normalize(crawler_parse.parse(it["site"], it["kind"], it["html"], it["url"]))
+        with open(MANIFEST, "w", encoding="utf-8") as f:
+            json.dump([{k: v for k, v in it.items() if k != "html"} for it in items], f, ensure_ascii=False, indent=1)
+        print(f"기대 결과 갱신: {len(items)}개 페이지"); return 0
+
+    ok = True
+    bad = check(items)
+    print(f"회귀 검사: {len(items) - bad}/{len(items)} 페이지 일치")
+    if bad: ok = False
+
+    for (site, kind), (pps, rps) in sorted(bench(items, args.seconds).items()):
+        print(f"{site:9s} {kind:6s} {pps:8.1f} pages/s {rps:10.1f} rows/s")
+        if pps < args.min_pages_per_s:
+            print(f"  실패: 하한 {args.min_pages_per_s:.0f} pages/s 미만"); ok = False
+    if args.processes:
+        pps, rps = bench_processes(items, args.processes, args.repeat)
+        print(f"프로세스 {args.processes}개: {pps:8.1f} pages/s {rps:10.1f} rows/s")
+
+    print("OK" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""실제 페이지를 받아 bench/fixtures 코퍼스에 추가/갱신 (HTTP 엔진 사용, 브라우저 없음).
+
+    python bench/record_fixtures.py FMKorea list https://www.fmkorea.com/best
+    python bench/record_fixtures.py TheQoo detail https://theqoo.net/hot/1234567890 --name theqoo_detail.html
+
+받은 HTML 로 현재 파서를 돌려 결과를 기대값으로 저장한다. 저장 전에 결과를 눈으로 확인할 것
+(행이 0개면 저장하지 않음 — 챌린지 페이지이거나 셀렉터가 이미 깨진 것).
+"""
+import os, sys, json, argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import crawler_parse  # noqa: E402
+from crawler_http import HttpEngine, needs_browser, transient  # noqa: E402
+from parse_bench import FIXTURES, MANIFEST, normalize  # noqa: E402
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("site", choices=sorted(crawler_parse.PARSERS))
+    ap.add_argument("kind", choices=("list", "detail"))
+    ap.add_argument("url")
+    ap.add_argument("--name", help="저장할 파일 이름 (기본: site_kind.html)")
+    args = ap.parse_args(argv)
+    if args.kind not in crawler_parse.PARSERS[args.site]:
+        print(f"{args.site} 에는 {args.kind} 파서가 없습니다."); return 2
+
+    eng = HttpEngine()
+    try:
+        page = eng.get(args.url)
+    finally:
+        eng.close()
+    if needs_browser(page) or transient(page):
+        print(f"받기 실패 또는 챌린지 페이지 (status={getattr(page, 'status', None)})"); return 1
+    rows = normalize(crawler_parse.parse(args.site, args.kind, page.text, page.url))
+    if not rows:
+        print("파서 결과가 비었습니다. 저장하지 않음."); return 1
+    for r in rows[:5]: print(" ", r)
+    print(f"  … 총 {len(rows)}행")
+
+    name = args.name or f"{args.site.lower()}_{args.kind}.html"
+    with open(os.path.join(FIXTURES, name), "w", encoding="utf-8") as f:
+        f.write(page.text)
+    items = []
+    if os.path.exists(MANIFEST):
+        with open(MANIFEST, encoding="utf-8") as f:
+            items = [it for it in json.load(f) if it["file"] != name]
+    items.append({"file": name, "site": args.site, "kind": args.kind, "url": page.url, "expected": rows})
+    with open(MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(items, f, ensure_ascii=False, indent=1)
+    print(f"저장: {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""로컬 모의 커뮤니티 서버: FMKorea/DCInside/TheQoo 모양의 목록/상세 페이지를 만들어 준다 (벤치마크용).
+
+    python bench/sim_server.py --port 8765 --post-rate 30 --pages 50 --latency-ms 80 --error-rate 0.01
+
+주소 (BASE = http://127.0.0.1:PORT):
+    BASE/fmkorea/best?page=N        FMK 일반 게시판 표 (오늘 글은 HH:MM, 이전 글은 날짜만 → 상세 필요)
+    BASE/fmkorea/<글번호>            FMK 상세
+    BASE/dcinside/board/lists/?id=bench&page=N   DC 목록 (title 에 전체 시각)
+    BASE/theqoo/hot?page=N          더쿠 목록 (오늘 글은 HH:MM, 이전 글은 MM.DD)
+    BASE/theqoo/hot/<글번호>         더쿠 상세
+
+글은 post_rate(분당) 간격으로 계속 올라온다: 서버 시작 시 pages × per_page 개가 있고, 이후 새 글이
+앞에 붙어 목록이 밀린다 (수집 도중 중복/누락 처리를 재는 용도).
+끝을 넘긴 page 는 --past-end 에 따라 빈 목록(empty), 마지막 페이지 반복(repeat), 1페이지(first).
+응답마다 지연(로그정규, 중앙값 latency_ms)을 주고 error_rate 확률로 500, throttle_rate 확률로 429(Retry-After: 1)를 돌려준다.
+"""
+import re, sys, math, time, random, argparse, threading
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+ID_BASE = 1000000          # 글번호 = ID_BASE + 순번 (FMK 링크 패턴은 5자리 이상)
+PAST_END = ("empty", "repeat", "first")
+_FILLER = "".join(f'<li><a href="/menu{i}">메뉴 {i}</a></li>' for i in range(40))
+_TITLES = ("오늘 점심 뭐 먹지", "이거 실화냐", "요즘 날씨", "신작 게임 후기", "퇴근길 상황", "고양이 근황", "질문 있습니다")
+
+
+class SimConfig:
+    def __init__(self, post_rate=30.0, pages=50, per_page=20, latency_ms=50.0, latency_sigma=0.5,
+                 error_rate=0.0, throttle_rate=0.0, past_end="repeat", seed=1):
+        self.post_rate, self.pages, self.per_page = post_rate, pages, per_page
+        self.latency_ms, self.latency_sigma = latency_ms, latency_sigma
+        self.error_rate, self.throttle_rate = error_rate, throttle_rate
+        self.past_end, self.seed = past_end, seed
+
+
+class Board:
+    """글 목록 상태: 순번 n 의 글은 t0 + (n - initial) × 간격 에 올라온 것으로 본다."""
+    def __init__(self, cfg):
+        self.cfg = cfg
+        self.gap = 60.0 / cfg.post_rate
+        self.initial = cfg.pages * cfg.per_page
+        self.t0 = time.time()
+
+    def newest(self):
+        return self.initial + int((time.time() - self.t0) / self.gap)
+
+    def created(self, n):
+        return datetime.fromtimestamp(self.t0 + (n - self.initial) * self.gap)
+
+    def views(self, n):
+        return (n * 7919) % 50000 + 10
+
+    def page(self, p):
+        """page p 의 글 순번 목록 (최신순). 끝을 넘기면 past_end 규칙."""
+        newest = self.newest()
+        last = max(1, math.ceil(newest / self.cfg.per_page))
+        if p > last:
+            if self.cfg.past_end == "empty": return []
+            p = last if self.cfg.past_end == "repeat" else 1
+        hi = newest - (p - 1) * self.cfg.per_page
+        return list(range(hi, max(0, hi - self.cfg.per_page), -1))
+
+
+def _page_html(title, body):
+    return (f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>{title}</title></head>'
+            f'<body><ul class="gnb">{_FILLER}</ul>{body}<ul class="footer">{_FILLER}</ul></body></html>')
+
+def _title(n):
+    return f"{_TITLES[n % len(_TITLES)]} {n}"
+
+def fmk_list(board, ns, today):
+    rows = ['<tr class="notice"><td class="title"><a href="/fmkorea/notice">[공지] 이용 규칙</a></td>'
+            '<td class="time">2020.01.01</td><td class="m_no">999</td></tr>']
+    for n in ns:
+        dt = board.created(n)
+        t = dt.strftime("%H:%M") if dt.date() == today else dt.strftime("%Y.%m.%d")
+        rows.append(f'<tr><td class="title"><a href="/fmkorea/{ID_BASE + n}">{_title(n)}</a></td>'
+                    f'<td class="time">{t}</td><td class="m_no">{board.views(n):,}</td></tr>')
+    return _page_html("FMK", f'<table class="bd_lst"><tbody>{"".join(rows)}</tbody></table>')
+
+def fmk_detail(board, n):
+    return _page_html("FMK", f'<h1 class="np_18px"><span class="np_18px_span">{_title(n)}</span></h1>'
+                             f'<span class="date m_no">{board.created(n):%Y.%m.%d %H:%M}</span>'
+                             f'<div class="side fr"><span>조회 수 <b>{board.views(n):,}</b></span></div>'
+                             f'<div class="xe_content">{"본문 " * 200}</div>')
+
+def dc_list(board, ns, today):
+    rows = ['<tr class="ub-content ub-notice"><td class="gall_tit"><a href="/dcinside/board/view/?id=bench&no=1">공지</a></td>'
+            '<td class="gall_date" title="2020-01-01 00:00:00">20.01.01</td><td class="gall_count">-</td></tr>']
+    for n in ns:
+        dt = board.created(n)
+        short = dt.strftime("%H:%M") if dt.date() == today else dt.strftime("%m.%d")
+        rows.append(f'<tr class="ub-content us-post"><td class="gall_tit"><a href="/dcinside/board/view/?id=bench&no={ID_BASE + n}">{_title(n)}</a></td>'
+                    f'<td class="gall_date" title="{dt:%Y-%m-%d %H:%M:%S}">{short}</td><td class="gall_count">{board.views(n)}</td></tr>')
+    return _page_html("DC", f'<table class="gall_list"><tbody>{"".join(rows)}</tbody></table>')
+
+def tq_list(board, ns, today):
+    rows = ['<tr class="notice"><td class="no"><strong>공지</strong></td><td class="title"><a href="/theqoo/hot/1">공지</a></td>'
+            '<td class="time">20.01.01</td><td class="m_no">999</td></tr>']
+    for n in ns:
+        dt = board.created(n)
+        t = dt.strftime("%H:%M") if dt.date() == today else dt.strftime("%m.%d")
+        rows.append(f'<tr><td class="no">{n}</td><td class="title"><a href="/theqoo/hot/{ID_BASE + n}">{_title(n)}</a></td>'
+                    f'<td class="time">{t}</td><td class="m_no">{board.views(n):,}</td></tr>')
+    return _page_html("TQ", f'<table class="bd_lst"><tbody>{"".join(rows)}</tbody></table>')
+
+def tq_detail(board, n):
+    return _page_html("TQ", f'<h1 class="title">{_title(n)}</h1><div class="side fr"><span>{board.created(n):%Y.%m.%d %H:%M}</span></div>'
+                            f'<div class="count_container">{board.views(n):,} 12</div><div class="xe_content">{"본문 " * 200}</div>')
+
+
+_ROUTES = (
+    (re.compile(r"^/fmkorea/(\d+)$"), "detail", fmk_detail),
+    (re.compile(r"^/theqoo/hot/(\d+)$"), "detail", tq_detail),
+    (re.compile(r"^/fmkorea/\w+$"), "list", fmk_list),
+    (re.compile(r"^/dcinside/board/lists/$"), "list", dc_list),
+    (re.compile(r"^/theqoo/hot$"), "list", tq_list),
+)
+
+
+class SimServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr, cfg):
+        super().__init__(addr, _Handler)
+        self.cfg, self.board = cfg, Board(cfg)
+        self.rng, self.rng_lock = random.Random(cfg.seed), threading.Lock()
+        self.stats, self.stats_lock = {"list": 0, "detail": 0, "error": 0, "throttled": 0, "missing": 0}, threading.Lock()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def count(self, key):
+        with self.stats_lock: self.stats[key] += 1
+
+    def draw(self):
+        """→ (지연 초, 주입할 status 또는 None)"""
+        cfg = self.cfg
+        with self.rng_lock:
+            delay = cfg.latency_ms / 1000 * math.exp(self.rng.gauss(0, cfg.latency_sigma)) if cfg.latency_ms > 0 else 0
+            r = self.rng.random()
+        status = 500 if r < cfg.error_rate else 429 if r < cfg.error_rate + cfg.throttle_rate else None
+        return delay, status
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"    # keep-alive (크롤러의 커넥션 풀과 같은 조건)
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, headers=()):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        for k, v in headers: self.send_header(k, v)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        srv = self.server
+        delay, status = srv.draw()
+        if delay: time.sleep(delay)
+        if status is not None:
+            srv.count("error" if status == 500 else "throttled")
+            return self._send(status, "<html><body>error</body></html>", [("Retry-After", "1")] if status == 429 else ())
+        u = urlparse(self.path)
+        for pat, kind, render in _ROUTES:
+            m = pat.match(u.path)
+            if not m: continue
+            srv.count(kind)
+            if kind == "detail":
+                n = int(m.group(1)) - ID_BASE
+                if not 0 < n <= srv.board.newest(): break
+                return self._send(200, render(srv.board, n))
+            page = int((parse_qs(u.query).get("page") or ["1"])[0])
+            return self._send(200, render(srv.board, srv.board.page(page), datetime.now().date()))
+        srv.count("missing")
+        self._send(404, "<html><body>not found</body></html>")
+
+
+def start(cfg, port=0):
+    """백그라운드 스레드로 서버 시작 → SimServer (base_url, stats, shutdown())."""
+    srv = SimServer(("127.0.0.1", port), cfg)
+    threading.Thread(target=srv.serve_forever, name="sim-server", daemon=True).start()
+    return srv
+
+
+def add_args(ap):
+    ap.add_argument("--post-rate", type=float, default=30.0, help="분당 새 글 수")
+    ap.add_argument("--pages", type=int, default=50, help="시작 시 목록 페이지 수")
+    ap.add_argument("--per-page", type=int, default=20)
+    ap.add_argument("--latency-ms", type=float, default=50.0, help="응답 지연 중앙값")
+    ap.add_argument("--latency-sigma", type=float, default=0.5, help="로그정규 지연 분포의 sigma")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="500 응답 확률")
+    ap.add_argument("--throttle-rate", type=float, default=0.0, help="429 응답 확률")
+    ap.add_argument("--past-end", choices=PAST_END, default="repeat")
+    ap.add_argument("--seed", type=int, default=1)
+
+def config_from(args):
+    return SimConfig(args.post_rate, args.pages, args.per_page, args.latency_ms, args.latency_sigma,
+                     args.error_rate, args.throttle_rate, args.past_end, args.seed)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--port", type=int, default=8765)
+    add_args(ap)
+    args = ap.parse_args(argv)
+    srv = SimServer(("127.0.0.1", args.port), config_from(args))
+    print(f"모의 서버: {srv.base_url}  (Ctrl+C 로 종료)")
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(srv.stats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""시작 시간 벤치마크 (예산을 넘으면 종료 코드 1).
+
+    python bench/startup_bench.py                        # GUI 모듈 import 시간 (새 프로세스, 중앙값)
+    python bench/startup_bench.py --budget-ms 200 --runs 9
+    python bench/startup_bench.py --exe dist/CommunityCrawler.exe --exe-budget-ms 4000
+
+창이 뜨기 전에 불러오면 안 되는 무거운 모듈(HEAVY)이 import 직후 sys.modules 에 있으면 시간과 관계없이 실패.
+--exe 는 빌드된 실행 파일을 'license' 인자로 띄워 압축 해제 + import + 라이선스 확인까지의 시간을 잰다.
+"""
+import os, sys, json, time, argparse, statistics, subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ("selenium", "webdriver_manager", "cryptography", "lxml", "urllib3", "openpyxl", "pandas", "pyarrow")
+DEFAULT_BUDGET_MS = 150
+
+_PROBE = r"""
+import sys, time, json
+t0 = time.perf_counter()
+import {module}
+ms = (time.perf_counter() - t0) * 1000
+print(json.dumps({{"ms": ms, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module, runs):
+    """새 인터프리터에서 module import 시간(ms) 목록과, 같이 로드된 무거운 모듈."""
+    times, heavy = [], set()
+    code = _PROBE.format(module=module, heavy=HEAVY)
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        times.append(r["ms"]); heavy.update(r["heavy"])
+    return times, sorted(heavy)
+
+
+def measure_exe(exe, runs):
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run([exe, "license"], capture_output=True)   # 라이선스가 없어도 종료까지의 시간만 본다
+        times.append((time.perf_counter() - t0) * 1000)
+    return times
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--module", default="community_crawler_gui_hours")
+    ap.add_argument("--runs", type=int, default=7)
+    ap.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    ap.add_argument("--exe", help="빌드된 실행 파일 경로")
+    ap.add_argument("--exe-budget-ms", type=float, default=5000)
+    args = ap.parse_args(argv)
+
+    ok = True
+    times, heavy = measure_import(args.module, args.runs)
+    med = statistics.median(times)
+    print(f"import {args.module}: 중앙값 {med:.0f}ms (최소 {min(times):.0f} / 최대 {max(times):.0f}, {args.runs}회) | 예산 {args.budget_ms:.0f}ms")
+    if heavy:
+        print(f"  실패: 시작 시 로드된 무거운 모듈 {', '.join(heavy)}"); ok = False
+    if med > args.budget_ms:
+        print(f"  실패: 예산 초과 (+{med - args.budget_ms:.0f}ms)"); ok = False
+
+    if args.exe:
+        times = measure_exe(args.exe, max(1, args.runs // 2))
+        med = statistics.median(times)
+        print(f"{os.path.basename(args.exe)} license: 중앙값 {med:.0f}ms | 예산 {args.exe_budget_ms:.0f}ms")
+        if med > args.exe_budget_ms:
+            print(f"  실패: 예산 초과 (+{med - args.exe_budget_ms:.0f}ms)"); ok = False
+
+    print("OK" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,144 +1,28 @@
-import os, re, sys, time, threading, random, json, base64, platform, uuid
+import os, sys, time, queue, threading
 from datetime import datetime, timedelta
-from urllib.parse import urlparse, urljoin, urlunparse, urlencode, parse_qs
-import pandas as pd
+from urllib.parse import urlparse
 
 # GUI
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
-# Excel 워터마킹
-from openpyxl import load_workbook
-
-# Selenium
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-
-# RSA 공개키 검증
-try:
-    from cryptography.hazmat.primitives import serialization, hashes
-    from cryptography.hazmat.primitives.asymmetric import padding
-except Exception:
-    raise RuntimeError("필수 모듈 'cryptography'가 없습니다. 설치:  pip install cryptography")
-
-APP_TITLE = "커뮤니티 크롤러 (오프라인 라이선스 + 워터마킹)"
-USER_HOME = os.path.expanduser("~")
-DEFAULT_DESKTOP = os.path.join(USER_HOME, "Desktop")
-APP_DIR = os.path.join(os.getenv("APPDATA") or USER_HOME, "CommunityCrawler")
-LICENSE_PATH = os.path.join(APP_DIR, "license.lic")
-# exe(또는 스크립트)와 같은 폴더에 있는 라이선스도 지원
-EXE_DIR = os.path.dirname(os.path.abspath(sys.executable if getattr(sys, "frozen", False) else __file__))
-PORTABLE_LICENSE = os.path.join(EXE_DIR, "license.lic")
-
-# 내부 안전 한도
-MAX_PAGES_SOFT   = 50
-STALE_PAGE_LIMIT = 3
-
-# ====== [중요] 공개키를 여기에 붙여주세요 ======
-PUBLIC_PEM = b"""-----BEGIN PUBLIC KEY-----
-MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEArwh9qGLUP3alVE/keAHz
-dV53lBIEVpzzuvTpi/EPXqufIXdjfGupZbpF8M7yUGtdsD8WGpW27BKuR4FQQmPO
-SNp6lIPwKlTvn46Y3R/nHFE9s0WazUyWIa7mkA0DbMhTihP6x7Lq2Y0dmEZUTJm0
-mKEzG+YF6RwOEmctHG05YqyK7xZEzSNNXK2m3hSCptf4romsrty5Hh64vsZ1nR4Z
-rNc3zdmMO4MZFWlccDQRpgvDmTj/+IqbQnsfMdPy8FoW8Wm/zPhKQQ22J1LXirnX
-5NoWhclvGNy2i4llOP26cNrvK+s5juGKJGhWe698LnrQZLMtzT27px/oqS7n14Ya
-zwIDAQAB
------END PUBLIC KEY-----
-"""
-# ==============================================
-
-def ts():
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-def ensure_dir_for_file(path: str):
-    d = os.path.dirname(os.path.abspath(path))
-    if d: os.makedirs(d, exist_ok=True)
-
-def default_xlsx_path():
-    return os.path.join(DEFAULT_DESKTOP, f"크롤링_결과_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
-
-def to_int_or_none(text):
-    try: return int(re.sub(r"[^\d]", "", str(text)))
-    except Exception: return None
-
-def add_or_replace_query_param(url: str, key: str, value) -> str:
-    parts = list(urlparse(url))
-    q = parse_qs(parts[4], keep_blank_values=True)
-    q[key] = [str(value)]
-    parts[4] = urlencode(q, doseq=True)
-    return urlunparse(parts)
-
-def rsleep(min_s=0.1, max_s=0.5):
-    time.sleep(random.uniform(min_s, max_s))
-
-# ---------------- 라이선스(오프라인, 공개키 서명) ----------------
-def machine_id():
-    try:
-        if platform.system() == "Windows":
-            import winreg
-            k = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Cryptography")
-            v, _ = winreg.QueryValueEx(k, "MachineGuid")
-            return v
-        elif platform.system() == "Darwin":
-            import subprocess
-            out = subprocess.check_output(["ioreg","-rd1","-c","IOPlatformExpertDevice"]).decode(errors="ignore")
-            return out.split('IOPlatformUUID" = "')[1].split('"')[0]
-        else:
-            return open("/etc/machine-id").read().strip()
-    except Exception:
-        return str(uuid.getnode())
-
-def b64u_decode(s: str) -> bytes:
-    # urlsafe padding 보정
-    pad = "=" * (-len(s) % 4)
-    return base64.urlsafe_b64decode(s + pad)
-
-def verify_license_text(lic_text: str):
-    """ lic_text(json): {"payload": b64(json), "sig": b64(signature)} """
-    try:
-        lic = json.loads(lic_text)
-        payload_json = b64u_decode(lic["payload"])
-        payload = json.loads(payload_json)
-        sig = b64u_decode(lic["sig"])
-
-        pub = serialization.load_pem_public_key(PUBLIC_PEM)
-        pub.verify(sig, payload_json, padding.PKCS1v15(), hashes.SHA256())
-
-        # 기기락 + 만료 체크 (로컬 시간 기준)
-        dev = payload.get("dev") or ""
-        exp = payload.get("exp") or ""
-        user = payload.get("user") or ""
-
-        if dev and dev != machine_id():
-            return False, "등록된 PC가 아닙니다.", None
-        if exp:
-            if datetime.now().date() > datetime.strptime(exp, "%Y-%m-%d").date():
-                return False, "라이선스가 만료되었습니다.", None
-
-        return True, "", payload  # payload: {"user","dev","exp",...}
-    except Exception as e:
-        return False, f"라이선스 검증 실패: {e}", None
-
-def load_license_from_disk():
-    for path in (LICENSE_PATH, PORTABLE_LICENSE):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return f.read()
-        except Exception:
-            continue
-    return None
-
-def save_license_to_disk(text: str):
-    os.makedirs(APP_DIR, exist_ok=True)
-    with open(LICENSE_PATH, "w", encoding="utf-8") as f:
-        f.write(text)
-
+# 크롤링 핵심 (tkinter 없이도 쓰는 부분)
+from crawler_core import (
+    APP_TITLE, APP_DIR, DEFAULT_DESKTOP, DETAIL_WORKERS, ts, default_xlsx_path,
+    verify_license_text, load_license_from_disk, save_license_to_disk,
+    make_driver_pool, open_post_index, run_single, run_batch, summary_path,
+)
+from crawler_limits import Limits
+from crawler_progress import PROGRESS, describe
+
+# 로그: 크롤러 스레드는 큐에 넣기만 하고, 화면 갱신은 메인 루프 타이머가 모아서 한 번에
+PUMP_MS    = 150     # 큐 비우는 주기
+PUMP_BATCH = 2000    # 한 번에 꺼내는 최대 메시지 수 (나머지는 다음 주기)
+LOG_LINES  = 1500    # 화면에 남기는 줄 수 (전체는 로그 파일에)
+LOG_DIR    = os.path.join(APP_DIR, "logs")
+CLOSE_WAIT_S = 60    # 창을 닫을 때 수집 스레드가 모은 데까지 저장하기를 기다리는 최대 시간
+
+# ---------------- 라이선스 선택(대화상자) ----------------
 def select_and_verify_license(parent) -> dict | None:
     path = filedialog.askopenfilename(parent=parent, title="라이선스 파일(.lic) 선택",
                                       filetypes=[("License file","*.lic"),("All files","*.*")])
@@ -161,361 +45,12 @@ def ensure_license(parent) -> dict | None:
     # 2) 파일 선택 유도
     return select_and_verify_license(parent)
 
-# ---------------- 워터마킹(엑셀 숨김 시트) ----------------
-def watermark_excel(path: str, payload: dict | None):
-    if not payload: return
-    try:
-        wb = load_workbook(path)
-        ws = wb.create_sheet("_meta")
-        ws.sheet_state = "hidden"
-        ws["A1"], ws["B1"] = "user",   payload.get("user","")
-        ws["A2"], ws["B2"] = "device", payload.get("dev","")
-        ws["A3"], ws["B3"] = "exp",    payload.get("exp","")
-        wb.save(path)
-    except Exception as e:
-        # 워터마크 실패는 치명적이지 않으므로 로그만
-        print("워터마크 실패:", e)
-
-# ---------------- Selenium 공통 ----------------
-def initialize_driver(show_browser: bool):
-    os.environ.setdefault("WDM_LOG_LEVEL", "0")
-    options = Options()
-    if not show_browser:
-        options.add_argument("--headless=new")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    try:
-        driver_path = ChromeDriverManager().install()
-        service = Service(driver_path)
-    except Exception as e:
-        base_dir = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
-        local_driver = os.path.join(base_dir, "chromedriver.exe")
-        if not os.path.exists(local_driver):
-            raise RuntimeError(
-                "ChromeDriver 자동 설치 실패: {}\n"
-                "→ 네트워크/방화벽 확인 또는 chromedriver.exe를 실행 폴더에 두세요."
-                .format(e)
-            )
-        service = Service(local_driver)
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.set_page_load_timeout(25)
-    return driver
-
-# ---------------- 날짜 파싱 유틸 ----------------
-_DOT_DT_RE = re.compile(r"^(\d{4})\.(\d{2})\.(\d{2})\s+(\d{2}):(\d{2})$")
-def parse_dt_dot(text: str):
-    if not text: return None
-    m = _DOT_DT_RE.match(text.strip())
-    if not m: return None
-    y,M,d,h,mi = map(int, m.groups())
-    try: return datetime(y,M,d,h,mi)
-    except ValueError: return None
-
-_HHMM_RE = re.compile(r"^(\d{1,2}):(\d{2})$")
-def parse_dt_hhmm_today(text: str):
-    if not text: return None
-    m = _HHMM_RE.match(text.strip())
-    if not m: return None
-    h,mi = map(int, m.groups())
-    now = datetime.now()
-    try: return datetime(now.year, now.month, now.day, h, mi)
-    except ValueError: return None
-
-def parse_dt_dc_flexible(text: str):
-    if not text: return None
-    s = text.strip()
-    m = re.match(r"^(\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2})(?::(\d{2}))?$", s)
-    if m:
-        y,M,d,h,mi,sec = m.groups()
-        try: return datetime(int(y),int(M),int(d),int(h),int(mi),int(sec or "0"))
-        except ValueError: return None
-    return parse_dt_hhmm_today(s)
-
-# ---------------- FMKorea ----------------
-FM_LINK_PATTERNS = [
-    re.compile(r"/\d{5,}$"),
-    re.compile(r"[?&]document_srl=\d+"),
-]
-
-def fmk_collect_links_by_user_selector(driver):
-    sel = '.pc_voted_count.pc_voted_count_plus.pc_voted_count_short'
-    cand = driver.find_elements(By.CSS_SELECTOR, sel)
-    links, seen = [], set()
-    for el in cand:
-        href = el.get_attribute('href')
-        if href and href not in seen:
-            seen.add(href); links.append(href)
-    return links
-
-def collect_links_fallback_regex(driver):
-    base = driver.current_url
-    links, seen = [], set()
-    for a in driver.find_elements(By.CSS_SELECTOR, "a[href]"):
-        href = a.get_attribute("href")
-        if not href: continue
-        abs_href = urljoin(base, href)
-        if any(p.search(abs_href) for p in FM_LINK_PATTERNS):
-            if abs_href not in seen:
-                seen.add(abs_href); links.append(abs_href)
-    return links
-
-def fmk_get_content(link, driver):
-    driver.get(link); rsleep()
-    try:
-        wait = WebDriverWait(driver, 5)
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".np_18px_span")))
-        poten = driver.find_elements(By.CSS_SELECTOR, "h1.np_18px > span.STAR-BEST_T")
-        title_el = driver.find_elements(By.CSS_SELECTOR, ".np_18px_span")
-        title = (title_el[0].text.strip() if title_el else "제목 없음")
-        if poten and title_el: title = f"포텐: {title}"
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".date.m_no")))
-        date_text = driver.find_element(By.CSS_SELECTOR, ".date.m_no").text.strip()
-        wait.until(EC.presence_of_element_located((By.XPATH, "//span[contains(text(), '조회 수')]/b")))
-        views_text = driver.find_element(By.XPATH, "//span[contains(text(), '조회 수')]/b").text.strip()
-        views = to_int_or_none(views_text)
-    except Exception as e:
-        print("FMK 상세 파싱 오류:", e)
-        title, date_text, views = "제목 없음", "", None
-    return title, date_text, views
-
-def crawl_fmkorea(list_url, cutoff, show_browser, log):
-    rows = []
-    driver = initialize_driver(show_browser)
-    try:
-        page, stale_pages = 1, 0
-        while page <= MAX_PAGES_SOFT:
-            url = add_or_replace_query_param(list_url, "page", page)
-            log(f"[FMK] 목록 page={page} | {url}")
-            driver.get(url); rsleep()
-
-            links = fmk_collect_links_by_user_selector(driver) or collect_links_fallback_regex(driver)
-            log(f"[FMK] 후보 {len(links)}개")
-            if not links:
-                stale_pages += 1
-                if stale_pages >= STALE_PAGE_LIMIT: log("[FMK] 연속 없음 → 종료"); break
-                page += 1; continue
-            stale_pages = 0
-
-            found_old = False
-            for href in links:
-                title, date_text, views = fmk_get_content(href, driver); rsleep()
-                dt = parse_dt_dot(date_text)
-                if not dt:
-                    log(f"[FMK] 날짜 파싱 실패 → 스킵: {date_text} | {href}")
-                    continue
-                rows.append({
-                    "Site":"FMKorea","Title":title,"Date":date_text,
-                    "DateISO": dt.strftime("%Y-%m-%d %H:%M:%S"),
-                    "Views":views, "Link":href
-                })
-                if dt < cutoff: found_old = True
-            if found_old:
-                log("[FMK] 오래된 글 감지 → 이 페이지까지 수집 후 종료"); break
-            page += 1
-    finally:
-        driver.quit()
-    return rows
-
-# ---------------- DCInside ----------------
-def crawl_dcinside(list_url, cutoff, show_browser, log):
-    rows = []
-    driver = initialize_driver(show_browser)
-    log(f"[DC] cutoff = {cutoff:%Y-%m-%d %H:%M:%S}")
-    try:
-        stale_pages = 0
-        for page in range(1, MAX_PAGES_SOFT+1):
-            url = add_or_replace_query_param(list_url, "page", page)
-            log(f"[DC] 목록 page={page} | {url}")
-            driver.get(url); rsleep()
-            base = driver.current_url
-            trs = driver.find_elements(By.CSS_SELECTOR, "tr.ub-content.us-post")
-            log(f"[DC] 행 {len(trs)}")
-            if not trs:
-                stale_pages += 1
-                if stale_pages >= STALE_PAGE_LIMIT: log("[DC] 연속 없음 → 종료"); break
-                continue
-            stale_pages = 0
-            found_recent = False
-            for tr in trs:
-                try:
-                    a = tr.find_element(By.CSS_SELECTOR, "td.gall_tit a[href]")
-                    href = urljoin(base, a.get_attribute("href"))
-                    title = a.text.strip() or (a.get_attribute("title") or "").strip()
-                    d = tr.find_element(By.CSS_SELECTOR, "td.gall_date")
-                    date_text = (d.get_attribute("title") or d.text or "").strip()
-                    dt = parse_dt_dc_flexible(date_text)
-                    v = tr.find_element(By.CSS_SELECTOR, "td.gall_count")
-                    views = to_int_or_none(v.text)
-                    if dt and dt >= cutoff:
-                        rows.append({
-                            "Site":"DCInside","Title":title or "제목 없음",
-                            "Date":date_text,"DateISO":dt.strftime("%Y-%m-%d %H:%M:%S"),
-                            "Views":views,"Link":href
-                        }); found_recent = True
-                except Exception as e:
-                    log(f"[DC] 행 파싱 실패: {e}")
-            if not found_recent:
-                stale_pages += 1
-                if stale_pages >= STALE_PAGE_LIMIT: log("[DC] 최근 글 없음 연속 → 종료"); break
-            else:
-                stale_pages = 0
-    finally:
-        driver.quit()
-    return rows
-
-# ---------------- TheQoo (상세 + 공지 제외 + .side.fr span + 조회수 count_container) ----------------
-_DOT_FULL_RE = re.compile(r"^(\d{4})\.(\d{2})\.(\d{2})\s+(\d{2}):(\d{2})$")
-_DOT_Y2_RE   = re.compile(r"^(\d{2})\.(\d{2})\.(\d{2})$")
-_DOT_MD_RE   = re.compile(r"^(\d{2})\.(\d{2})$")
-def parse_dt_theqoo(text: str):
-    if not text: return None
-    s = text.strip()
-    m = _DOT_FULL_RE.match(s)
-    if m:
-        y,M,d,h,mi = map(int, m.groups())
-        try: return datetime(y,M,d,h,mi)
-        except ValueError: return None
-    m = _DOT_Y2_RE.match(s)   # 24.12.06
-    if m:
-        yy,M,d = map(int, m.groups())
-        y = 2000 + yy
-        try: return datetime(y,M,d,0,0)
-        except ValueError: return None
-    m = _DOT_MD_RE.match(s)   # 08.15
-    if m:
-        M,d = map(int, m.groups()); now=datetime.now()
-        try: return datetime(now.year,M,d,0,0)
-        except ValueError: return None
-    m = _HHMM_RE.match(s)     # 12:39
-    if m:
-        h,mi = map(int, m.groups()); now=datetime.now()
-        try: return datetime(now.year,now.month,now.day,h,mi)
-        except ValueError: return None
-    return None
-
-def theqoo_collect_detail_links(driver):
-    base = driver.current_url
-    links, seen = [], set()
-    title_tds = driver.find_elements(By.CSS_SELECTOR, "td.title")
-    for td in title_tds:
-        try:
-            tr = td.find_element(By.XPATH, "./ancestor::tr[1]")
-            # 공지 제외
-            try:
-                no_strong = tr.find_element(By.CSS_SELECTOR, "td.no strong")
-                if "공지" in (no_strong.text or "").strip():
-                    continue
-            except Exception:
-                pass
-            a = td.find_element(By.CSS_SELECTOR, "a[href]:not(.replyNum)")
-            href = urljoin(base, a.get_attribute("href"))
-            if href not in seen:
-                seen.add(href); links.append(href)
-        except Exception:
-            continue
-    return links
-
-def theqoo_parse_detail(driver, url):
-    driver.get(url); rsleep()
-    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "body")))
-
-    # 제목
-    title = ""
-    for sel in ["h1.title", ".title h1", ".title", "h1", "h2"]:
-        els = driver.find_elements(By.CSS_SELECTOR, sel)
-        if els and els[0].text.strip():
-            title = els[0].text.strip(); break
-    if not title: title = "제목 없음"
-
-    # 날짜(.side.fr span 우선)
-    date_text = ""
-    for sel in [".side.fr span", ".date", ".regdate", ".time", "time[datetime]"]:
-        els = driver.find_elements(By.CSS_SELECTOR, sel)
-        if els:
-            t = (els[0].get_attribute("datetime") or els[0].text or "").strip()
-            if t: date_text = t; break
-    if not date_text:
-        m = re.search(r"\d{4}\.\d{2}\.\d{2}\s+\d{2}:\d{2}", driver.page_source)
-        if m: date_text = m.group(0)
-
-    # 조회수: .count_container 텍스트에서 첫 숫자
-    views = None
-    try:
-        cnt = driver.find_element(By.CSS_SELECTOR, ".count_container")
-        raw = (cnt.get_attribute("innerText") or cnt.text or "").strip()
-        nums = re.findall(r"\d{1,3}(?:,\d{3})*|\d+", raw)
-        if nums:
-            views = to_int_or_none(nums[0])
-    except NoSuchElementException:
-        pass
-    if views is None:
-        # 백업: 페이지 전체 숫자에서 최대값 추정(원치 않으면 제거)
-        all_nums = re.findall(r"\d{1,3}(?:,\d{3})*|\d+", driver.page_source)
-        if all_nums:
-            views = max((to_int_or_none(n) for n in all_nums), default=None)
-
-    # 날짜 파싱
-    dt = parse_dt_dot(date_text) or parse_dt_theqoo(date_text)
-
-    return {
-        "Site": "TheQoo",
-        "Title": title,
-        "Date": date_text,
-        "DateISO": dt.strftime("%Y-%m-%d %H:%M:%S") if dt else "",
-        "Views": views,
-        "Link": url,
-        "_dt": dt
-    }
-
-def crawl_theqoo(list_url, cutoff, show_browser, log):
-    rows = []
-    driver = initialize_driver(show_browser)
-    try:
-        page, stale_pages = 1, 0
-        while page <= MAX_PAGES_SOFT:
-            url = add_or_replace_query_param(list_url, "page", page)
-            log(f"[TQ] 목록 page={page} | {url}")
-            driver.get(url); rsleep()
-
-            links = theqoo_collect_detail_links(driver)
-            log(f"[TQ] 상세 후보(공지 제외) {len(links)}개")
-            if not links:
-                stale_pages += 1
-                if stale_pages >= STALE_PAGE_LIMIT: log("[TQ] 연속 없음 → 종료"); break
-                page += 1; continue
-            stale_pages = 0
-
-            found_old = False
-            for i, href in enumerate(links, 1):
-                try:
-                    post = theqoo_parse_detail(driver, href); rsleep()
-                    dt = post["_dt"]
-                    rows.append({
-                        "Site": post["Site"], "Title": post["Title"],
-                        "Date": post["Date"], "DateISO": post["DateISO"],
-                        "Views": post["Views"], "Link": post["Link"]
-                    })
-                    if dt and dt < cutoff: found_old = True
-                    if i % 10 == 0 or i == len(links):
-                        log(f"[TQ] 진행 {i}/{len(links)} (누적 {len(rows)})")
-                except Exception as e:
-                    log(f"[TQ] 상세 실패: {e}")
-
-            if found_old:
-                log("[TQ] 오래된 글 감지 → 이 페이지까지 수집 후 종료"); break
-            page += 1
-    finally:
-        driver.quit()
-    return rows
-
 # ---------------- GUI ----------------
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title(APP_TITLE)
-        self.geometry("880x700")
+        self.geometry("880x780")
         self.resizable(False, False)
 
         self.var_comm    = tk.StringVar(value="FMKorea")   # FMKorea / DCInside / TheQoo
@@ -524,10 +59,22 @@ class App(tk.Tk):
         self.var_hours   = tk.IntVar(value=0)
         self.var_out     = tk.StringVar(value=default_xlsx_path())
         self.var_show    = tk.BooleanVar(value=False)
+        self.var_workers = tk.IntVar(value=DETAIL_WORKERS)
+        self.var_incr    = tk.BooleanVar(value=True)
+        self.var_resume  = tk.BooleanVar(value=False)
 
         self.license_payload = None  # {"user","dev","exp",...}
+        self._q = queue.SimpleQueue()   # 로그 문자열 또는 메인 스레드에서 실행할 함수
+        self._log_file = self._open_log_file()
+        # 실행 사이에 Chrome 을 살려 두는 풀 (창을 닫을 때 정리)
+        self.driver_pool = make_driver_pool(log=self.log)
+        self.post_index  = None   # 증분 수집 인덱스 (처음 실행할 때 연다)
+        self.limits      = Limits()   # 실행마다 새로 ("중지" 버튼이 여기 취소 이벤트를 켠다)
+        self.worker      = None       # 수집 스레드 (닫을 때 저장이 끝나기를 기다린다)
+        self._closing    = None       # 닫기 대기 마감 (time.monotonic)
 
         self._build_ui()
+        self.after(PUMP_MS, self._pump)
         # 시작 시 라이선스 확인(없으면 선택)
         self.after(200, self._check_license_on_start)
 
@@ -554,6 +101,10 @@ class App(tk.Tk):
         ttk.Spinbox(row3, from_=0, to=365, textvariable=self.var_days, width=5).grid(row=0, column=1, sticky="w")
         ttk.Spinbox(row3, from_=0, to=23,  textvariable=self.var_hours, width=5).grid(row=0, column=3, sticky="w", padx=(0,12))
         ttk.Checkbutton(row3, text="크롤링 화면 보기(브라우저 표시)", variable=self.var_show).grid(row=0, column=5, sticky="w")
+        ttk.Label(row3, text="동시 작업").grid(row=0, column=6, sticky="w", padx=(12,6))
+        ttk.Spinbox(row3, from_=1, to=16, textvariable=self.var_workers, width=4).grid(row=0, column=7, sticky="w")
+        ttk.Checkbutton(row3, text="증분 수집", variable=self.var_incr).grid(row=0, column=8, sticky="w", padx=(12,0))
+        ttk.Checkbutton(row3, text="중단된 작업 이어서", variable=self.var_resume).grid(row=0, column=9, sticky="w", padx=(12,0))
 
         ttk.Label(root, text="4) 엑셀 저장 경로").grid(row=6, column=0, sticky="w", **pad)
         row_out = ttk.Frame(root); row_out.grid(row=7, column=0, columnspan=4, sticky="w", **pad)
@@ -563,29 +114,110 @@ class App(tk.Tk):
         btns = ttk.Frame(root); btns.grid(row=8, column=0, columnspan=4, sticky="w", **pad)
         ttk.Button(btns, text="라이선스 불러오기", command=self.on_license_load).grid(row=0, column=0, padx=(0,8))
         ttk.Button(btns, text="실행", command=self.on_run).grid(row=0, column=1, padx=(0,8))
-        ttk.Button(btns, text="종료", command=self.destroy).grid(row=0, column=2)
-
-        ttk.Label(root, text="로그").grid(row=9, column=0, sticky="w", **pad)
-        self.txt = tk.Text(root, height=18, width=114)
-        self.txt.grid(row=10, column=0, columnspan=4, sticky="w", padx=8, pady=(0,8))
+        ttk.Button(btns, text="작업 파일 실행…", command=self.on_run_batch).grid(row=0, column=2, padx=(0,8))
+        ttk.Button(btns, text="중지", command=self.on_stop).grid(row=0, column=3, padx=(0,8))
+        ttk.Button(btns, text="종료", command=self.destroy).grid(row=0, column=4)
+
+        # 진행 상황: 게시판마다 한 줄 (페이지 / 추정 cutoff 페이지, 속도, 남은 시간)
+        ttk.Label(root, text="진행").grid(row=9, column=0, sticky="w", **pad)
+        self.bar = ttk.Progressbar(root, length=840, maximum=1.0)
+        self.bar.grid(row=10, column=0, columnspan=4, sticky="w", padx=8)
+        self.lbl_progress = ttk.Label(root, text="대기 중", foreground="#444", justify="left")
+        self.lbl_progress.grid(row=11, column=0, columnspan=4, sticky="w", padx=8, pady=(2,0))
+
+        ttk.Label(root, text="로그").grid(row=12, column=0, sticky="w", **pad)
+        self.txt = tk.Text(root, height=14, width=114)
+        self.txt.grid(row=13, column=0, columnspan=4, sticky="w", padx=8, pady=(0,8))
         self.txt.configure(state="disabled")
 
-        ttk.Label(root, text="원초적인사이트 데이터수집 프로그램").grid(row=11, column=0, columnspan=4, sticky="w", padx=8, pady=(0,8))
+        ttk.Label(root, text="원초적인사이트 데이터수집 프로그램").grid(row=14, column=0, columnspan=4, sticky="w", padx=8, pady=(0,8))
 
     def pick_out_path(self):
         path = filedialog.asksaveasfilename(
             title="엑셀 저장 경로", defaultextension=".xlsx",
-            filetypes=[("Excel 파일","*.xlsx"),("모든 파일","*.*")],
+            filetypes=[("Excel 파일","*.xlsx"),("CSV","*.csv"),("JSON Lines","*.jsonl"),
+                       ("Parquet","*.parquet"),("모든 파일","*.*")],
             initialfile=os.path.basename(self.var_out.get() or default_xlsx_path()),
             initialdir=os.path.dirname(self.var_out.get() or default_xlsx_path()) or DEFAULT_DESKTOP
         )
         if path: self.var_out.set(path)
 
+    def on_stop(self):
+        """진행 중인 요청만 마치고 모은 데까지 저장 (일괄 실행은 아직 시작하지 않은 작업을 건너뛴다)."""
+        if self.limits.cancel.is_set(): return
+        self.limits.stop()
+        self.log("중지 요청 → 진행 중인 요청을 마치고 모은 데까지 저장합니다.")
+
+    def destroy(self):
+        """수집 중이면 중지하고, 모은 데까지 저장할 때까지(최대 CLOSE_WAIT_S) 창을 닫지 않고 기다린다."""
+        self.limits.stop()
+        if self.worker is not None and self.worker.is_alive():
+            if self._closing is None:
+                self._closing = time.monotonic() + CLOSE_WAIT_S
+                self.log("종료 요청 → 진행 중인 요청을 마치고 모은 데까지 저장한 뒤 닫습니다.")
+            if time.monotonic() < self._closing:
+                self.after(PUMP_MS, self.destroy); return
+            self.log(f"저장이 {CLOSE_WAIT_S}초 안에 끝나지 않아 그대로 닫습니다.")
+        try: self.driver_pool.close()
+        except Exception: pass
+        if self.post_index is not None:
+            try: self.post_index.close()
+            except Exception: pass
+        self._pump_log()
+        if self._log_file is not None: self._log_file.close()
+        super().destroy()
+
+    # ---- 로그 / 진행 (어느 스레드에서 불러도 됨 → 실제 화면 갱신은 _pump) ----
     def log(self, msg: str):
-        self.txt.configure(state="normal")
-        self.txt.insert("end", f"{ts()} | {msg}\n")
-        self.txt.see("end"); self.txt.configure(state="disabled")
-        self.update_idletasks()
+        self._q.put(f"{ts()} | {msg}")
+
+    def ui(self, fn, *args):
+        """메인 스레드에서 실행 (메시지 상자 등 tkinter 호출은 크롤러 스레드에서 하면 안 된다)."""
+        self._q.put(lambda: fn(*args))
+
+    def _open_log_file(self):
+        try:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            return open(os.path.join(LOG_DIR, f"crawler_{datetime.now():%Y%m%d_%H%M%S}.log"), "a", encoding="utf-8")
+        except OSError:
+            return None
+
+    def _pump(self):
+        try:
+            self._pump_log()
+            self._show_progress()
+        finally:
+            self.after(PUMP_MS, self._pump)
+
+    def _pump_log(self):
+        lines, calls = [], []
+        for _ in range(PUMP_BATCH):
+            try: item = self._q.get_nowait()
+            except queue.Empty: break
+            (calls if callable(item) else lines).append(item)
+        if lines:
+            text = "\n".join(lines) + "\n"
+            if self._log_file is not None:
+                try: self._log_file.write(text); self._log_file.flush()
+                except OSError: pass
+            self.txt.configure(state="normal")
+            self.txt.insert("end", text)
+            # 화면은 마지막 LOG_LINES 줄만 (Text 위젯이 끝없이 커지면 삽입/스크롤이 느려진다)
+            extra = int(self.txt.index("end-1c").split(".")[0]) - LOG_LINES
+            if extra > 0: self.txt.delete("1.0", f"{extra + 1}.0")
+            self.txt.see("end"); self.txt.configure(state="disabled")
+        for fn in calls: fn()
+
+    def _show_progress(self):
+        snaps = PROGRESS.snapshot()
+        if not snaps: return
+        self.lbl_progress.configure(text="\n".join(describe(s) for s in snaps[-4:]))
+        # 막대: 진행 중인 게시판들의 (현재 페이지 / 추정 페이지) 합
+        live = [s for s in snaps if not s["done"] and s["est_page"]]
+        if live:
+            self.bar.configure(value=min(1.0, sum(s["page"] for s in live) / sum(s["est_page"] for s in live)))
+        elif all(s["done"] for s in snaps):
+            self.bar.configure(value=1.0)
 
     # ---- 라이선스 처리 ----
     def _check_license_on_start(self):
@@ -627,6 +259,9 @@ class App(tk.Tk):
         days  = int(self.var_days.get()); hours = int(self.var_hours.get())
         outp  = self.var_out.get().strip()
         show  = bool(self.var_show.get())
+        workers = max(1, int(self.var_workers.get()))
+        incr  = bool(self.var_incr.get())
+        resume = bool(self.var_resume.get())
 
         if not url:
             messagebox.showwarning("입력 확인","목록 URL을 입력하세요."); return
@@ -647,47 +282,71 @@ class App(tk.Tk):
             messagebox.showerror("오류","선택과 URL이 일치하지 않습니다(TheQoo)."); return
 
         cutoff = datetime.now() - timedelta(hours=total_hours)
-        self.log(f"실행: {comm} | 최근 {days}일 {hours}시간 (총 {total_hours}시간) | 화면보기={show} | cutoff={cutoff:%Y-%m-%d %H:%M}")
-        threading.Thread(target=self._crawl_and_save_safe,
-                         args=(comm, url, cutoff, outp, show), daemon=True).start()
+        PROGRESS.clear(); self.bar.configure(value=0)
+        self.limits = Limits()
+        self.log(f"실행: {comm} | 최근 {days}일 {hours}시간 (총 {total_hours}시간) | 화면보기={show} | 동시작업={workers} | cutoff={cutoff:%Y-%m-%d %H:%M}")
+        self.worker = threading.Thread(target=self._crawl_and_save_safe,
+                                       args=(comm, url, cutoff, outp, show, workers, incr, resume, self.limits), daemon=True)
+        self.worker.start()
+
+    def on_run_batch(self):
+        if not self._require_license(): return
+        path = filedialog.askopenfilename(parent=self, title="작업 파일(.json) 선택",
+                                          filetypes=[("Job file","*.json"),("All files","*.*")])
+        if not path: return
+        outp = self.var_out.get().strip() or default_xlsx_path()
+        self.var_out.set(outp)
+        show, incr = bool(self.var_show.get()), bool(self.var_incr.get())
+        PROGRESS.clear(); self.bar.configure(value=0)
+        self.limits = Limits()
+        self.log(f"일괄 실행: {path} → {outp}")
+        self.worker = threading.Thread(target=self._batch_safe, args=(path, outp, show, incr, self.limits), daemon=True)
+        self.worker.start()
+
+    def _batch_safe(self, path, outp, show, incr, limits):
+        try:
+            index = None
+            if incr:
+                if self.post_index is None: self.post_index = open_post_index()
+                index = self.post_index
+            summaries, total = run_batch(path, outp, show, self.log, self.license_payload, self.driver_pool, index,
+                                         limits)
+            failed = [s for s in summaries if s["status"] == "error"]
+            partial = [s for s in summaries if s["status"] == "partial"]
+            for s in summaries:
+                self.log(f"  - {s['name']}: {s['status']} {s['rows']}건 {s['seconds']}초 {s['error']}".rstrip())
+            self.log(f"일괄 완료! 저장: {outp} | 총 {total}건 | 실패 {len(failed)}개 | 일부만 {len(partial)}개"
+                     f" | 요약: {summary_path(outp)}")
+            self.ui(messagebox.showinfo, "완료",
+                    f"일괄 실행 완료\n{outp}\n총 {total}건 (실패 {len(failed)}개, 일부만 {len(partial)}개)")
+        except Exception as e:
+            self.log(f"오류: {e}")
+            self.ui(messagebox.showerror, "오류", str(e))
 
-    def _crawl_and_save_safe(self, comm, url, cutoff, outp, show):
+    def _crawl_and_save_safe(self, comm, url, cutoff, outp, show, workers=DETAIL_WORKERS, incr=True, resume=False,
+                             limits=None):
         try:
-            if comm == "FMKorea":
-                rows = crawl_fmkorea(url, cutoff, show, self.log)
-            elif comm == "DCInside":
-                rows = crawl_dcinside(url, cutoff, show, self.log)
-            else:
-                rows = crawl_theqoo(url, cutoff, show, self.log)
-
-            if not rows:
-                self.log("수집 결과가 비었습니다."); messagebox.showinfo("완료","수집 결과가 없습니다."); return
-
-            # 엑셀 저장 (DateISO 제외)
-            df = pd.DataFrame(rows)
-            want = [c for c in ["Site","Title","Date","Views","Link"] if c in df.columns]
-            df = df[want]
-            ensure_dir_for_file(outp); df.to_excel(outp, index=False)
-
-            # 워터마킹
-            watermark_excel(outp, self.license_payload)
-
-            # 수집된 시각 범위 로그
-            try:
-                dts = [datetime.strptime(r["DateISO"], "%Y-%m-%d %H:%M:%S")
-                       for r in rows if r.get("DateISO")]
-                if dts:
-                    self.log(f"수집된 시각 범위: {min(dts):%Y-%m-%d %H:%M:%S} ~ {max(dts):%Y-%m-%d %H:%M:%S}")
-            except Exception:
-                pass
-
-            self.log(f"완료! 저장: {outp} | 수집 {len(df)}건")
-            messagebox.showinfo("완료", f"저장 완료\n{outp}\n총 {len(df)}건")
+            index = None
+            if incr:
+                if self.post_index is None: self.post_index = open_post_index()
+                index = self.post_index
+            n = run_single(comm, url, cutoff, outp, show, self.log, workers, self.license_payload,
+                           self.driver_pool, index, resume, limits)
+            if not n:
+                self.log("수집 결과가 비었습니다."); self.ui(messagebox.showinfo, "완료", "수집 결과가 없습니다."); return
+            self.log(f"완료! 저장: {outp} | 수집 {n}건")
+            note = f"\n일부만 저장 ({limits.reason}) — '중단된 작업 이어서'로 계속할 수 있습니다." \
+                if limits is not None and limits.reason else ""
+            self.ui(messagebox.showinfo, "완료", f"저장 완료\n{outp}\n총 {n}건{note}")
         except Exception as e:
             self.log(f"오류: {e}")
-            messagebox.showerror("오류", str(e))
+            self.ui(messagebox.showerror, "오류", str(e))
 
 
 if __name__ == "__main__":
+    # 인자가 있으면 화면 없이 CLI 로 실행 (예: CommunityCrawler.exe run --site DCInside ...)
+    if len(sys.argv) > 1:
+        from crawler_cli import main
+        sys.exit(main())
     app = App()
     app.mainloop()
@@ -0,0 +1,128 @@
+"""여러 게시판을 한 번에: 작업 파일(JSON) 읽기 + 전체 워커 예산/호스트별 상한을 지키는 동시 실행기.
+
+작업 파일 예시
+    {
+      "budget": 8, "host_cap": 2,
+      "jobs": [
+        {"site": "DCInside", "url": "https://gall.dcinside.com/board/lists/?id=...", "hours": 6},
+        {"site": "FMKorea",  "url": "https://www.fmkorea.com/best", "days": 1, "workers": 4, "name": "fmk-best",
+         "max_minutes": 20, "max_pages": 50, "max_rows": 5000}
+      ]
+    }
+최상위가 리스트여도 된다 (jobs 만 있는 경우). max_* 는 작업별 한도 (crawler_limits, 없으면 실행 전체 한도,
+0/null 이면 한도 없음).
+"""
+import json, time, threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs
+
+SITE_HOSTS = {"FMKorea": "fmkorea.com", "DCInside": "dcinside.com", "TheQoo": "theqoo.net"}
+DEFAULT_BUDGET = 8
+BATCH_HOST_CAP = 2      # 같은 호스트에서 동시에 도는 작업 수 (요청 수 상한은 crawler_pool.DEFAULT_HOST_CAP)
+
+
+class Job:
+    def __init__(self, site, url, hours, workers=None, name=None, limits=None):
+        self.site, self.url, self.hours, self.workers = site, url, hours, workers
+        self.limits = limits or {}     # Limits.fresh(**limits): minutes/pages/rows
+        u = urlparse(url)
+        gid = parse_qs(u.query).get("id")   # DC 갤러리 id
+        self.name = name or f"{site}:{gid[0] if gid else (u.path.strip('/') or u.netloc)}"
+
+    @property
+    def host(self):
+        return urlparse(self.url).netloc.lower()
+
+
+def load_jobs(path):
+    """→ (jobs, 설정 dict). 형식 오류는 ValueError (몇 번째 작업인지 포함)."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    conf = data if isinstance(data, dict) else {"jobs": data}
+    jobs = []
+    for i, e in enumerate(conf.get("jobs") or [], 1):
+        site, url = (e.get("site") or "").strip(), (e.get("url") or "").strip()
+        if site not in SITE_HOSTS:
+            raise ValueError(f"작업 {i}: 알 수 없는 사이트 '{site}' (FMKorea/DCInside/TheQoo)")
+        if SITE_HOSTS[site] not in urlparse(url).netloc.lower():
+            raise ValueError(f"작업 {i}: 사이트와 URL이 일치하지 않습니다 ({site}) | {url}")
+        hours = int(e.get("days", 0)) * 24 + int(e.get("hours", 0))
+        if hours < 1:
+            raise ValueError(f"작업 {i}: 기간이 1시간 이상이어야 합니다.")
+        workers = e.get("workers")
+        try:
+            # 0 / null 은 그 항목 한도 없음 (실행 전체 한도도 쓰지 않는다), 키가 없으면 실행 전체 한도
+            limits = {k: int(e[f"max_{k}"] or 0) for k in ("minutes", "pages", "rows") if f"max_{k}" in e}
+        except (TypeError, ValueError):
+            raise ValueError(f"작업 {i}: max_minutes/max_pages/max_rows 는 정수여야 합니다.")
+        jobs.append(Job(site, url, hours, int(workers) if workers else None, e.get("name"), limits))
+    if not jobs:
+        raise ValueError("작업 파일에 작업이 없습니다.")
+    return jobs, conf
+
+
+class WorkerBudget:
+    """전체 워커 예산. 작업 하나가 자기 워커 수만큼 한꺼번에 가져간다."""
+    def __init__(self, total):
+        self.total = self.free = max(1, int(total))
+        self._cv = threading.Condition()
+
+    def acquire(self, n):
+        n = min(max(1, n), self.total)
+        with self._cv:
+            self._cv.wait_for(lambda: self.free >= n)
+            self.free -= n
+        return n
+
+    def release(self, n):
+        with self._cv:
+            self.free += n
+            self._cv.notify_all()
+
+
+class BatchRunner:
+    """run_job(job, workers, log) → 수집 건수 또는 (건수, 일부만 수집한 사유).
+    작업마다 요약 dict 를 돌려준다 (입력 순서 유지). 일부만 수집한 작업은 status "partial", 사유는 error 에."""
+    def __init__(self, run_job, budget=DEFAULT_BUDGET, host_cap=BATCH_HOST_CAP, default_workers=4, log=print):
+        self.run_job, self.log = run_job, log
+        self.budget = WorkerBudget(budget)
+        self.host_cap, self.default_workers = max(1, int(host_cap)), default_workers
+        self._hosts, self._lock = {}, threading.Lock()
+
+    def _host_sem(self, host):
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = threading.BoundedSemaphore(self.host_cap)
+            return self._hosts[host]
+
+    def _one(self, job):
+        summary = {"name": job.name, "site": job.site, "url": job.url, "hours": job.hours,
+                   "status": "ok", "rows": 0, "seconds": 0.0, "error": ""}
+        log = lambda msg: self.log(f"[{job.name}] {msg}")
+        with self._host_sem(job.host):
+            # 목록 1 + 상세 워커 수만큼 예산 사용
+            n = self.budget.acquire((job.workers or self.default_workers) + 1)
+            t0 = time.perf_counter()
+            try:
+                res = self.run_job(job, max(1, n - 1), log)
+                rows, reason = res if isinstance(res, tuple) else (res, None)
+                summary["rows"] = rows or 0
+                if reason: summary["status"], summary["error"] = "partial", reason
+            except Exception as e:
+                summary["status"], summary["error"] = "error", str(e)
+                log(f"오류: {e}")
+            finally:
+                summary["seconds"] = round(time.perf_counter() - t0, 1)
+                self.budget.release(n)
+        log(f"종료: {summary['status']} | {summary['rows']}건 | {summary['seconds']}초")
+        return summary
+
+    def run(self, jobs):
+        with ThreadPoolExecutor(max_workers=max(1, min(len(jobs), self.budget.total)),
+                                thread_name_prefix="job") as ex:
+            return list(ex.map(self._one, jobs))
+
+
+def write_summary(path, summaries):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(summaries, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,265 @@
+"""화면 없이 실행: 한 번 수집(run), 작업 파일(batch), 주기 실행(daemon), 라이선스 확인(license).
+
+    python crawler_cli.py run    --site DCInside --url "https://gall.dcinside.com/board/lists/?id=..." --hours 6 --out out.csv
+    python crawler_cli.py batch  jobs.json --out merged.xlsx
+    python crawler_cli.py daemon --site FMKorea --url https://www.fmkorea.com/best --hours 6 --every 15m --out-dir ./out
+    python crawler_cli.py daemon --jobs jobs.json --every 1h --out-dir ./out
+    python crawler_cli.py license --install license.lic
+    python crawler_cli.py run ... --profile run.prof --prom-file /var/lib/node_exporter/crawler.prom
+    python crawler_cli.py run ... --max-minutes 30 --max-rows 5000      # 한도에 닿으면 모은 데까지 저장 (종료 코드 3)
+
+tkinter 를 불러오지 않는다 (디스플레이 없는 리눅스 서버용). 라이선스는 --license → 환경변수
+COMMUNITY_CRAWLER_LICENSE → 저장된 라이선스 순서로 찾는다.
+run/batch 는 Ctrl+C(SIGINT)/SIGTERM 을 받으면 진행 중인 요청만 마치고 모은 데까지 저장한다 (partial).
+"""
+import os, re, sys, signal, argparse, threading, time
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+
+from crawler_batch import SITE_HOSTS
+from crawler_core import (
+    DETAIL_WORKERS, LICENSE_PATH, ts, load_license_headless, make_driver_pool, open_post_index,
+    run_single, run_batch, summary_path,
+)
+from crawler_limits import Limits
+from crawler_metrics import profiled, write_prometheus
+
+EXIT_OK, EXIT_ERROR, EXIT_LICENSE, EXIT_PARTIAL = 0, 1, 2, 3
+_INTERVAL_RE = re.compile(r"^(\d+)\s*([smhd]?)$")
+_UNIT = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def make_logger(log_file=None):
+    """stdout(+파일)에 '[HH:MM:SS] msg' 한 줄씩. 여러 스레드에서 불러도 줄이 섞이지 않는다."""
+    lock = threading.Lock()
+    f = open(log_file, "a", encoding="utf-8") if log_file else None
+    def log(msg):
+        line = f"[{ts()}] {msg}"
+        with lock:
+            print(line, flush=True)
+            if f: f.write(line + "\n"); f.flush()
+    return log
+
+
+def parse_interval(text) -> int:
+    """'900' / '15m' / '1h' / '1d' → 초"""
+    m = _INTERVAL_RE.match(str(text).strip().lower())
+    if not m or int(m.group(1)) < 1:
+        raise argparse.ArgumentTypeError(f"주기 형식이 올바르지 않습니다: {text} (예: 900, 15m, 1h)")
+    return int(m.group(1)) * _UNIT[m.group(2)]
+
+
+def _hours(args) -> int:
+    return (args.days or 0) * 24 + (args.hours or 0)
+
+
+def _check_target(args, parser):
+    if SITE_HOSTS[args.site] not in (args.url or "").lower():
+        parser.error(f"사이트와 URL이 일치하지 않습니다 ({args.site}) | {args.url}")
+    if _hours(args) < 1:
+        parser.error("기간이 1시간 이상이어야 합니다 (--hours/--days).")
+
+
+def _pool(args, log):
+    return make_driver_pool(log, lean=False if args.no_lean else None)
+
+
+def _prom(args, log):
+    """--prom-file: 누적 계측값을 Prometheus textfile 로 (실행/주기마다 갱신)."""
+    if not args.prom_file: return
+    try: write_prometheus(args.prom_file)
+    except OSError as e: log(f"Prometheus 파일 저장 실패: {e}")
+
+
+def _limits(args, cancel=None):
+    return Limits(args.max_minutes, args.max_pages, args.max_rows, cancel)
+
+
+def _cancel_on_signal(limits, log):
+    """SIGINT/SIGTERM → 협조적 취소 (모은 데까지 저장). 두 번째 신호는 원래대로 바로 종료."""
+    def _cancel(signum, frame):
+        if limits.cancel.is_set(): raise KeyboardInterrupt
+        log(f"종료 신호({signal.Signals(signum).name}) → 진행 중인 요청을 마치고 모은 데까지 저장합니다.")
+        limits.stop()
+    signal.signal(signal.SIGINT, _cancel)
+    signal.signal(signal.SIGTERM, _cancel)
+
+
+def _license(args, log):
+    ok, msg, payload = load_license_headless(args.license)
+    if not ok:
+        log(f"라이선스 오류: {msg}")
+        return None
+    return payload
+
+
+# ---------------- 명령 ----------------
+def cmd_license(args, log):
+    ok, msg, payload = load_license_headless(args.install)
+    log(msg if not ok else f"라이선스 확인: {payload.get('user')} | 만료 {payload.get('exp')} | 저장 위치 {LICENSE_PATH}")
+    return EXIT_OK if ok else EXIT_LICENSE
+
+
+def cmd_run(args, log):
+    payload = _license(args, log)
+    if payload is None: return EXIT_LICENSE
+    cutoff = datetime.now() - timedelta(hours=_hours(args))
+    pool = _pool(args, log)
+    index = None if args.no_incremental else open_post_index()
+    limits = _limits(args)
+    _cancel_on_signal(limits, log)
+    try:
+        with profiled(args.profile, log) if args.profile else nullcontext():
+            n = run_single(args.site, args.url, cutoff, args.out, args.show, log, args.workers, payload,
+                           pool, index, args.resume, limits)
+    except Exception as e:
+        log(f"오류: {e}"); return EXIT_ERROR
+    finally:
+        pool.close()
+        if index is not None: index.close()
+        _prom(args, log)
+    log(f"완료! 저장: {args.out} | 수집 {n}건" if n else "수집 결과가 비었습니다.")
+    if limits.reason:
+        log(f"일부만 수집: {limits.reason}"); return EXIT_PARTIAL
+    return EXIT_OK
+
+
+def cmd_batch(args, log):
+    payload = _license(args, log)
+    if payload is None: return EXIT_LICENSE
+    pool = _pool(args, log)
+    index = None if args.no_incremental else open_post_index()
+    limits = _limits(args)
+    _cancel_on_signal(limits, log)
+    try:
+        summaries, count = run_batch(args.jobs, args.out, args.show, log, payload, pool, index, limits)
+    except Exception as e:
+        log(f"오류: {e}"); return EXIT_ERROR
+    finally:
+        pool.close()
+        if index is not None: index.close()
+        _prom(args, log)
+    failed = sum(1 for s in summaries if s["status"] == "error")
+    partial = sum(1 for s in summaries if s["status"] == "partial")
+    log(f"[일괄] 완료 {len(summaries) - failed - partial}/{len(summaries)}" + (f" | 일부만 {partial}" if partial else "")
+        + f" | 합계 {count}건 | 요약: {summary_path(args.out)}")
+    return EXIT_ERROR if failed else EXIT_PARTIAL if partial else EXIT_OK
+
+
+def cmd_daemon(args, log):
+    """주기마다 최근 N시간을 수집. 드라이버 풀과 글 인덱스는 실행 내내 유지(두 번째 주기부터는 증분).
+    종료 신호 한 번 → 현재 주기를 마치고 종료, 두 번 → 현재 주기도 모은 데까지만 저장하고 종료."""
+    stop, cancel = threading.Event(), threading.Event()
+    def _stop(signum, frame):
+        if stop.is_set():
+            log(f"종료 신호({signal.Signals(signum).name}) 다시 → 현재 주기를 모은 데까지 저장하고 종료합니다.")
+            cancel.set(); return
+        log(f"종료 신호({signal.Signals(signum).name}) → 현재 주기를 마치고 종료합니다.")
+        stop.set()
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGTERM, _stop)
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    prefix = args.prefix or ("batch" if args.jobs else args.site)
+    pool = _pool(args, log)
+    index = None if args.no_incremental else open_post_index()
+    log(f"[데몬] 주기 {args.every}초 | 저장 폴더 {args.out_dir}")
+    tick = failures = 0
+    try:
+        while not stop.is_set():
+            tick += 1
+            t0 = time.monotonic()
+            # 만료 확인도 주기마다 (장기 실행 중 만료될 수 있음)
+            payload = _license(args, log)
+            if payload is None: return EXIT_LICENSE
+            outp = os.path.join(args.out_dir, f"{prefix}_{datetime.now():%Y%m%d_%H%M%S}.{args.format}")
+            log(f"[데몬] 주기 {tick} 시작 → {outp}")
+            limits = _limits(args, cancel)      # 시간/페이지/행 한도는 주기마다 새로
+            try:
+                if args.jobs:
+                    _, n = run_batch(args.jobs, outp, args.show, log, payload, pool, index, limits)
+                else:
+                    cutoff = datetime.now() - timedelta(hours=_hours(args))
+                    n = run_single(args.site, args.url, cutoff, outp, args.show, log, args.workers, payload,
+                                   pool, index, limits=limits)
+                failures = 0
+                log(f"[데몬] 주기 {tick} 완료 | {n}건 | {time.monotonic() - t0:.1f}초"
+                    + (f" | 일부만 ({limits.reason})" if limits.reason else ""))
+            except Exception as e:
+                failures += 1
+                log(f"[데몬] 주기 {tick} 오류({failures}회 연속): {e}")
+                if failures >= 3:   # 연속 실패 → 드라이버를 전부 새로 띄운다
+                    pool.close(); pool = _pool(args, log); failures = 0
+            _prom(args, log)
+            if args.max_ticks and tick >= args.max_ticks: break
+            stop.wait(max(0.0, args.every - (time.monotonic() - t0)))
+    finally:
+        pool.close()
+        if index is not None: index.close()
+        log("[데몬] 종료")
+    return EXIT_OK
+
+
+# ---------------- 인자 ----------------
+def build_parser():
+    p = argparse.ArgumentParser(prog="crawler_cli", description="커뮤니티 크롤러 (헤드리스 실행)")
+    p.add_argument("--log-file", help="로그를 이 파일에도 이어서 기록")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    def common(sp):
+        sp.add_argument("--license", help="라이선스 파일 (없으면 환경변수 COMMUNITY_CRAWLER_LICENSE → 저장된 라이선스)")
+        sp.add_argument("--show", action="store_true", help="브라우저 창 표시 (기본 headless)")
+        sp.add_argument("--no-incremental", action="store_true", help="글 인덱스를 쓰지 않고 매번 전부 수집")
+        sp.add_argument("--no-lean", action="store_true", help="이미지/광고 차단 없이 페이지 전체 로딩")
+        sp.add_argument("--prom-file", help="계측값을 Prometheus textfile 형식으로 이 파일에 (실행마다 갱신)")
+        sp.add_argument("--max-minutes", type=int, default=0, help="이 시간(분)이 지나면 모은 데까지 저장 (0 = 없음)")
+        sp.add_argument("--max-pages", type=int, default=0, help="게시판마다 목록 페이지 최대 수 (0 = 없음)")
+        sp.add_argument("--max-rows", type=int, default=0, help="게시판마다 최대 행 수 (0 = 없음)")
+
+    def target(sp, required=True):
+        sp.add_argument("--site", choices=list(SITE_HOSTS), required=required)
+        sp.add_argument("--url", required=required, help="게시판 목록 URL")
+        sp.add_argument("--hours", type=int, default=0)
+        sp.add_argument("--days", type=int, default=0)
+        sp.add_argument("--workers", type=int, default=DETAIL_WORKERS, help="상세 페이지 동시 수집 수")
+
+    sp = sub.add_parser("run", help="게시판 하나를 한 번 수집")
+    target(sp); common(sp)
+    sp.add_argument("--out", required=True, help="저장 파일 (.xlsx/.csv/.jsonl/.parquet)")
+    sp.add_argument("--resume", action="store_true", help="중단된 체크포인트에서 이어서")
+    sp.add_argument("--profile", help="이번 실행을 cProfile 로 측정해 이 파일에 저장 (.prof + .txt 요약, 메인 스레드만)")
+
+    sp = sub.add_parser("batch", help="작업 파일의 게시판들을 한 번 수집해 파일 하나로")
+    sp.add_argument("jobs", help="작업 파일 (JSON)")
+    sp.add_argument("--out", required=True)
+    common(sp)
+
+    sp = sub.add_parser("daemon", help="주기적으로 반복 수집 (드라이버/인덱스 재사용)")
+    target(sp, required=False); common(sp)
+    sp.add_argument("--jobs", help="작업 파일 (지정하면 --site/--url 대신)")
+    sp.add_argument("--every", type=parse_interval, default=parse_interval("15m"), help="주기 (예: 900, 15m, 1h)")
+    sp.add_argument("--out-dir", required=True)
+    sp.add_argument("--format", choices=["xlsx", "csv", "jsonl", "parquet"], default="csv")
+    sp.add_argument("--prefix", help="파일명 앞부분 (기본: 사이트명 또는 batch)")
+    sp.add_argument("--max-ticks", type=int, default=0, help="이 횟수만큼 돌고 종료 (0 = 무한)")
+
+    sp = sub.add_parser("license", help="라이선스 확인/설치")
+    sp.add_argument("--install", help="이 라이선스 파일을 확인하고 저장")
+    return p
+
+
+COMMANDS = {"run": cmd_run, "batch": cmd_batch, "daemon": cmd_daemon, "license": cmd_license}
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.cmd == "run" or (args.cmd == "daemon" and not args.jobs):
+        if not (args.site and args.url):
+            parser.error("--site 와 --url 이 필요합니다 (또는 --jobs).")
+        _check_target(args, parser)
+    return COMMANDS[args.cmd](args, make_logger(args.log_file))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,916 @@
+"""크롤링 핵심 로직 (GUI 없이 import 가능): 라이선스 검증, 드라이버/HTTP 수집, 사이트별 크롤러, 일괄 실행.
+GUI(community_crawler_gui_hours.py)와 CLI(crawler_cli.py)가 함께 쓴다."""
+import os, sys, time, threading, json, base64, platform, uuid
+from datetime import datetime, timedelta
+from functools import lru_cache
+from urllib.parse import urlparse, urlunparse, urlencode, parse_qs
+
+# 무거운 모듈(selenium, webdriver_manager, cryptography, lxml, openpyxl)은 처음 필요할 때 불러온다.
+# 여기서 import 하면 GUI 창이 뜨기 전에 모두 로드된다 → bench/startup_bench.py 로 확인.
+
+# 브라우저 없는 HTTP 경로 (없으면 Selenium 만 사용)
+from crawler_http import HttpEngine, ServerBusy, needs_browser, transient, HTTP_AVAILABLE
+from crawler_pool import DetailPool, DriverPool, RetryQueue, ListPrefetch, ProfileBusy
+from crawler_rate import RATE_LIMITER
+from crawler_metrics import METRICS, write_report
+from crawler_progress import PROGRESS
+from crawler_selectors import SELECTORS, PLAIN
+import crawler_lean
+from crawler_extract import extract_driver, extract_driver_wait, PostGone
+# 사이트별 순수 파서 (HTML → 레코드). 여기서는 가져오기(fetch)와 브라우저 쪽 추출만 한다.
+from crawler_parse import (
+    SPEC_FMK_DETAIL, FMK_LIST_SPECS, fmk_entries, fmk_detail, fmk_collect_links_html, fmk_parse_detail_html,
+    SPEC_DC_LIST, dc_rows, dc_parse_rows_html,
+    SKELETON_FMK_LIST, SKELETON_DC_LIST, SKELETON_TQ_LIST, rows_or_none,
+    SPEC_TQ_LIST, SPEC_TQ_DETAIL, tq_entries, theqoo_post, theqoo_collect_detail_links_html, theqoo_parse_detail_html,
+)
+from crawler_time import RunClock, normalize_many
+from crawler_index import PostIndex, BoardRun, board_key
+from crawler_ids import PostDedup
+from crawler_limits import Limits, Stopped
+from crawler_rows import RowStore
+from crawler_journal import CrawlJournal
+from crawler_paging import ListPage, PagePlanner, MAX_PAGE_HARD
+# 스트리밍 내보내기 + 워터마킹(엑셀 숨김 시트 등)
+from crawler_export import open_sink
+from crawler_batch import BatchRunner, load_jobs, write_summary, DEFAULT_BUDGET, BATCH_HOST_CAP
+
+APP_TITLE = "커뮤니티 크롤러 (오프라인 라이선스 + 워터마킹)"
+USER_HOME = os.path.expanduser("~")
+DEFAULT_DESKTOP = os.path.join(USER_HOME, "Desktop")
+APP_DIR = os.path.join(os.getenv("APPDATA") or USER_HOME, "CommunityCrawler")
+LICENSE_PATH = os.path.join(APP_DIR, "license.lic")
+# exe(또는 스크립트)와 같은 폴더에 있는 라이선스도 지원
+EXE_DIR = os.path.dirname(os.path.abspath(sys.executable if getattr(sys, "frozen", False) else __file__))
+PORTABLE_LICENSE = os.path.join(EXE_DIR, "license.lic")
+# chromedriver 경로 캐시 + 드라이버 풀 프로필(디스크 캐시 유지)
+DRIVER_PATH_CACHE = os.path.join(APP_DIR, "chromedriver_path.txt")
+PROFILE_ROOT      = os.path.join(APP_DIR, "chrome-profile")
+# 증분 수집용 글 인덱스
+INDEX_PATH        = os.path.join(APP_DIR, "posts.sqlite3")
+# 체크포인트 저널 (중단된 수집 이어하기)
+JOURNAL_DIR       = os.path.join(APP_DIR, "journal")
+# 선택자 후보 적중 통계 (게시판마다 맞던 후보부터 시도, None 이면 저장하지 않음)
+SELECTOR_STATS    = os.path.join(APP_DIR, "selectors.json")
+
+# 내부 안전 한도
+MAX_PAGES_SOFT   = 50
+STALE_PAGE_LIMIT = 3
+# HTTP 경로가 연속으로 이만큼 실패하면 그 실행에서는 Selenium 으로 고정
+HTTP_FAIL_LIMIT  = 3
+# 429/5xx 는 쿨다운 뒤 HTTP 로 이만큼 더 시도 (브라우저 폴백/HTTP_FAIL_LIMIT 와 무관)
+HTTP_RETRIES     = 2
+# 상세 페이지 동시 수집 워커 수(워커마다 필요 시 브라우저 1개)
+DETAIL_WORKERS   = 4
+# 사이트별 대기 예산 (초): HTTP 요청, 브라우저 페이지 로딩, 목록/상세에서 필수 요소가 모두 뜨기를 기다리는 시간.
+# 삭제/없는 글은 안내 문구로 바로 끝나므로(crawler_parse.GONE) 상세 예산은 정상 글이 늦게 뜨는 경우만 감안한다.
+PAGE_LOAD_TIMEOUT = 25
+TIMEOUTS = {
+    "FMK": {"http": 10, "page_load": 20, "list": 2, "detail": 5},
+    "DC":  {"http": 10, "page_load": 20, "list": 3},
+    "TQ":  {"http": 10, "page_load": 20, "list": 3, "detail": 6},
+}
+
+def budget(tag, kind, default=None):
+    return TIMEOUTS.get(tag, {}).get(kind, default)
+
+# ====== [중요] 공개키를 여기에 붙여주세요 ======
+PUBLIC_PEM = b"""-----BEGIN PUBLIC KEY-----
+MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEArwh9qGLUP3alVE/keAHz
+dV53lBIEVpzzuvTpi/EPXqufIXdjfGupZbpF8M7yUGtdsD8WGpW27BKuR4FQQmPO
+SNp6lIPwKlTvn46Y3R/nHFE9s0WazUyWIa7mkA0DbMhTihP6x7Lq2Y0dmEZUTJm0
+mKEzG+YF6RwOEmctHG05YqyK7xZEzSNNXK2m3hSCptf4romsrty5Hh64vsZ1nR4Z
+rNc3zdmMO4MZFWlccDQRpgvDmTj/+IqbQnsfMdPy8FoW8Wm/zPhKQQ22J1LXirnX
+5NoWhclvGNy2i4llOP26cNrvK+s5juGKJGhWe698LnrQZLMtzT27px/oqS7n14Ya
+zwIDAQAB
+-----END PUBLIC KEY-----
+"""
+# ==============================================
+
+def ts():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def ensure_dir_for_file(path: str):
+    d = os.path.dirname(os.path.abspath(path))
+    if d: os.makedirs(d, exist_ok=True)
+
+def default_xlsx_path():
+    return os.path.join(DEFAULT_DESKTOP, f"크롤링_결과_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
+
+def add_or_replace_query_param(url: str, key: str, value) -> str:
+    parts = list(urlparse(url))
+    q = parse_qs(parts[4], keep_blank_values=True)
+    q[key] = [str(value)]
+    parts[4] = urlencode(q, doseq=True)
+    return urlunparse(parts)
+
+def open_post_index(path=INDEX_PATH):
+    ensure_dir_for_file(path)
+    return PostIndex(path)
+
+def open_journal(site, list_url, cutoff, resume=False):
+    return CrawlJournal.open(JOURNAL_DIR, site, list_url, board_key(list_url), cutoff, resume)
+
+def open_selectors(tag, list_url, log):
+    """이 게시판의 선택자 학습 (통계 파일은 프로세스에서 처음 한 번 읽는다)."""
+    SELECTORS.open(SELECTOR_STATS, log)
+    return SELECTORS.scope(tag, board_key(list_url), log)
+
+def _resume(journal, sink, run, tag, log):
+    """저널에서 복구 → (rows, 시작 page, stale_pages, 이미 끝남). 복구한 행은 sink 로도 바로 흘려 보낸다."""
+    if journal is None or not journal.resumed: return RowStore(), 1, 0, False
+    rows = journal.rows     # RowStore
+    for r in rows: run.seen(r, r["_dt"]); run.claim(r["Link"])
+    if sink is not None: sink.write_rows(rows)
+    log(f"[{tag}] 체크포인트에서 재개: page={journal.last_page + 1}, 복구 {len(rows)}건")
+    return rows, journal.last_page + 1, journal.state.get("stale_pages", 0), bool(journal.state.get("ended"))
+
+def _finish(run, tag, log):
+    """게시판 수집 끝: 인덱스에 수집 범위 기록 + 중복으로 건너뛴 글 수."""
+    run.finish(run.oldest)
+    METRICS.count(tag, "dup_skipped", run.dup_hits); METRICS.count(tag, "index_reused", run.reused)
+    if run.dup_hits:
+        log(f"[{tag}] 이미 수집한 글 {run.dup_hits}건 건너뜀 (페이지 밀림/다른 주소의 같은 글)")
+    if run.missed and run.index is not None:
+        log(f"[{tag}] 읽지 못한 글 {run.missed}건 → 수집 범위를 기록하지 않음 (다음 실행이 이 구간을 다시 읽는다)")
+
+def _page_done(journal, sink, page, page_rows, stale_pages=0, ended=False, track=None):
+    """목록 페이지 하나 완료: 저널 체크포인트 + 내보내기 파일에 바로 기록 + 진행 상황."""
+    if track is not None:
+        track.page(page, len(page_rows), min((r["_dt"] for r in page_rows if r.get("_dt")), default=None))
+    if journal is not None:
+        journal.page_done(page, page_rows, stale_pages=stale_pages, ended=ended)
+    if sink is not None and page_rows:
+        sink.write_rows(page_rows)
+
+# ---------------- 라이선스(오프라인, 공개키 서명) ----------------
+@lru_cache(maxsize=1)
+def machine_id():
+    try:
+        if platform.system() == "Windows":
+            import winreg
+            k = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Cryptography")
+            v, _ = winreg.QueryValueEx(k, "MachineGuid")
+            return v
+        elif platform.system() == "Darwin":
+            import subprocess
+            out = subprocess.check_output(["ioreg","-rd1","-c","IOPlatformExpertDevice"]).decode(errors="ignore")
+            return out.split('IOPlatformUUID" = "')[1].split('"')[0]
+        else:
+            return open("/etc/machine-id").read().strip()
+    except Exception:
+        return str(uuid.getnode())
+
+def b64u_decode(s: str) -> bytes:
+    # urlsafe padding 보정
+    pad = "=" * (-len(s) % 4)
+    return base64.urlsafe_b64decode(s + pad)
+
+@lru_cache(maxsize=1)
+def _public_key():
+    # RSA 공개키 검증
+    try:
+        from cryptography.hazmat.primitives import serialization
+    except Exception:
+        raise RuntimeError("필수 모듈 'cryptography'가 없습니다. 설치:  pip install cryptography")
+    return serialization.load_pem_public_key(PUBLIC_PEM)
+
+@lru_cache(maxsize=8)
+def _verify_signed(lic_text: str):
+    """서명 + 기기락 확인 (세션 동안 같은 라이선스 문자열은 한 번만). 만료는 매번 따로 본다."""
+    try:
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+        lic = json.loads(lic_text)
+        payload_json = b64u_decode(lic["payload"])
+        payload = json.loads(payload_json)
+        sig = b64u_decode(lic["sig"])
+
+        _public_key().verify(sig, payload_json, padding.PKCS1v15(), hashes.SHA256())
+
+        dev = payload.get("dev") or ""
+        if dev and dev != machine_id():
+            return False, "등록된 PC가 아닙니다.", None
+        return True, "", payload
+    except Exception as e:
+        return False, f"라이선스 검증 실패: {e}", None
+
+def verify_license_text(lic_text: str):
+    """ lic_text(json): {"payload": b64(json), "sig": b64(signature)} """
+    ok, msg, payload = _verify_signed(lic_text)
+    if not ok: return ok, msg, payload
+    # 만료 체크 (로컬 시간 기준) — 데몬처럼 오래 떠 있어도 날짜가 바뀌면 반영
+    exp = payload.get("exp") or ""
+    try:
+        if exp and datetime.now().date() > datetime.strptime(exp, "%Y-%m-%d").date():
+            return False, "라이선스가 만료되었습니다.", None
+    except ValueError as e:
+        return False, f"라이선스 검증 실패: {e}", None
+    return True, "", dict(payload)  # payload: {"user","dev","exp",...}
+
+def load_license_from_disk():
+    for path in (LICENSE_PATH, PORTABLE_LICENSE):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except Exception:
+            continue
+    return None
+
+def save_license_to_disk(text: str):
+    os.makedirs(APP_DIR, exist_ok=True)
+    with open(LICENSE_PATH, "w", encoding="utf-8") as f:
+        f.write(text)
+
+def load_license_headless(path: str | None = None):
+    """화면 없이 라이선스 확인: path → 환경변수 COMMUNITY_CRAWLER_LICENSE → 디스크 순서.
+    → (ok, msg, payload). path 로 받은 라이선스가 유효하면 디스크에도 저장한다."""
+    path = path or os.getenv("COMMUNITY_CRAWLER_LICENSE")
+    if path:
+        try:
+            txt = open(path, "r", encoding="utf-8").read()
+        except Exception as e:
+            return False, f"라이선스 파일을 읽을 수 없습니다: {e}", None
+        ok, msg, payload = verify_license_text(txt)
+        if ok:
+            try: save_license_to_disk(txt)
+            except Exception: pass
+        return ok, msg, payload
+    txt = load_license_from_disk()
+    if not txt:
+        return False, f"라이선스가 없습니다. --license 로 지정하거나 {LICENSE_PATH} 에 두세요.", None
+    return verify_license_text(txt)
+
+# ---------------- Selenium 공통 ----------------
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+def resolve_driver_path(refresh: bool = False) -> str:
+    """chromedriver 경로: 메모리 → 디스크 캐시 → ChromeDriverManager(네트워크) → 번들 chromedriver.exe"""
+    global _driver_path
+    with _driver_path_lock:
+        if not refresh:
+            if _driver_path and os.path.exists(_driver_path): return _driver_path
+            try:
+                cached = open(DRIVER_PATH_CACHE, "r", encoding="utf-8").read().strip()
+                if cached and os.path.exists(cached):
+                    _driver_path = cached; return cached
+            except Exception:
+                pass
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            path = ChromeDriverManager().install()
+            try:
+                os.makedirs(APP_DIR, exist_ok=True)
+                with open(DRIVER_PATH_CACHE, "w", encoding="utf-8") as f: f.write(path)
+            except Exception:
+                pass
+        except Exception as e:
+            base_dir = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+            path = os.path.join(base_dir, "chromedriver.exe")
+            if not os.path.exists(path):
+                raise RuntimeError(
+                    "ChromeDriver 자동 설치 실패: {}\n"
+                    "→ 네트워크/방화벽 확인 또는 chromedriver.exe를 실행 폴더에 두세요."
+                    .format(e)
+                )
+        _driver_path = path
+        return path
+
+def initialize_driver(show_browser: bool, profile_dir: str | None = None, lean: bool | None = None):
+    """lean=None 이면 headless 일 때만 lean 로딩 (crawler_lean)."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from selenium.common.exceptions import SessionNotCreatedException
+    os.environ.setdefault("WDM_LOG_LEVEL", "0")
+    options = Options()
+    if not show_browser:
+        options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    lean = (not show_browser) if lean is None else lean
+    if lean: crawler_lean.lean_options(options)
+    with METRICS.time("all", "driver_start"):
+        try:
+            driver = webdriver.Chrome(service=Service(resolve_driver_path()), options=options)
+        except SessionNotCreatedException as e:
+            # 다른 Chrome 이 같은 프로필을 쓰는 중 → 드라이버를 다시 받아도 같다 (풀이 다른 슬롯으로)
+            if profile_dir and "user data directory is already in use" in str(e):
+                raise ProfileBusy(str(e).splitlines()[0][:120]) from e
+            # 크롬이 업데이트되어 캐시된 드라이버 버전이 안 맞음 → 다시 받기
+            driver = webdriver.Chrome(service=Service(resolve_driver_path(refresh=True)), options=options)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    driver.page_load_timeout = PAGE_LOAD_TIMEOUT
+    driver.lean = lean
+    return driver
+
+def make_driver_pool(log=print, lean=None):
+    return DriverPool(lambda show, profile_dir, full=False: initialize_driver(show, profile_dir, False if full else lean),
+                      PROFILE_ROOT, log=log)
+
+class Fetcher:
+    """페이지 단위로 HTTP 를 먼저 시도하고, 챌린지/JS 렌더링이 필요하면 그 페이지만 Selenium 으로 다시 연다.
+    parse_html(doc, base_url, text) 가 None 을 주면 렌더링이 필요한 것으로 본다 (빈 목록 [] 은 정상 결과).
+    429/5xx 는 브라우저로 넘기지 않고 쿨다운 뒤 HTTP 로 다시 연다 (_http_get)."""
+    def __init__(self, show_browser, log, tag="", use_http=True, http=None, driver_pool=None, limiter=None):
+        self.show_browser, self.log, self.tag = show_browser, log, tag
+        # 요청 간격은 호스트별 공유 리미터가 정한다 (고정 sleep 없음)
+        self.limiter = limiter or RATE_LIMITER
+        self.driver_pool, self.lease = driver_pool, None
+        # http 를 넘겨받으면 커넥션 풀을 공유하고 닫지 않는다
+        self._own_http = http is None
+        self.http = http if http is not None else (
+            HttpEngine(timeout=budget(tag, "http", 10.0)) if use_http and HTTP_AVAILABLE else None)
+        self.driver = None
+        self.http_fail = 0
+        self.last_url, self.report = None, True   # report: 닫을 때 속도 상태 로그 (워커는 끔)
+
+    def get_driver(self, full=False):
+        """full=True: lean 옵션 없이 띄운 드라이버로 바꾼다 (crawler_lean.full_load 호스트). 전체 로딩 드라이버는
+        다른 호스트에도 그대로 쓴다."""
+        if self.driver_pool is not None:
+            if self.lease is not None and full and not self.lease.full:
+                self.driver_pool.release(self.lease); self.lease = None
+            if self.lease is None:
+                self.lease = self.driver_pool.acquire(self.show_browser, full)
+            elif self.driver_pool.needs_recycle(self.lease):
+                self.driver_pool.renew(self.lease, "(재활용)")
+            self.driver = self.lease.driver
+        else:
+            if self.driver is not None and full and getattr(self.driver, "lean", False):
+                try: self.driver.quit()
+                except Exception: pass
+                self.driver = None
+            if self.driver is None:
+                self.driver = initialize_driver(self.show_browser, lean=False if full else None)
+        return self.driver
+
+    def _wait(self, url):
+        with METRICS.time(self.tag, "rate_wait"): self.limiter.wait(url)
+
+    def _pace(self, url, elapsed, throttled=False, browser=False, retry_after=None):
+        msg = self.limiter.feedback(url, elapsed, throttled, browser, retry_after)
+        if msg: self.log(f"[{self.tag}] {msg}")
+
+    def _http_get(self, url):
+        """HTTP GET. 챌린지 없는 429/5xx 는 리미터 쿨다운(Retry-After 반영) 뒤 HTTP 로 다시 연다.
+        HTTP_RETRIES 번 더 해도 같으면 ServerBusy (그 페이지 실패 → 호출한 쪽의 재시도/중단 처리)."""
+        for attempt in range(HTTP_RETRIES + 1):
+            self._wait(url)
+            with METRICS.time(self.tag, "http_get"): page = self.http.get(url)
+            if not transient(page): return page
+            self._pace(url, page.elapsed, throttled=True, retry_after=page.retry_after)
+            if attempt < HTTP_RETRIES:
+                METRICS.count(self.tag, "http_retry")
+                self.log(f"[{self.tag}] HTTP status={page.status} → 쿨다운 뒤 다시 ({attempt + 1}/{HTTP_RETRIES}): {url}")
+        METRICS.count(self.tag, "server_busy")
+        raise ServerBusy(f"HTTP status={page.status} ({HTTP_RETRIES + 1}회) {url}")
+
+    def _browser_get(self, url):
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        driver = self.get_driver(crawler_lean.full_load(url))
+        limit = budget(self.tag, "page_load", PAGE_LOAD_TIMEOUT)
+        if getattr(driver, "page_load_timeout", None) != limit:   # 드라이버는 사이트끼리 돌려 쓴다
+            driver.set_page_load_timeout(limit); driver.page_load_timeout = limit
+        self._wait(url)
+        t0 = time.perf_counter()
+        try:
+            crawler_lean.apply(driver, url)
+            driver.get(url)
+        except TimeoutException:
+            METRICS.count(self.tag, "page_timeout")
+            self._pace(url, None, browser=True)
+            raise
+        except WebDriverException as e:
+            # 세션이 죽었으면 새 드라이버로 한 번만 재시도
+            if self.lease is None: raise
+            self.driver_pool.renew(self.lease, f"(오류: {str(e).splitlines()[0][:80]})")
+            driver = self.driver = self.lease.driver
+            crawler_lean.apply(driver, url)
+            driver.get(url)
+        elapsed = time.perf_counter() - t0
+        METRICS.observe(self.tag, "page_load", elapsed)
+        self._pace(url, elapsed, browser=True)
+        if self.lease is not None: self.lease.pages += 1
+        return driver
+
+    def fetch(self, url, parse_html, parse_driver, complete=lambda r: r is not None):
+        """complete(결과) 가 False 이고 lean 로딩 중이었으면 그 호스트를 전체 로딩으로 바꿔 한 번 더 연다."""
+        self.last_url = url
+        if self.http is not None:
+            page = self._http_get(url)
+            blocked = page is not None and needs_browser(page)
+            self._pace(url, page.elapsed if page is not None else None, throttled=blocked and bool(page.text))
+            out, reason = None, "응답 없음"
+            if page is not None and not blocked:
+                try:
+                    # 삭제/없는 글(PostGone) 판정은 렌더링 뒤 브라우저 경로에서만 (crawler_parse.GONE)
+                    with METRICS.time(self.tag, "parse"): out = parse_html(page.doc, page.url, page.text)
+                    reason = "파싱 결과 없음"
+                except Exception as e:
+                    reason = f"파싱 오류 {e}"
+            elif page is not None:
+                reason = f"챌린지 status={page.status}"
+            if out is not None:
+                self.http_fail = 0
+                METRICS.count(self.tag, "fetch_http")
+                return out
+            self.http_fail += 1
+            METRICS.count(self.tag, "http_fallback")
+            self.log(f"[{self.tag}] HTTP 경로 실패({reason}) → 브라우저 폴백: {url}")
+            if self.http_fail >= HTTP_FAIL_LIMIT:
+                self.log(f"[{self.tag}] HTTP 연속 실패 {self.http_fail}회 → 이번 실행은 브라우저만 사용")
+                if self._own_http: self.http.close()
+                self.http = None
+        driver = self._browser_get(url)
+        try:
+            with METRICS.time(self.tag, "wait_extract"): out = parse_driver(driver)
+        except PostGone:
+            METRICS.count(self.tag, "post_gone"); raise
+        if not complete(out) and getattr(driver, "lean", False):
+            crawler_lean.disable_for(url)
+            METRICS.count(self.tag, "lean_reload")
+            self.log(f"[{self.tag}] lean 로딩에서 필요한 요소 없음 → {urlparse(url).netloc} 는 전체 로딩 드라이버로 다시 엽니다.")
+            driver = self._browser_get(url)
+            with METRICS.time(self.tag, "wait_extract"): out = parse_driver(driver)
+        METRICS.count(self.tag, "fetch_browser")
+        return out
+
+    def worker(self):
+        """같은 HTTP 풀을 쓰는 워커용 Fetcher (브라우저는 따로)."""
+        w = Fetcher(self.show_browser, self.log, self.tag, http=self.http,
+                    use_http=self.http is not None, driver_pool=self.driver_pool, limiter=self.limiter)
+        w.report = False
+        return w
+
+    def close(self):
+        if self.report and self.last_url:
+            self.log(f"[{self.tag}] 요청 속도: {self.limiter.describe(self.last_url)}")
+        if self.http is not None and self._own_http: self.http.close()
+        if self.lease is not None:
+            self.driver_pool.release(self.lease); self.lease = None
+        elif self.driver is not None:
+            try: self.driver.quit()
+            except Exception: pass
+        self.driver = None
+
+# ---------------- 목록 우선 수집 (FMKorea / TheQoo 공통) ----------------
+def _entry_row(e):
+    return {"Site": e["Site"], "Title": e["Title"], "Date": e["Date"], "Views": e["Views"], "Link": e["Link"],
+            "_dt": e["_dt"]}
+
+def _detail_settled(res):
+    """상세 결과가 확정인가: 성공했거나, 삭제/없는 글이라 다시 열어도 소용없음."""
+    return isinstance(res, PostGone) or (not isinstance(res, Exception) and res[0] is not None)
+
+def list_first_page(tag, entries, run, pool, detail, cutoff, log, retry=None, limits=None):
+    """목록 행으로 확정되는 글은 그대로 쓰고, 빠졌거나 애매한 글만 상세를 연다.
+    detail(fetcher, href) → (row, dt): row=None 이면 실패, dt=None 이면 시각 없이 결과에 넣음.
+    목록 순서대로 처리하다 cutoff 이전 글을 만나면 멈춘다 (그 글은 결과에 넣지 않음).
+    이미 내보낸 글(새 글에 밀려 다음 페이지에 다시 나온 글 등)은 상세도 열지 않고 건너뛴다.
+    상세 실패는 retry(RetryQueue)에 넣어 게시판 끝에서 다시 시도한다 (retry_failed). 삭제된 글은 버린다.
+    limits: 상세를 열기 전마다 한도 확인, 행 한도에 닿으면 그 자리에서 멈춤.
+    → (창 안의 행들, 오래된 글을 만났는가)"""
+    limits = limits or Limits()
+    # 목록만 보고 확실히 오래된 첫 글 — 그 뒤는 상세도 열지 않는다
+    stop = next((i for i, e in enumerate(entries) if e["_hi"] is not None and e["_hi"] < cutoff), len(entries))
+    head = [e for e in entries[:stop + 1] if not run.is_dup(e["Link"])]
+    need = [e["Link"] for e in head if not e["_exact"] and (e["_hi"] is None or e["_hi"] >= cutoff)]
+    known = run.known(need)
+    todo = [h for h in need if h not in known]
+    if need:
+        log(f"[{tag}] 목록 행 {len(head)}개 중 상세 {len(todo)}개" + (f" (인덱스 재사용 {len(known)}개)" if known else ""))
+    fetched = dict(zip(todo, pool.map(limits.guard(detail), todo)))
+    out, new_rows, found_old = [], [], False
+    for e in head:
+        href = e["Link"]
+        if href in known:
+            row = known[href]; dt = row["_dt"]
+        elif href in fetched:
+            res = fetched[href]
+            if isinstance(res, Stopped): run.miss(href); continue
+            if isinstance(res, PostGone):
+                log(f"[{tag}] 상세 건너뜀: {res} | {href}"); continue
+            if not _detail_settled(res):
+                why = res if isinstance(res, Exception) else "필수 항목 없음"
+                if retry is None: log(f"[{tag}] 상세 실패: {why} | {href}"); run.miss(href)
+                else: retry.add(href, why)
+                continue
+            row, dt = res
+            new_rows.append(row)
+        elif e["_dt"] is not None:
+            row = _entry_row(e)
+            if e["_exact"]: dt = e["_dt"]; new_rows.append(row)
+            else: dt = e["_hi"]   # 확실하지 않은 시각: 가장 늦을 수 있는 시각으로 판단 (인덱스에도 남기지 않음)
+        else:
+            continue
+        run.seen(row, dt)
+        if dt is not None and dt < cutoff:
+            found_old = True; break
+        if not limits.allow(): break
+        out.append(row); run.claim(href)
+    run.store(new_rows)
+    return out, found_old or stop < len(entries)
+
+def _prefetch_next(lists, page, entries, cutoff, limits):
+    """page 의 상세를 처리하는 동안 다음 목록 페이지를 미리 요청한다. 목록 시각만으로 이미 cutoff 이전 글이
+    보이거나(이 페이지에서 끝남) 한도상 다음 페이지가 없으면 요청하지 않는다."""
+    if page >= MAX_PAGES_SOFT or not limits.more_pages(): return
+    if any(e["_hi"] is not None and e["_hi"] < cutoff for e in entries): return
+    lists.ahead(page + 1)
+
+def _list_get(lists, page, tag, limits, log):
+    """목록 page → 후보 목록. 읽지 못하면(재시도 뒤에도 429/5xx, 타임아웃 등) limits.halt 후 None
+    → 그 앞 페이지까지만 내보내고 저널은 이 페이지부터 이어서."""
+    try:
+        return lists.get(page) or []
+    except Exception as e:
+        METRICS.count(tag, "list_failed")
+        log(f"[{tag}] 목록 page={page} 읽기 실패: {type(e).__name__}: {e}")
+        limits.halt(f"목록 page={page} 읽기 실패")
+        return None
+
+def _prefetch_done(lists, tag):
+    lists.close()
+    METRICS.count(tag, "list_prefetch_hit", lists.hits); METRICS.count(tag, "list_prefetch_wasted", lists.wasted)
+
+def retry_failed(tag, retry, run, pool, detail, cutoff, log, limits=None):
+    """게시판 끝: 실패했던 상세를 backoff 를 두고 다시 연다 → cutoff 안쪽 행들 (목록 순서와 무관).
+    한도/취소로 이미 멈췄으면 다시 시도하지 않는다."""
+    if not len(retry): return []
+    limits = limits or Limits()
+    if limits.check():
+        for href in retry.failed: run.miss(href)
+        log(f"[{tag}] 중단({limits.reason}) → 실패한 상세 {len(retry)}개는 다시 시도하지 않음"); return []
+    log(f"[{tag}] 상세 실패 {len(retry)}개 → 다시 시도 (최대 {retry.rounds}회)")
+    out = []
+    for href, res in retry.drain(pool, limits.guard(detail), lambda res: isinstance(res, Stopped) or _detail_settled(res)).items():
+        if isinstance(res, Stopped): run.miss(href); continue
+        if isinstance(res, PostGone):
+            log(f"[{tag}] 상세 건너뜀: {res} | {href}"); continue
+        row, dt = res
+        if run.is_dup(href): continue
+        run.seen(row, dt); run.store([row])
+        if (dt is None or dt >= cutoff) and limits.allow():
+            out.append(row); run.claim(href)
+    for href, why in retry.failed.items():
+        log(f"[{tag}] 상세 최종 실패: {why} | {href}"); run.miss(href)
+    METRICS.count(tag, "detail_retried", len(out)); METRICS.count(tag, "detail_failed", len(retry))
+    return out
+
+# ---------------- FMKorea ----------------
+def fmk_collect_links_driver(driver, clock=None, sel=None):
+    entries = fmk_entries((sel or PLAIN).extract_driver_wait(driver, FMK_LIST_SPECS, budget("FMK", "list"), chain=True)[1],
+                          clock)
+    return rows_or_none(entries, lambda: extract_driver(driver, [SKELETON_FMK_LIST])[1][0])
+
+def fmk_parse_detail_driver(driver, log=print):
+    recs = extract_driver_wait(driver, [SPEC_FMK_DETAIL], timeout=budget("FMK", "detail"))[1][0]
+    if not recs:
+        METRICS.count("FMK", "detail_parse_miss")
+        log(f"[FMK] 상세 파싱 오류: 필수 요소 없음 {driver.current_url}")
+        return "제목 없음", "", None
+    return fmk_detail(recs[0])
+
+def fmk_get_content(link, fetcher):
+    return fetcher.fetch(link, fmk_parse_detail_html, lambda d: fmk_parse_detail_driver(d, fetcher.log),
+                         complete=lambda r: bool(r and r[1]))
+
+def fmk_detail_row(fetcher, link, clock=None):
+    """상세 → (row, dt). 날짜를 못 읽으면 버린다 (None, None)."""
+    title, date_text, views = fmk_get_content(link, fetcher)
+    dt = (clock or RunClock()).stamp(date_text, "FMKorea").dt
+    if not dt: return None, None
+    return {"Site": "FMKorea", "Title": title, "Date": date_text, "Views": views, "Link": link, "_dt": dt}, dt
+
+def crawl_fmkorea(list_url, cutoff, show_browser, log, workers=DETAIL_WORKERS, driver_pool=None, index=None,
+                  journal=None, sink=None, dedup=None, limits=None):
+    fetcher = Fetcher(show_browser, log, "FMK", driver_pool=driver_pool)
+    pool = DetailPool(fetcher.worker, workers)
+    run = BoardRun(index, "FMKorea", list_url, cutoff, dedup)
+    clock, sel = RunClock(), open_selectors("FMK", list_url, log)
+    track = PROGRESS.start("FMK", cutoff, clock.now)
+    detail, retry = (lambda f, link: fmk_detail_row(f, link, clock)), RetryQueue()
+    rows, page, stale_pages, ended = _resume(journal, sink, run, "FMK", log)
+    limits = limits or Limits()
+    # 목록은 한 스레드에서 차례로 (상세를 처리하는 동안 다음 페이지를 미리)
+    lists = ListPrefetch(lambda p: fetcher.fetch(add_or_replace_query_param(list_url, "page", p),
+                                                 lambda doc, base, text: fmk_collect_links_html(doc, base, text, clock, sel),
+                                                 lambda d: fmk_collect_links_driver(d, clock, sel)))
+    try:
+        while not ended and page <= MAX_PAGES_SOFT:
+            if limits.check():
+                log(f"[FMK] 중단({limits.reason}) → 모은 {len(rows)}건까지 저장"); break
+            mark = len(rows)
+            log(f"[FMK] 목록 page={page} | {add_or_replace_query_param(list_url, 'page', page)}")
+            entries = _list_get(lists, page, "FMK", limits, log)
+            if entries is None:
+                log(f"[FMK] 중단({limits.reason}) → 모은 {len(rows)}건까지 저장"); break
+            log(f"[FMK] 후보 {len(entries)}개")
+            if not entries:
+                stale_pages += 1
+                ended = stale_pages >= STALE_PAGE_LIMIT
+                _page_done(journal, sink, page, [], stale_pages, ended, track=track)
+                if ended: log("[FMK] 연속 없음 → 종료"); break
+                page += 1; continue
+            stale_pages = 0
+            if run.page_is_known_past([e["Link"] for e in entries]):
+                log("[FMK] 이미 수집한 구간 도달 → 인덱스에서 채우고 종료"); rows += limits.take(run.backfill())
+                _page_done(journal, sink, page, rows[mark:], ended=True, track=track); break
+
+            # 목록 행 우선, 상세는 필요한 글만 병렬로 (결과 처리는 목록 순서대로)
+            _prefetch_next(lists, page, entries, cutoff, limits)
+            page_rows, found_old = list_first_page("FMK", entries, run, pool, detail, cutoff, log, retry, limits)
+            rows += page_rows
+            _page_done(journal, sink, page, rows[mark:], ended=found_old, track=track)
+            limits.page()
+            if found_old:
+                log("[FMK] cutoff 이전 글 도달 → 종료"); break
+            page += 1
+        late = retry_failed("FMK", retry, run, pool, detail, cutoff, log, limits)
+        if late:
+            rows += late; _page_done(journal, sink, page, late, ended=True)
+        _finish(run, "FMK", log)
+    finally:
+        _prefetch_done(lists, "FMK"); pool.close(); fetcher.close(); track.done(); SELECTORS.save(log)
+    return rows
+
+# ---------------- DCInside ----------------
+def dc_parse_rows_driver(driver):
+    rows = dc_rows(extract_driver_wait(driver, [SPEC_DC_LIST], timeout=budget("DC", "list"))[1][0])
+    return rows_or_none(rows, lambda: extract_driver(driver, [SKELETON_DC_LIST])[1][0])
+
+def dc_list_page(page, items, clock=None):
+    stamps = normalize_many([it[2] for it in items], "DCInside", clock)
+    return ListPage(page, items, [s.dt for s in stamps], [it[0] for it in items])
+
+def crawl_dcinside(list_url, cutoff, show_browser, log, workers=DETAIL_WORKERS, driver_pool=None, index=None,
+                   journal=None, sink=None, dedup=None, limits=None):
+    """경계 페이지를 먼저 찾고(crawler_paging) 그 안쪽 목록 페이지만 병렬로 읽는다.
+    한도는 탐색 요청마다, 그리고 목록 페이지 사이에서 확인한다 (페이지 한도 밖은 미리 읽지 않음).
+    목록 페이지(경계 탐색 포함)를 못 읽으면 그 앞 페이지까지만 내보낸다 (limits.halt → partial, 저널은 그 페이지부터 이어서)."""
+    fetcher = Fetcher(show_browser, log, "DC", driver_pool=driver_pool)
+    pool = DetailPool(fetcher.worker, workers)
+    run = BoardRun(index, "DCInside", list_url, cutoff, dedup)
+    clock = RunClock()
+    track = PROGRESS.start("DC", cutoff, clock.now)
+    log(f"[DC] cutoff = {cutoff:%Y-%m-%d %H:%M:%S}")
+    rows, first_page, _, ended = _resume(journal, sink, run, "DC", log)
+    limits = limits or Limits()
+    page_url = lambda page: add_or_replace_query_param(list_url, "page", page)
+    fetch_rows = lambda f, url: f.fetch(url, dc_parse_rows_html, dc_parse_rows_driver) or []
+    try:
+        if not ended:
+            # 이전 실행들이 빈틈 없이 훑은 구간(high-water) 아래는 읽지 않고 인덱스에서 채운다
+            known_to = run.covered_until()
+            plan_cutoff = max(cutoff, known_to) if known_to else cutoff
+            # 탐색 요청도 한도/취소를 보고(guard → Stopped), 페이지 한도 밖은 탐색도 미리 읽기도 하지 않는다
+            # (탐색 상한은 한도 + 1쪽: 경계가 한도 밖이면 수집 루프가 그 쪽에서 한도 사유로 멈춘다)
+            left = limits.pages_left()
+            planner = PagePlanner(lambda page: dc_list_page(page, limits.guard(fetch_rows)(fetcher, page_url(page)), clock),
+                                  plan_cutoff, first_page, MAX_PAGE_HARD if left is None else first_page + left,
+                                  log=lambda msg: log(f"[DC] {msg}"))
+            probe_failed = None   # 탐색 요청 실패 → 이미 읽은 앞쪽 페이지까지만 내보낸다 (todo 실패와 같이 partial)
+            try:
+                pages, todo = planner.plan()
+            except Stopped:
+                pages, todo = [], []
+                log(f"[DC] 경계 탐색 중 중단({limits.reason}) → 모은 {len(rows)}건까지 저장")
+            except Exception as e:
+                METRICS.count("DC", "list_failed")
+                log(f"[DC] 경계 탐색 실패: {type(e).__name__}: {e}")
+                probe_failed, pages, todo = "목록 탐색 실패", [], []
+                while first_page + len(pages) in planner.pages: pages.append(first_page + len(pages))
+            if left is not None: todo = [p for p in todo if p in pages[:left]]
+            if pages:
+                track.plan(pages[-1])
+                log(f"[DC] 수집 page {pages[0]}~{pages[-1]} ({len(pages)}쪽) | 탐색에서 읽음 {len(planner.pages)}쪽, 추가 {len(todo)}쪽")
+            failed = {}   # 읽지 못한 목록 page → 오류 (그 앞까지만 내보낸다)
+            for page, items in zip(todo, pool.map(limits.guard(fetch_rows), [page_url(p) for p in todo])):
+                if isinstance(items, Stopped): continue
+                if isinstance(items, Exception): failed[page] = items; continue
+                planner.pages[page] = dc_list_page(page, items, clock)
+
+            for page in pages:
+                if page in failed:
+                    METRICS.count("DC", "list_failed")
+                    log(f"[DC] 목록 page={page} 읽기 실패: {type(failed[page]).__name__}: {failed[page]}")
+                    limits.halt(f"목록 page={page} 읽기 실패")
+                if limits.check() or page not in planner.pages:
+                    log(f"[DC] 중단({limits.reason or f'목록 page={page} 없음'}) → 모은 {len(rows)}건까지 저장"); break
+                mark = len(rows)
+                lp = planner.pages[page]
+                page_rows = []
+                for (href, title, date_text, views), dt in zip(lp.items, lp.dts):
+                    if not dt or run.is_dup(href): continue   # 수집 도중 새 글에 밀린 글은 두 페이지에 나온다
+                    row = {
+                        "Site":"DCInside","Title":title or "제목 없음",
+                        "Date":date_text,"Views":views,"Link":href,"_dt":dt
+                    }
+                    page_rows.append(row); run.seen(row, dt)
+                    if dt >= cutoff and limits.allow():
+                        rows.append(row); run.claim(href)
+                run.store(page_rows)
+                last = page == pages[-1] and not probe_failed
+                if last and known_to and plan_cutoff > cutoff:
+                    log("[DC] 이미 수집한 구간 도달 → 인덱스에서 채우고 종료"); rows += limits.take(run.backfill())
+                _page_done(journal, sink, page, rows[mark:], ended=last, track=track)
+                limits.page()
+            if probe_failed:
+                limits.halt(probe_failed)
+                log(f"[DC] 중단({limits.reason}) → 모은 {len(rows)}건까지 저장")
+        _finish(run, "DC", log)
+    finally:
+        pool.close(); fetcher.close(); track.done()
+    return rows
+
+# ---------------- TheQoo (상세 + 공지 제외 + .side.fr span + 조회수 count_container) ----------------
+def theqoo_collect_detail_links(driver, clock=None):
+    entries = tq_entries(extract_driver_wait(driver, [SPEC_TQ_LIST], timeout=budget("TQ", "list"))[1][0], clock)
+    return rows_or_none(entries, lambda: extract_driver(driver, [SKELETON_TQ_LIST])[1][0])
+
+def theqoo_parse_detail_driver(driver, url, clock=None, sel=None):
+    recs = (sel or PLAIN).extract_driver_wait(driver, [SPEC_TQ_DETAIL], budget("TQ", "detail"))[1][0]
+    return theqoo_post(url, recs[0] if recs else None, clock)
+
+def theqoo_detail_row(fetcher, url, clock=None, sel=None):
+    """상세 → (row, dt). 필수 항목(제목 + 날짜)을 못 읽었으면 실패 (None, None) → 재시도 큐."""
+    post = theqoo_parse_detail(fetcher, url, clock, sel)
+    if not post or not post["_dt"]: return None, None
+    return post, post["_dt"]
+
+def theqoo_parse_detail(fetcher, url, clock=None, sel=None):
+    return fetcher.fetch(url,
+                         lambda doc, base, text: theqoo_parse_detail_html(doc, base, text, url, clock, sel),
+                         lambda d: theqoo_parse_detail_driver(d, url, clock, sel),
+                         complete=lambda r: bool(r and r["_dt"]))
+
+def crawl_theqoo(list_url, cutoff, show_browser, log, workers=DETAIL_WORKERS, driver_pool=None, index=None,
+                 journal=None, sink=None, dedup=None, limits=None):
+    fetcher = Fetcher(show_browser, log, "TQ", driver_pool=driver_pool)
+    pool = DetailPool(fetcher.worker, workers)
+    run = BoardRun(index, "TheQoo", list_url, cutoff, dedup)
+    clock, sel = RunClock(), open_selectors("TQ", list_url, log)
+    track = PROGRESS.start("TQ", cutoff, clock.now)
+    detail, retry = (lambda f, url: theqoo_detail_row(f, url, clock, sel)), RetryQueue()
+    rows, page, stale_pages, ended = _resume(journal, sink, run, "TQ", log)
+    limits = limits or Limits()
+    lists = ListPrefetch(lambda p: fetcher.fetch(add_or_replace_query_param(list_url, "page", p),
+                                                 lambda doc, base, text: theqoo_collect_detail_links_html(doc, base, text, clock),
+                                                 lambda d: theqoo_collect_detail_links(d, clock)))
+    try:
+        while not ended and page <= MAX_PAGES_SOFT:
+            if limits.check():
+                log(f"[TQ] 중단({limits.reason}) → 모은 {len(rows)}건까지 저장"); break
+            mark = len(rows)
+            log(f"[TQ] 목록 page={page} | {add_or_replace_query_param(list_url, 'page', page)}")
+            entries = _list_get(lists, page, "TQ", limits, log)
+            if entries is None:
+                log(f"[TQ] 중단({limits.reason}) → 모은 {len(rows)}건까지 저장"); break
+            log(f"[TQ] 목록 글(공지 제외) {len(entries)}개")
+            if not entries:
+                stale_pages += 1
+                ended = stale_pages >= STALE_PAGE_LIMIT
+                _page_done(journal, sink, page, [], stale_pages, ended, track=track)
+                if ended: log("[TQ] 연속 없음 → 종료"); break
+                page += 1; continue
+            stale_pages = 0
+            if run.page_is_known_past([e["Link"] for e in entries]):
+                log("[TQ] 이미 수집한 구간 도달 → 인덱스에서 채우고 종료"); rows += limits.take(run.backfill())
+                _page_done(journal, sink, page, rows[mark:], ended=True, track=track); break
+
+            _prefetch_next(lists, page, entries, cutoff, limits)
+            page_rows, found_old = list_first_page("TQ", entries, run, pool, detail, cutoff, log, retry, limits)
+            rows += page_rows
+            log(f"[TQ] page={page} 완료 (누적 {len(rows)})")
+            _page_done(journal, sink, page, rows[mark:], ended=found_old, track=track)
+            limits.page()
+            if found_old:
+                log("[TQ] cutoff 이전 글 도달 → 종료"); break
+            page += 1
+        late = retry_failed("TQ", retry, run, pool, detail, cutoff, log, limits)
+        if late:
+            rows += late; _page_done(journal, sink, page, late, ended=True)
+        _finish(run, "TQ", log)
+    finally:
+        _prefetch_done(lists, "TQ"); pool.close(); fetcher.close(); track.done(); SELECTORS.save(log)
+    return rows
+
+# ---------------- 사이트 선택 / 일괄 실행 ----------------
+def crawl_site(site, list_url, cutoff, show_browser, log, workers=DETAIL_WORKERS, driver_pool=None,
+               index=None, journal=None, sink=None, dedup=None, limits=None):
+    crawl = {"FMKorea": crawl_fmkorea, "DCInside": crawl_dcinside}.get(site, crawl_theqoo)
+    return crawl(list_url, cutoff, show_browser, log, workers, driver_pool, index, journal, sink, dedup, limits)
+
+def run_single(site, list_url, cutoff, outp, show_browser, log, workers=DETAIL_WORKERS, payload=None,
+               driver_pool=None, index=None, resume=False, limits=None):
+    """게시판 하나 수집 → outp 저장 (저널/체크포인트 포함). → 저장 건수, 결과가 없으면 0 (파일 없음)
+    limits(crawler_limits.Limits) 로 멈추면 모은 데까지 저장하고 파일에 partial 표시 — 사유는 limits.reason,
+    체크포인트는 남겨 두므로 이어서 수집할 수 있다.
+    단계별 계측 보고서는 성공/실패와 관계없이 metrics_path(outp) 에 남긴다."""
+    journal = sink = None
+    since, status, count = METRICS.snapshot(), "error", 0
+    limits = limits if limits is not None else Limits()   # 목록을 못 읽어 멈춘 사유도 여기로 (partial)
+    crawler_lean.reset()
+    try:
+        journal = open_journal(site, list_url, cutoff, resume)
+        if journal.resumed:
+            cutoff = journal.cutoff
+            log(f"체크포인트 발견 → page {journal.last_page}까지 완료, {len(journal.rows)}건 복구 | cutoff={cutoff:%Y-%m-%d %H:%M}")
+        # 결과는 페이지마다 바로 파일에 기록 (_dt 등 내부 필드 제외, 워터마크 함께)
+        sink = open_sink(outp, payload)
+        rows = crawl_site(site, list_url, cutoff, show_browser, log, workers, driver_pool, index, journal, sink,
+                          limits=limits)
+        partial = limits.reason
+        if not rows:
+            sink.discard(); journal.finish()
+            status = "empty"
+            return 0
+        if partial: sink.mark_partial(partial)
+        sink.close()
+
+        # 수집된 시각 범위 로그
+        lo, hi = rows.span()
+        if lo:
+            log(f"수집된 시각 범위: {lo:%Y-%m-%d %H:%M:%S} ~ {hi:%Y-%m-%d %H:%M:%S}")
+        if partial:
+            journal.close()
+            log(f"일부만 저장 ({partial}) → 체크포인트(page {journal.last_page})에서 이어서 수집할 수 있습니다.")
+        else:
+            journal.finish()
+        status, count = "partial" if partial else "ok", sink.count
+        return sink.count
+    except Exception:
+        if sink is not None: sink.discard()
+        if journal is not None:
+            journal.close()
+            log(f"체크포인트 저장됨(page {journal.last_page}) → 이어서 수집으로 재개할 수 있습니다.")
+        raise
+    finally:
+        _write_metrics(outp, since, log, site=site, list_url=list_url, status=status, rows=count)
+
+
+def summary_path(outp):
+    return os.path.splitext(outp)[0] + "_summary.json"
+
+def metrics_path(outp):
+    return os.path.splitext(outp)[0] + "_metrics.json"
+
+def _write_metrics(outp, since, log, **info):
+    """이번 실행분 계측 보고서 (JSON). 저장 실패는 수집 결과에 영향을 주지 않는다."""
+    path = metrics_path(outp)
+    try:
+        write_report(path, METRICS.report(since, **info))
+        log(f"성능 보고서: {path}")
+    except OSError as e:
+        log(f"성능 보고서 저장 실패: {e}")
+
+def run_batch(jobs_path, outp, show_browser, log, payload=None, driver_pool=None, index=None, limits=None):
+    """작업 파일의 게시판들을 동시에 수집해 outp 하나로 합친다. → (작업별 요약, 총 건수)
+    limits 는 작업마다 새로 (fresh — 작업 파일의 max_* 가 우선, 취소 이벤트는 공유). 취소되면 아직 시작하지 않은
+    작업은 건너뛰고, 일부만 수집했거나 실패한 작업이 있으면 파일에 partial 표시 (사유는 작업별 요약에)."""
+    limits = limits or Limits()
+    crawler_lean.reset()
+    jobs, conf = load_jobs(jobs_path)
+    log(f"[일괄] 작업 {len(jobs)}개 | 예산 {conf.get('budget', DEFAULT_BUDGET)} | 호스트당 {conf.get('host_cap', BATCH_HOST_CAP)}")
+    since = METRICS.snapshot()
+    sink = open_sink(outp, payload)
+    journals, lock = [], threading.Lock()
+    dedup = PostDedup()     # 여러 게시판에 함께 올라온 글(예: 유머 + 포텐)은 한 번만
+
+    def run_job(job, workers, jlog):
+        jl = limits.fresh(**job.limits)
+        if jl.check():
+            jlog(f"건너뜀 ({jl.reason})"); return 0, jl.reason
+        cutoff = datetime.now() - timedelta(hours=job.hours)
+        journal = open_journal(job.site, job.url, cutoff)
+        try:
+            rows = crawl_site(job.site, job.url, cutoff, show_browser, jlog, workers, driver_pool, index, journal, sink,
+                              dedup, jl)
+        except Exception:
+            journal.close(); raise
+        with lock: journals.append(journal)
+        return len(rows), jl.reason
+
+    runner = BatchRunner(run_job, conf.get("budget", DEFAULT_BUDGET), conf.get("host_cap", BATCH_HOST_CAP),
+                         DETAIL_WORKERS, log)
+    try:
+        summaries = runner.run(jobs)
+    except Exception:
+        sink.discard(); _write_metrics(outp, since, log, jobs=len(jobs), status="error"); raise
+    # 실패한 작업도 그 게시판이 빠진 것이므로 partial (사유는 작업 이름과 함께)
+    reasons = sorted({s["error"] for s in summaries if s["status"] == "partial"} |
+                     {f"{s['name']} 실패: {s['error']}" for s in summaries if s["status"] == "error"})
+    if reasons: sink.mark_partial("; ".join(reasons))
+    if sink.count: sink.close()
+    else: sink.discard()
+    for j in journals: j.finish()
+    if dedup.hits: log(f"[일괄] 작업 간 중복 포함 건너뛴 글 {dedup.hits}건")
+    write_summary(summary_path(outp), summaries)
+    _write_metrics(outp, since, log, jobs=len(jobs), status="partial" if reasons else "ok", rows=sink.count)
+    return summaries, sink.count
@@ -0,0 +1,188 @@
+"""행이 나오는 대로 파일에 쓰는 스트리밍 내보내기. 워터마크(라이선스 정보)를 같은 패스에서 함께 기록한다.
+
+형식은 확장자로 고른다.
+    .xlsx     openpyxl write-only 통합문서 + 숨김 시트 _meta
+    .csv      UTF-8(BOM) 순수 CSV (머리글 + 행만), 워터마크는 옆 파일 <이름>.meta.json 의 "license"
+    .jsonl    첫 줄 {"_meta": {...}}, 이후 한 줄에 한 행
+    .parquet  pyarrow ParquetWriter, 스키마 메타데이터 b"license"
+한도/취소로 일부만 모았으면(mark_partial) 같은 자리에 partial 표시를 남긴다: _meta 시트의 partial 행,
+CSV 옆 파일의 "partial", JSONL 마지막 줄 {"_partial": {...}}, Parquet 파일 메타데이터 b"partial".
+"""
+import os, csv, json, threading
+
+from crawler_metrics import METRICS
+from crawler_rows import RowStore
+
+EXPORT_COLUMNS = ["Site", "Title", "Date", "Views", "Link"]
+PARQUET_BATCH = 5000
+
+
+def meta_path(path):
+    """CSV 옆 파일 (CSV 안에는 주석 줄을 넣지 않는다 — pandas/Excel/csv 모듈이 그대로 읽도록)."""
+    return os.path.splitext(path)[0] + ".meta.json"
+
+
+def watermark_fields(payload):
+    """[("user", ...), ("device", ...), ("exp", ...)] — 워터마크로 남길 항목."""
+    if not payload: return []
+    return [("user", payload.get("user", "")), ("device", payload.get("dev", "")),
+            ("exp", payload.get("exp", ""))]
+
+
+class ExportSink:
+    """write_rows() 는 여러 스레드에서 불러도 된다. close() 에서 파일이 완성된다."""
+    def __init__(self, path, payload=None, columns=EXPORT_COLUMNS):
+        self.path, self.payload, self.columns = path, payload, list(columns)
+        self.count = 0
+        self.partial = None     # 일부만 수집한 사유
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def mark_partial(self, reason):
+        """close() 전에: 이 파일은 한도/취소로 일부만 모은 결과."""
+        self.partial = reason or "partial"
+
+    def write_rows(self, rows):
+        with self._lock, METRICS.time("all", "export_write"):
+            self.count += self._write_rows(rows)
+
+    def _write_rows(self, rows) -> int:
+        n = 0
+        for r in rows:
+            self._write([r.get(c) for c in self.columns]); n += 1
+        return n
+
+    def close(self):
+        with self._lock:
+            if self._closed: return
+            self._closed = True
+            with METRICS.time("all", "export_close"): self._finish()
+
+    def discard(self):
+        """결과가 없을 때: 파일을 남기지 않는다."""
+        self.close()
+        for p in self._files():
+            try: os.remove(p)
+            except OSError: pass
+
+    def _files(self):
+        return [self.path]
+
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+    def _write(self, values): raise NotImplementedError
+    def _finish(self): raise NotImplementedError
+
+
+class XlsxSink(ExportSink):
+    def __init__(self, path, payload=None, columns=EXPORT_COLUMNS):
+        super().__init__(path, payload, columns)
+        from openpyxl import Workbook
+        self._wb = Workbook(write_only=True)   # 행을 임시 파일로 흘려 보내 메모리 일정
+        self._ws = self._wb.create_sheet("Sheet1")
+        self._ws.append(self.columns)
+
+    def _write(self, values):
+        self._ws.append(values)
+
+    def _finish(self):
+        meta = watermark_fields(self.payload) + ([("partial", self.partial)] if self.partial else [])
+        if meta:
+            ws = self._wb.create_sheet("_meta")
+            ws.sheet_state = "hidden"
+            for k, v in meta: ws.append([k, v])
+        self._wb.save(self.path)
+
+
+class CsvSink(ExportSink):
+    def __init__(self, path, payload=None, columns=EXPORT_COLUMNS):
+        super().__init__(path, payload, columns)
+        self._f = open(path, "w", encoding="utf-8-sig", newline="")
+        self._w = csv.writer(self._f)
+        self._w.writerow(self.columns)
+        self._write_meta()      # 워터마크는 처음부터 (중간에 죽어도 남도록), partial 은 close() 에서 다시
+
+    def _files(self):
+        return [self.path, meta_path(self.path)]
+
+    def _write_meta(self):
+        meta = watermark_fields(self.payload)
+        if not meta and not self.partial:
+            try: os.remove(meta_path(self.path))   # 같은 이름의 이전 결과에 남은 옆 파일
+            except OSError: pass
+            return
+        info = {"file": os.path.basename(self.path), "license": dict(meta) or None,
+                "partial": {"reason": self.partial, "rows": self.count} if self.partial else None}
+        with open(meta_path(self.path), "w", encoding="utf-8") as f:
+            json.dump(info, f, ensure_ascii=False, indent=2)
+
+    def _write(self, values):
+        self._w.writerow(["" if v is None else v for v in values])
+
+    def _finish(self):
+        self._f.close()
+        self._write_meta()
+
+
+class JsonlSink(ExportSink):
+    def __init__(self, path, payload=None, columns=EXPORT_COLUMNS):
+        super().__init__(path, payload, columns)
+        self._f = open(path, "w", encoding="utf-8")
+        meta = watermark_fields(payload)
+        if meta:
+            self._f.write(json.dumps({"_meta": dict(meta)}, ensure_ascii=False) + "\n")
+
+    def _write(self, values):
+        self._f.write(json.dumps(dict(zip(self.columns, values)), ensure_ascii=False, default=str) + "\n")
+
+    def _finish(self):
+        if self.partial:
+            self._f.write(json.dumps({"_partial": {"reason": self.partial, "rows": self.count}}, ensure_ascii=False) + "\n")
+        self._f.close()
+
+
+class ParquetSink(ExportSink):
+    def __init__(self, path, payload=None, columns=EXPORT_COLUMNS):
+        super().__init__(path, payload, columns)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except Exception:
+            raise RuntimeError("Parquet 저장에 필요한 모듈이 없습니다. 설치:  pip install pyarrow")
+        fields = [pa.field(c, pa.int64() if c == "Views" else pa.string()) for c in self.columns]
+        meta = watermark_fields(payload)
+        md = {b"license": json.dumps(dict(meta), ensure_ascii=False).encode("utf-8")} if meta else None
+        self._schema = pa.schema(fields, metadata=md)
+        self._writer = pq.ParquetWriter(path, self._schema)
+        self._buf = RowStore()      # 열 단위로 모았다가 배치마다 Arrow 로 (행 → 열 전치 없음)
+
+    def _write_rows(self, rows) -> int:
+        n = len(self._buf)
+        self._buf += rows
+        n = len(self._buf) - n
+        if len(self._buf) >= PARQUET_BATCH: self._flush()
+        return n
+
+    def _flush(self):
+        if not len(self._buf): return
+        self._writer.write_table(self._buf.to_arrow(self._schema))
+        self._buf = RowStore()
+
+    def _finish(self):
+        self._flush()
+        if self.partial: self._writer.add_key_value_metadata({"partial": self.partial})
+        self._writer.close()
+
+
+SINKS = {".xlsx": XlsxSink, ".csv": CsvSink, ".jsonl": JsonlSink, ".parquet": ParquetSink}
+
+
+def open_sink(path, payload=None, columns=EXPORT_COLUMNS) -> ExportSink:
+    ext = os.path.splitext(path)[1].lower()
+    cls = SINKS.get(ext)
+    if cls is None:
+        raise ValueError(f"지원하지 않는 저장 형식입니다: {ext or '(확장자 없음)'} (xlsx/csv/jsonl/parquet)")
+    d = os.path.dirname(os.path.abspath(path))
+    if d: os.makedirs(d, exist_ok=True)
+    return cls(path, payload, columns)
@@ -0,0 +1,227 @@
+"""선언형 추출 스펙 → 브라우저에서는 execute_script 한 번, HTTP 경로에서는 lxml 로 같은 결과를 만든다.
+
+스펙 형식
+    {
+      "rows":     CSS 또는 None   (None 이면 문서 전체가 레코드 하나)
+      "fields":   {이름: [(선택자, 속성), ...]}   후보를 순서대로 시도해 처음 나온 비어 있지 않은 값
+      "required": [이름, ...]                    값이 없으면 그 행은 버림 ("a|b" 는 둘 중 하나만 있어도 됨)
+      "skip":     [(선택자, 속성, 포함문자열), ...] 행 제외 조건 (예: 공지)
+      "regex":    {이름: (패턴, "first"|"max", "html"|"text")}  문서 전체 대상 (rows=None 일 때만)
+      "gone":     [(선택자, 속성, 포함문자열), ...] 레코드가 하나도 없을 때 이 조건이 맞으면 삭제/없는 글
+                                                 → PostGone (필수 필드를 더 기다리지 않고 바로 포기).
+                                                 브라우저 경로에서만 본다: HTTP 응답은 JS 렌더링 전이라
+                                                 사이드바 등의 같은 문구로 정상 글을 버릴 수 있다
+      "name":     이름이 있으면 레코드마다 "_hit": {필드: 맞은 선택자} 를 붙인다 (crawler_selectors 가 학습)
+    }
+chain=True 면 스펙을 차례로 보고 레코드가 나온 스펙 다음은 평가하지 않는다 (빈 리스트) — 대체 스펙 사슬용.
+선택자: "" 는 행 자신, "/" "./" "(" 로 시작하면 XPath, 나머지는 CSS.
+속성: "text" | "href"(절대 URL) | "exists" | 그 밖의 HTML 속성명, "a|b" 는 차례대로 시도.
+"""
+import re, time
+from functools import lru_cache
+from urllib.parse import urljoin
+
+_WS_RE = re.compile(r"\s+")
+
+
+class PostGone(Exception):
+    """삭제되었거나 없는 글 (gone 조건이 맞음). 다시 시도해도 같으므로 재시도 대상이 아니다."""
+    def __init__(self, url, marker):
+        super().__init__(f"삭제/없는 글 ('{marker}')")
+        self.url, self.marker = url, marker
+
+
+def spec(rows=None, fields=None, required=(), skip=(), regex=None, gone=(), name=None):
+    return {"rows": rows, "fields": fields or {}, "required": list(required),
+            "skip": list(skip), "regex": regex or {}, "gone": list(gone), "name": name}
+
+
+def _check_gone(specs, url, results, gone):
+    """첫 번째 스펙(기다리는 대상)이 비었고 gone 조건이 맞았으면 PostGone."""
+    if specs and not (results and results[0]) and gone and gone[0]:
+        raise PostGone(url, gone[0])
+
+
+def _is_xpath(sel):
+    return sel.startswith(("/", "./", "("))
+
+
+# ---------------- 브라우저: execute_script 한 번 ----------------
+_EXTRACT_JS = r"""
+const specs = arguments[0], chain = arguments[1];
+const norm = s => (s || "").replace(/\s+/g, " ").trim();
+function sel(root, q) {
+  if (q === "") return [root];
+  if (q[0] === "/" || q.startsWith("./") || q[0] === "(") {
+    const r = document.evaluate(q, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const out = [];
+    for (let i = 0; i < r.snapshotLength; i++) out.push(r.snapshotItem(i));
+    return out;
+  }
+  return Array.from(root.querySelectorAll(q));
+}
+function val(el, attr) {
+  for (const a of attr.split("|")) {
+    if (a === "exists") return true;
+    let v = "";
+    if (a === "text") v = norm(el.innerText !== undefined ? el.innerText : el.textContent);
+    else if (a === "href") v = el.href || "";
+    else v = norm(el.getAttribute(a));
+    if (v) return v;
+  }
+  return "";
+}
+function field(root, cands) {
+  for (const [q, attr] of cands) {
+    let els;
+    try { els = sel(root, q); } catch (e) { continue; }
+    if (!els.length) continue;
+    const v = val(els[0], attr);
+    if (v) return [v, q];
+  }
+  return [null, null];
+}
+function matched(row, rules) {
+  for (const [q, attr, needle] of rules) {
+    let els;
+    try { els = sel(row, q); } catch (e) { continue; }
+    if (els.some(e => String(val(e, attr) || "").includes(needle))) return needle;
+  }
+  return null;
+}
+function regex(name, pat, mode, src, cache) {
+  if (!(src in cache)) cache[src] = src === "text" ? (document.body ? document.body.innerText : "")
+                                                   : document.documentElement.outerHTML;
+  const s = cache[src];
+  if (mode === "max") {
+    let best = null;
+    for (const m of s.matchAll(new RegExp(pat, "g"))) {
+      const n = parseInt((m[1] || m[0]).replace(/[^\d]/g, ""), 10);
+      if (!isNaN(n) && (best === null || n > best)) best = n;
+    }
+    return best;
+  }
+  const m = s.match(new RegExp(pat));
+  return m ? (m[1] !== undefined ? m[1] : m[0]) : null;
+}
+const cache = {};
+let found = false;
+const results = specs.map(sp => {
+  if (chain && found) return [];
+  const roots = sp.rows ? Array.from(document.querySelectorAll(sp.rows)) : [document];
+  const out = [];
+  for (const root of roots) {
+    if (sp.skip.length && matched(root, sp.skip)) continue;
+    const rec = {}, hit = {};
+    for (const [name, cands] of Object.entries(sp.fields)) [rec[name], hit[name]] = field(root, cands);
+    if (sp.name) rec._hit = hit;
+    if (!sp.rows)
+      for (const [name, [pat, mode, src]] of Object.entries(sp.regex)) rec[name] = regex(name, pat, mode, src, cache);
+    if (sp.required.every(n => n.split("|").some(k => rec[k]))) out.push(rec);
+  }
+  found = found || out.length > 0;
+  return out;
+});
+const gone = specs.map((sp, i) => results[i].length || !(sp.gone || []).length ? null : matched(document, sp.gone));
+return {url: location.href, results: results, gone: gone};
+"""
+
+
+def extract_driver(driver, specs, chain=False):
+    """스펙 목록을 한 번의 왕복으로 평가 → (현재 URL, [스펙별 레코드 리스트]). 삭제/없는 글이면 PostGone."""
+    res = driver.execute_script(_EXTRACT_JS, specs, chain) or {}
+    url, results = res.get("url") or driver.current_url, res.get("results") or [[] for _ in specs]
+    _check_gone(specs, url, results, res.get("gone"))
+    return url, results
+
+
+def extract_driver_wait(driver, specs, timeout=5.0, poll=0.25, chain=False):
+    """첫 번째 스펙에 레코드가 생길 때까지(= 필수 필드가 모두 렌더링될 때까지) 폴링. 매 폴링이 왕복 한 번.
+    그 전에 gone 조건(삭제 안내 등)이 보이면 timeout 을 기다리지 않고 PostGone."""
+    deadline = time.monotonic() + timeout
+    while True:
+        url, results = extract_driver(driver, specs, chain)
+        if results and results[0] or time.monotonic() >= deadline:
+            return url, results
+        time.sleep(poll)
+
+
+# ---------------- HTTP 경로: lxml ----------------
+@lru_cache(maxsize=256)
+def _compiled(sel):
+    from lxml import etree                  # HTTP 경로를 처음 쓸 때 불러온다
+    from lxml.cssselect import CSSSelector
+    return etree.XPath(sel) if _is_xpath(sel) else CSSSelector(sel)
+
+
+def _select(node, sel):
+    if sel == "": return [node]
+    try:
+        return _compiled(sel)(node)
+    except Exception:
+        return []
+
+
+def _value(el, attr, base):
+    for a in attr.split("|"):
+        if a == "exists": return True
+        if a == "text":
+            v = _WS_RE.sub(" ", el.text_content()).strip()
+        elif a == "href":
+            h = el.get("href")
+            v = urljoin(base, h.strip()) if h else ""
+        else:
+            v = _WS_RE.sub(" ", el.get(a) or "").strip()
+        if v: return v
+    return ""
+
+
+def _field(root, cands, base):
+    """→ (값, 맞은 선택자). 아무것도 안 맞으면 (None, None)."""
+    for q, attr in cands:
+        els = _select(root, q)
+        if not els: continue
+        v = _value(els[0], attr, base)
+        if v: return v, q
+    return None, None
+
+
+def _regex(pat, mode, src, text, doc):
+    s = text if src == "html" else doc.text_content()
+    if mode == "max":
+        best = None
+        for m in re.finditer(pat, s):
+            digits = re.sub(r"[^\d]", "", m.group(1) if m.groups() else m.group(0))
+            if digits and (best is None or int(digits) > best): best = int(digits)
+        return best
+    m = re.search(pat, s)
+    return (m.group(1) if m.groups() else m.group(0)) if m else None
+
+
+def _matched(root, rules, base):
+    for q, attr, needle in rules:
+        if any(needle in str(_value(e, attr, base) or "") for e in _select(root, q)): return needle
+    return None
+
+
+def extract_html(doc, base, text, specs, chain=False):
+    """extract_driver 와 같은 결과를 lxml 문서에서 만든다. gone 은 보지 않는다 (레코드가 없으면 브라우저로)."""
+    results = []
+    for sp in specs:
+        if chain and any(results):
+            results.append([]); continue
+        roots = _select(doc, sp["rows"]) if sp["rows"] else [doc]
+        out = []
+        for root in roots:
+            if sp["skip"] and _matched(root, sp["skip"], base):
+                continue
+            rec, hit = {}, {}
+            for name, cands in sp["fields"].items():
+                rec[name], hit[name] = _field(root, cands, base)
+            if sp.get("name"): rec["_hit"] = hit
+            if not sp["rows"]:
+                for name, (pat, mode, src) in sp["regex"].items():
+                    rec[name] = _regex(pat, mode, src, text or "", doc)
+            if all(any(rec.get(k) for k in n.split("|")) for n in sp["required"]): out.append(rec)
+        results.append(out)
+    return base, results
@@ -0,0 +1,130 @@
+"""브라우저 없이 목록/상세 페이지를 가져오는 HTTP 엔진 (keep-alive 커넥션 풀 + lxml 파서)."""
+import re, time, threading
+from email.utils import parsedate_to_datetime
+from importlib.util import find_spec
+from urllib.parse import urlparse
+
+# urllib3 는 selenium 의존성으로 함께 설치됨, lxml/cssselect 는 없으면 HTTP 경로를 끈다.
+# 설치 여부만 보고 실제 import 는 처음 쓸 때 (창이 뜨기 전에 불러오지 않도록)
+HTTP_AVAILABLE = all(find_spec(m) is not None for m in ("urllib3", "lxml", "cssselect"))
+
+DEFAULT_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36"),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# 봇 차단/JS 챌린지 페이지 표식 (본문 앞부분만 검사)
+CHALLENGE_MARKERS = (
+    "cf-browser-verification", "challenge-platform", "cf_chl_", "just a moment...",
+    "attention required!", "g-recaptcha", "hcaptcha", "ddos protection",
+    "보안 시스템", "자동등록방지", "enable javascript",
+)
+# 잠시 뒤 HTTP 로 다시 시도할 응답 (감속/서버 오류). 브라우저로 연다고 나아지지 않는다.
+RETRY_STATUS = (429, 500, 502, 503, 504)
+_CHARSET_RE = re.compile(r"charset=([\w-]+)", re.I)
+
+
+class ServerBusy(Exception):
+    """429/5xx 가 재시도 뒤에도 계속됨 → 그 페이지 실패 (브라우저로 넘기지 않는다)."""
+
+
+class HttpPage:
+    def __init__(self, url, status, text, elapsed, retry_after=None):
+        self.url, self.status, self.text, self.elapsed = url, status, text, elapsed
+        self.retry_after = retry_after      # Retry-After 헤더(초), 없으면 None
+        self._doc = None
+
+    @property
+    def doc(self):
+        # 파싱은 실제로 필요할 때 한 번만
+        if self._doc is None:
+            import lxml.html
+            self._doc = lxml.html.document_fromstring(self.text or "<html></html>", base_url=self.url)
+        return self._doc
+
+
+def _challenge(page) -> bool:
+    head = page.text[:20000].lower()
+    return any(m in head for m in CHALLENGE_MARKERS)
+
+
+def needs_browser(page) -> bool:
+    """HTTP 응답이 비었거나 챌린지 페이지면 True (→ Selenium 폴백).
+    상태 코드만으로는 폴백하지 않는다: 429/5xx 는 transient(), 그 밖(403 등)은 골격이 없으면 파서가 None 을 준다."""
+    if page is None or not page.text: return True
+    return _challenge(page)
+
+
+def transient(page) -> bool:
+    """챌린지 없는 429/5xx → True (리미터 쿨다운 뒤 HTTP 로 다시)."""
+    return page is not None and page.status in RETRY_STATUS and not (page.text and _challenge(page))
+
+
+def _retry_after(value):
+    """Retry-After: 초 또는 HTTP 날짜 → 초 (못 읽으면 None)."""
+    if not value: return None
+    value = value.strip()
+    if value.isdigit(): return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+class HttpEngine:
+    """호스트별 keep-alive 커넥션 풀. 여러 스레드에서 공유해도 안전하다."""
+    def __init__(self, timeout=10.0, retries=1, maxsize=8):
+        if not HTTP_AVAILABLE:
+            raise RuntimeError("HTTP 엔진에 필요한 모듈이 없습니다. 설치:  pip install lxml cssselect")
+        import urllib3
+        self.pool = urllib3.PoolManager(
+            num_pools=16, maxsize=maxsize, block=False, headers=DEFAULT_HEADERS,
+            timeout=urllib3.Timeout(connect=5.0, read=timeout),
+            retries=urllib3.Retry(total=retries, redirect=5, raise_on_status=False),
+        )
+        self._cookies = {}          # host -> {name: value}
+        self._lock = threading.Lock()
+
+    def _cookie_header(self, host):
+        with self._lock:
+            jar = self._cookies.get(host)
+            return "; ".join(f"{k}={v}" for k, v in jar.items()) if jar else ""
+
+    def _store_cookies(self, host, resp):
+        raw = resp.headers.getlist("Set-Cookie") if hasattr(resp.headers, "getlist") else []
+        if not raw: return
+        with self._lock:
+            jar = self._cookies.setdefault(host, {})
+            for c in raw:
+                name, _, value = c.split(";", 1)[0].partition("=")
+                if name.strip(): jar[name.strip()] = value.strip()
+
+    def get(self, url, referer=None):
+        """GET 한 번. 네트워크 오류면 None."""
+        host = urlparse(url).netloc.lower()
+        headers = {}
+        cookie = self._cookie_header(host)
+        if cookie: headers["Cookie"] = cookie
+        if referer: headers["Referer"] = referer
+        t0 = time.perf_counter()
+        try:
+            resp = self.pool.request("GET", url, headers=headers or None)
+        except Exception:
+            return None
+        elapsed = time.perf_counter() - t0
+        self._store_cookies(host, resp)
+        m = _CHARSET_RE.search(resp.headers.get("Content-Type", ""))
+        try:
+            text = resp.data.decode(m.group(1) if m else "utf-8", errors="replace")
+        except LookupError:
+            text = resp.data.decode("utf-8", errors="replace")
+        final_url = getattr(resp, "url", None) or resp.geturl() or url
+        if final_url.startswith("/"):
+            final_url = f"{urlparse(url).scheme}://{host}{final_url}"
+        return HttpPage(final_url, resp.status, text, elapsed, _retry_after(resp.headers.get("Retry-After")))
+
+    def close(self):
+        self.pool.clear()
@@ -0,0 +1,64 @@
+"""글 주소 → 사이트별 정식 주소/글 번호, 그리고 실행(또는 일괄 실행) 전체의 중복 글 거르기.
+
+같은 글이 여러 주소로 보인다: FMK '/1234567' 과 '/index.php?mid=best&document_srl=1234567',
+DC '...&no=1&page=3' 과 '...&no=1&search_head=0', 링크마다 붙는 '#comment'. 비교는 항상 글 번호로 한다.
+"""
+import re, threading
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+
+_FMK_ID_RE = re.compile(r"(?:[?&]document_srl=|/)(\d{5,})(?:$|[?#&/])")
+_TQ_ID_RE  = re.compile(r"(?:[?&]document_srl=|/)(\d{4,})(?:$|[?#&/])")
+_TAIL_ID_RE = re.compile(r"/\d{4,}$")
+DC_KEEP = ("id", "no")     # DC 글 주소에서 남길 파라미터
+
+
+def post_id(site: str, url: str) -> str | None:
+    """사이트별 글 번호. FMK/TheQoo 는 document_srl(경로 숫자), DC 는 갤러리 id + no."""
+    if not url: return None
+    if site == "DCInside":
+        q = parse_qs(urlparse(url).query)
+        no = (q.get("no") or [""])[0]
+        return f"{(q.get('id') or [''])[0]}:{no}" if no.isdigit() else None
+    m = (_FMK_ID_RE if site == "FMKorea" else _TQ_ID_RE).search(url)
+    return m.group(1) if m else None
+
+
+def canonical_link(site: str, url: str) -> str:
+    """출력/비교에 쓰는 정식 주소. 호스트 소문자, fragment 제거, 글과 상관없는 파라미터 제거.
+    글 번호를 못 찾으면 fragment 만 떼고 그대로."""
+    if not url: return url
+    p = urlparse(url)
+    parts = [p.scheme, p.netloc.lower(), p.path, "", "", ""]
+    pid = post_id(site, url)
+    if pid is None:
+        parts[4] = p.query
+    elif site == "DCInside":
+        q = parse_qs(p.query)
+        parts[4] = urlencode([(k, q[k][0]) for k in DC_KEEP if k in q])
+    elif not _TAIL_ID_RE.search(p.path):
+        # index.php?mid=hot&document_srl=N → /hot/N (mid 가 없으면 /N)
+        mid = (parse_qs(p.query).get("mid") or [""])[0]
+        parts[2] = f"/{mid}/{pid}" if mid else f"/{pid}"
+    return urlunparse(parts)
+
+
+class PostDedup:
+    """이미 내보낸 글 (사이트, 글 번호). 일괄 실행에서는 작업들이 하나를 함께 쓴다 (스레드 안전).
+    hits: 이미 내보낸 글을 다시 만나 건너뛴 횟수."""
+    def __init__(self):
+        self._ids, self.hits = set(), 0
+        self._lock = threading.Lock()
+
+    def seen(self, site, link) -> bool:
+        key = (site, post_id(site, link) or link)
+        with self._lock:
+            if key in self._ids:
+                self.hits += 1
+                return True
+            return False
+
+    def claim(self, site, link):
+        with self._lock: self._ids.add((site, post_id(site, link) or link))
+
+    def __len__(self):
+        return len(self._ids)
@@ -0,0 +1,185 @@
+"""증분 수집용 SQLite 글 인덱스 (사이트 + 글 번호 → 마지막으로 수집한 행) 와 게시판별 수집 범위."""
+import sqlite3, threading
+from datetime import datetime
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+
+from crawler_time import ISO as _ISO, to_iso, from_iso as _dt
+from crawler_ids import post_id, PostDedup
+
+
+def board_key(list_url: str) -> str:
+    """page 파라미터를 뺀 목록 URL (같은 게시판이면 같은 키)."""
+    parts = list(urlparse(list_url))
+    q = {k: v for k, v in parse_qs(parts[4], keep_blank_values=True).items() if k != "page"}
+    parts[1] = parts[1].lower()
+    parts[4] = urlencode(sorted(q.items()), doseq=True)
+    parts[5] = ""
+    return urlunparse(parts)
+
+
+class PostIndex:
+    """여러 스레드/실행이 함께 써도 되는 글 인덱스."""
+    def __init__(self, path):
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._lock = threading.Lock()
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("""CREATE TABLE IF NOT EXISTS posts (
+                site TEXT, post_id TEXT, board TEXT, title TEXT, date_text TEXT, date_iso TEXT,
+                views INTEGER, link TEXT, first_seen TEXT, last_seen TEXT,
+                PRIMARY KEY (site, post_id))""")
+            self._db.execute("CREATE INDEX IF NOT EXISTS posts_board_date ON posts (site, board, date_iso)")
+            self._db.execute("""CREATE TABLE IF NOT EXISTS boards (
+                site TEXT, board TEXT, low_water TEXT, high_water TEXT, last_run TEXT,
+                PRIMARY KEY (site, board))""")
+
+    @staticmethod
+    def complete(row) -> bool:
+        """제목/날짜가 확정된 행이면 상세를 다시 열 필요가 없다."""
+        return bool(row and row.get("_dt") and row.get("Title") and row["Title"] != "제목 없음")
+
+    def lookup(self, site, ids):
+        """{post_id: row} — 저장된 것만."""
+        ids = [i for i in ids if i]
+        if not ids: return {}
+        out = {}
+        with self._lock:
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                q = f"SELECT post_id, title, date_text, date_iso, views, link FROM posts WHERE site=? AND post_id IN ({','.join('?' * len(chunk))})"
+                for pid, title, date_text, date_iso, views, link in self._db.execute(q, [site, *chunk]):
+                    out[pid] = {"Site": site, "Title": title, "Date": date_text, "Views": views, "Link": link,
+                                "_dt": _dt(date_iso)}
+        return out
+
+    def store(self, site, board, rows):
+        now = datetime.now().strftime(_ISO)
+        data = []
+        for r in rows:
+            pid = post_id(site, r.get("Link"))
+            if pid:
+                data.append((site, pid, board, r.get("Title"), r.get("Date"), to_iso(r.get("_dt")),
+                             r.get("Views"), r.get("Link"), now, now))
+        if not data: return
+        with self._lock, self._db:
+            self._db.executemany("""INSERT INTO posts VALUES (?,?,?,?,?,?,?,?,?,?)
+                ON CONFLICT(site, post_id) DO UPDATE SET
+                    title=excluded.title, date_text=excluded.date_text, date_iso=excluded.date_iso,
+                    views=COALESCE(excluded.views, posts.views), link=excluded.link, last_seen=excluded.last_seen""",
+                                 data)
+
+    def rows_between(self, site, board, lo: datetime, hi: datetime | None = None):
+        q = "SELECT title, date_text, date_iso, views, link FROM posts WHERE site=? AND board=? AND date_iso >= ?"
+        args = [site, board, lo.strftime(_ISO)]
+        if hi is not None:
+            q += " AND date_iso <= ?"; args.append(hi.strftime(_ISO))
+        with self._lock:
+            cur = self._db.execute(q + " ORDER BY date_iso DESC", args)
+            return [{"Site": site, "Title": t, "Date": d, "Views": v, "Link": l, "_dt": _dt(iso)}
+                    for t, d, iso, v, l in cur]
+
+    def coverage(self, site, board):
+        """(low_water, high_water): 이전 실행들이 빈틈 없이 수집한 시각 범위. 없으면 (None, None)."""
+        with self._lock:
+            r = self._db.execute("SELECT low_water, high_water FROM boards WHERE site=? AND board=?",
+                                 (site, board)).fetchone()
+        return (_dt(r[0]), _dt(r[1])) if r else (None, None)
+
+    def finish_run(self, site, board, covered_low: datetime | None, newest: datetime | None):
+        """이번 실행이 [covered_low, newest] 를 빈틈 없이 훑었다. 이전 범위와 겹치면 합친다."""
+        if covered_low is None or newest is None: return
+        low, high = self.coverage(site, board)
+        if low is not None and high is not None and covered_low <= high:
+            covered_low, newest = min(low, covered_low), max(high, newest)
+        with self._lock, self._db:
+            self._db.execute("""INSERT INTO boards VALUES (?,?,?,?,?)
+                ON CONFLICT(site, board) DO UPDATE SET
+                    low_water=excluded.low_water, high_water=excluded.high_water, last_run=excluded.last_run""",
+                             (site, board, covered_low.strftime(_ISO), newest.strftime(_ISO),
+                              datetime.now().strftime(_ISO)))
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class BoardRun:
+    """게시판 한 번 수집하는 동안의 인덱스 사용: 이미 아는 글 건너뛰기, 아는 구간에 닿으면 멈추기."""
+    def __init__(self, index, site, list_url, cutoff, dedup=None):
+        self.index, self.site, self.cutoff = index, site, cutoff
+        self.dedup = dedup if dedup is not None else PostDedup()   # 일괄 실행이면 작업들이 공유
+        self.dup_hits = 0
+        self.board = board_key(list_url)
+        self.low, self.high = index.coverage(site, self.board) if index else (None, None)
+        self.newest = self.oldest = None
+        self.emitted = set()
+        self.reused = 0
+        self.missed = 0     # 끝내 읽지 못한 글 (상세 최종 실패/한도로 건너뜀) → 수집 범위를 기록하지 않는다
+
+    def known(self, links):
+        """{link: 저장된 완결 행} — 상세를 다시 열지 않아도 되는 글."""
+        if self.index is None: return {}
+        ids = {l: post_id(self.site, l) for l in links}
+        stored = self.index.lookup(self.site, list(ids.values()))
+        out = {l: dict(stored[i], Link=l) for l, i in ids.items() if i in stored and PostIndex.complete(stored[i])}
+        self.reused += len(out)
+        return out
+
+    def page_is_known_past(self, links) -> bool:
+        """목록 한 페이지가 전부 이미 알고 있는 글이고, 이전 실행의 high-water 보다 오래되었으며,
+        그 아래 구간을 이전 실행들이 cutoff 까지 이미 훑었으면 True (→ 더 넘길 필요 없음)."""
+        if self.index is None or not links or self.high is None or self.low is None: return False
+        if self.low > self.cutoff: return False
+        ids = [post_id(self.site, l) for l in links]
+        if not all(ids): return False
+        stored = self.index.lookup(self.site, ids)
+        if len(stored) < len(set(ids)): return False
+        dts = [r["_dt"] for r in stored.values()]
+        return all(d is not None and d < self.high for d in dts)
+
+    def covered_until(self):
+        """이전 실행들이 cutoff 까지 빈틈 없이 훑었으면 그 위쪽 경계(high-water) → 그보다 오래된 글은 인덱스에 있다."""
+        if self.index is None or self.low is None or self.high is None or self.low > self.cutoff: return None
+        return self.high
+
+    def seen(self, row, dt):
+        if dt is None: return
+        self.newest = dt if self.newest is None or dt > self.newest else self.newest
+        self.oldest = dt if self.oldest is None or dt < self.oldest else self.oldest
+        pid = post_id(self.site, row.get("Link"))
+        if pid: self.emitted.add(pid)
+
+    def is_dup(self, link) -> bool:
+        """이번 실행(일괄이면 다른 작업 포함)에서 이미 내보낸 글 → 상세도 열지 않고 건너뛴다."""
+        if self.dedup.seen(self.site, link):
+            self.dup_hits += 1
+            return True
+        return False
+
+    def miss(self, link):
+        """목록에는 있었지만 결과에도 인덱스에도 넣지 못한 글."""
+        self.missed += 1
+
+    def claim(self, link):
+        """결과로 내보낸 글 등록."""
+        self.dedup.claim(self.site, link)
+
+    def store(self, rows):
+        if self.index is not None: self.index.store(self.site, self.board, rows)
+
+    def backfill(self):
+        """아는 구간에서 멈췄을 때, 이번에 내보내지 않은 cutoff 이후 글을 인덱스에서 채운다."""
+        if self.index is None: return []
+        out = []
+        for r in self.index.rows_between(self.site, self.board, self.cutoff):
+            pid = post_id(self.site, r["Link"])
+            if pid and pid not in self.emitted and not self.is_dup(r["Link"]):
+                self.emitted.add(pid); self.claim(r["Link"]); out.append(r)
+        return out
+
+    def finish(self, covered_low):
+        """빠진 글 없이 훑었을 때만 수집 범위를 넓힌다 (빠진 글이 있으면 다음 실행이 그 구간을 다시 읽는다)."""
+        if self.index is not None and not self.missed:
+            self.index.finish_run(self.site, self.board, covered_low, self.newest)
@@ -0,0 +1,104 @@
+"""긴 수집의 체크포인트 저널 (JSONL, append-only). 목록 페이지 하나가 끝날 때마다 그 페이지의 행과
+진행 상태를 한 번에 기록하고 fsync 한다. 중간에 죽으면 마지막으로 끝난 페이지 다음부터 이어서 수집한다."""
+import os, json, hashlib
+from datetime import datetime
+
+from crawler_time import to_iso, from_iso
+from crawler_rows import RowStore
+
+
+def journal_path(root, site, board):
+    h = hashlib.sha1(f"{site}|{board}".encode("utf-8")).hexdigest()[:12]
+    return os.path.join(root, f"{site}_{h}.jsonl")
+
+
+class CrawlJournal:
+    """기록 형식 (한 줄에 하나):
+        {"t": "start", "site", "list_url", "cutoff", "ts"}
+        {"t": "row",   "row": {...}}                 # 아직 끝나지 않은 페이지의 행 (_dt → "DateISO" 문자열)
+        {"t": "page",  "page": N, "state": {...}}    # 여기까지의 행이 확정
+        {"t": "done"}
+    """
+    def __init__(self, path):
+        self.path = path
+        self.cutoff = None
+        self.last_page, self.state, self.rows = 0, {}, RowStore()   # 확정된 행 (열 단위)
+        self._f = None
+
+    @classmethod
+    def open(cls, root, site, list_url, board, cutoff: datetime, resume=False):
+        """resume=True 이고 완료된 페이지가 있는 끝나지 않은 저널이 있으면 이어서, 아니면 새로 시작.
+        이어갈 때는 처음 실행의 cutoff 를 그대로 쓴다 (self.cutoff). 마지막 page 기록 뒤(끝나지 않은 페이지의 행,
+        기록 도중 끊긴 줄)는 잘라낸 뒤 이어 쓴다 — 그래야 다음 재개에서 새 기록이 읽힌다."""
+        os.makedirs(root, exist_ok=True)
+        j = cls(journal_path(root, site, board))
+        end = j._load() if resume else None
+        if end is not None and j.last_page > 0:
+            j._f = open(j.path, "r+b")
+            j._f.truncate(end); j._f.close()
+            j._f = open(j.path, "a", encoding="utf-8")
+            return j
+        j.cutoff, j.last_page, j.state, j.rows = cutoff, 0, {}, RowStore()
+        j._f = open(j.path, "w", encoding="utf-8")
+        j._write({"t": "start", "site": site, "list_url": list_url,
+                  "cutoff": to_iso(cutoff), "ts": to_iso(datetime.now())}, sync=True)
+        return j
+
+    def _load(self):
+        """마지막 page 기록까지 복구 → 그 기록이 끝나는 바이트 위치 (start 만 있으면 start 끝).
+        끝난(done) 저널이거나 없으면 None."""
+        try:
+            f = open(self.path, "rb")
+        except OSError:
+            return None
+        pending, started, done, end, pos = [], False, False, 0, 0
+        with f:
+            for line in f:
+                pos += len(line)
+                try:
+                    if not line.endswith(b"\n"): raise ValueError
+                    rec = json.loads(line)
+                except ValueError:
+                    break   # 기록 도중 죽은 마지막 줄
+                t = rec.get("t")
+                if t == "start":
+                    started, end = True, pos
+                    self.cutoff = from_iso(rec["cutoff"])
+                elif t == "row":
+                    row = rec["row"]; row["_dt"] = from_iso(row.pop("DateISO", None))
+                    pending.append(row)
+                elif t == "page":
+                    self.rows += pending; pending = []
+                    self.last_page, self.state = rec["page"], rec.get("state") or {}
+                    end = pos
+                elif t == "done":
+                    done = True
+        return end if started and not done else None
+
+    @property
+    def resumed(self) -> bool:
+        return self.last_page > 0
+
+    def _write(self, rec, sync=False):
+        self._f.write(json.dumps(rec, ensure_ascii=False, default=str) + "\n")
+        if sync:
+            self._f.flush(); os.fsync(self._f.fileno())
+
+    def page_done(self, page, rows, **state):
+        """페이지 하나 완료: 그 페이지에서 나온 행들과 진행 상태를 기록."""
+        for r in rows:
+            row = {k: v for k, v in r.items() if not k.startswith("_")}
+            row["DateISO"] = to_iso(r.get("_dt"))
+            self._write({"t": "row", "row": row})
+        self._write({"t": "page", "page": page, "state": state}, sync=True)
+        self.last_page, self.state = page, state
+
+    def finish(self):
+        """내보내기까지 끝났을 때 호출 → 다음 실행에서 이어가지 않는다."""
+        if self._f is None: return
+        self._write({"t": "done"}, sync=True)
+        self.close()
+
+    def close(self):
+        if self._f is not None:
+            self._f.close(); self._f = None
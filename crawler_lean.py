@@ -0,0 +1,83 @@
+"""가벼운 페이지 로딩 (lean): eager 로딩 + 이미지/미디어/폰트/광고·분석 요청 차단 (CDP Network.setBlockedURLs).
+우리가 읽는 것은 제목/날짜/조회수 텍스트뿐이라 나머지 요청은 기다릴 필요가 없다.
+
+세 사이트 모두 읽는 텍스트가 차단하는 요청에 기대지 않아 사이트별 예외는 두지 않는다.
+lean 상태에서 추출 결과가 비면 그 호스트는 이번 실행 동안 lean 옵션 없이 띄운 드라이버(이미지 설정/eager 포함
+전부 기본값)로 다시 연다 (full_load → Fetcher.get_driver). 실행이 시작될 때 reset() 으로 비운다
+(GUI/데몬처럼 한 프로세스에서 여러 번 실행해도 한 번의 실패가 계속 남지 않도록).
+"""
+import threading
+from urllib.parse import urlparse
+
+LEAN_BLOCK_RESOURCES = (
+    # 이미지
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.bmp*", "*.ico*", "*.svg*",
+    # 폰트
+    "*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*",
+    # 영상/음성
+    "*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*", "*.m4a*", "*.ogg*",
+)
+LEAN_BLOCK_DOMAINS = (
+    # 광고
+    "*doubleclick.net*", "*googlesyndication.com*", "*googleadservices.com*", "*adservice.google.*",
+    "*adnxs.com*", "*criteo.*", "*taboola.com*", "*outbrain.com*", "*dable.io*", "*mobon.net*",
+    "*adpnut.com*", "*realclick.co.kr*", "*tenping.kr*",
+    # 분석
+    "*google-analytics.com*", "*googletagmanager.com*", "*scorecardresearch.com*", "*facebook.net*",
+    "*wcs.naver.net*", "*analytics.*",
+    # 영상 임베드
+    "*youtube.com/embed*", "*ytimg.com*", "*player.vimeo.com*", "*tv.naver.com/embed*",
+)
+_full_hosts = set()         # lean 에서 결과가 비어 전체 로딩으로 돌린 호스트
+_lock = threading.Lock()
+
+
+def lean_options(options):
+    """드라이버 생성 전 Options 에 적용."""
+    options.page_load_strategy = "eager"     # DOMContentLoaded 까지만 기다림
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+        "profile.default_content_setting_values.media_stream": 2,
+        "profile.default_content_setting_values.popups": 2,
+        "plugins.always_open_pdf_externally": True,
+    })
+    for a in ("--blink-settings=imagesEnabled=false", "--mute-audio", "--disable-extensions",
+              "--disable-plugins", "--autoplay-policy=user-gesture-required", "--disable-background-networking"):
+        options.add_argument(a)
+    return options
+
+
+def _host(url):
+    return urlparse(url).netloc.lower()
+
+
+def blocked_for(url) -> tuple:
+    return () if full_load(url) else LEAN_BLOCK_RESOURCES + LEAN_BLOCK_DOMAINS
+
+
+def full_load(url) -> bool:
+    """이 호스트는 lean 이 아닌 드라이버로 열어야 하는가 (disable_for 이후)."""
+    with _lock: return _host(url) in _full_hosts
+
+
+def apply(driver, url) -> bool:
+    """url 을 열기 전에 호출. 차단 목록이 바뀔 때만 CDP 왕복. → lean 차단이 켜진 상태면 True"""
+    if not getattr(driver, "lean", False): return False
+    pats = blocked_for(url)
+    if getattr(driver, "lean_patterns", None) != pats:
+        if getattr(driver, "lean_patterns", None) is None:
+            driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(pats)})
+        driver.lean_patterns = pats
+    return bool(pats)
+
+
+def disable_for(url):
+    """이 호스트는 이번 실행 동안 전체 로딩 (lean 옵션 없는 드라이버)."""
+    with _lock: _full_hosts.add(_host(url))
+
+
+def reset():
+    """새 실행 시작: 모든 호스트를 다시 lean 으로 (run_single / run_batch 가 부른다)."""
+    with _lock: _full_hosts.clear()
@@ -0,0 +1,82 @@
+"""협조적 중단과 실행 한도: 취소 버튼/신호, 마감 시간(분), 최대 목록 페이지 수, 최대 행 수.
+
+크롤러는 목록 페이지마다(check), 상세를 하나 열기 전마다(guard) 확인한다. 이미 시작한 요청은 끝까지 기다린다.
+한도에 닿으면 그때까지 모은 행을 정상적으로 내보내고 파일에 '일부만 수집(partial)' 표시를 남긴다.
+
+    limits = Limits(minutes=50, rows=5000, cancel=stop_event)   # 작업 하나에 하나 (시계는 만들 때부터)
+    limits.fresh(pages=10, rows=0)                               # 같은 취소 이벤트, 새 시계/카운터 (일괄 작업마다)
+"""
+import time, threading
+
+
+class Stopped(Exception):
+    """한도/취소로 열지 않은 상세 (재시도 대상 아님)."""
+
+
+class Limits:
+    def __init__(self, minutes=None, pages=None, rows=None, cancel=None):
+        self.minutes, self.max_pages, self.max_rows = minutes or None, pages or None, rows or None
+        self.cancel = cancel if cancel is not None else threading.Event()
+        self.deadline = time.monotonic() + self.minutes * 60 if self.minutes else None
+        self.pages = self.rows = 0
+        self.reason = None
+
+    def fresh(self, minutes=None, pages=None, rows=None):
+        """같은 취소 이벤트를 쓰는 새 한도 (값을 주면 그 항목만 바꾼다, 0 은 그 항목 한도 없음)."""
+        keep = lambda v, old: old if v is None else v
+        return Limits(keep(minutes, self.minutes), keep(pages, self.max_pages), keep(rows, self.max_rows), self.cancel)
+
+    def stop(self):
+        """취소 (다른 스레드에서 불러도 됨). 같은 이벤트를 쓰는 모든 작업이 멈춘다."""
+        self.cancel.set()
+
+    def check(self):
+        """멈춰야 하면 사유, 아니면 None. 한 번 정해진 사유는 바뀌지 않는다."""
+        if self.reason is None:
+            if self.cancel.is_set(): self.reason = "취소"
+            elif self.deadline is not None and time.monotonic() >= self.deadline: self.reason = f"시간 한도 {self.minutes}분"
+            elif self.max_pages and self.pages >= self.max_pages: self.reason = f"페이지 한도 {self.max_pages}쪽"
+            elif self.max_rows and self.rows >= self.max_rows: self.reason = f"행 한도 {self.max_rows}건"
+        return self.reason
+
+    def halt(self, reason):
+        """더 이어갈 수 없어 멈춤 (목록 페이지를 못 읽음 등). 이미 정해진 사유가 있으면 그대로 둔다."""
+        if self.check() is None: self.reason = reason
+
+    def page(self):
+        self.pages += 1
+
+    def more_pages(self) -> bool:
+        """지금 페이지 다음 목록 페이지도 볼 수 있으면 True (다음 페이지를 미리 가져올지 판단)."""
+        return not self.check() and not (self.max_pages and self.pages + 1 >= self.max_pages)
+
+    def pages_left(self):
+        """더 볼 수 있는 목록 페이지 수 (페이지 한도가 없으면 None)."""
+        return max(0, self.max_pages - self.pages) if self.max_pages else None
+
+    def allow(self) -> bool:
+        """행 하나를 더 내보내도 되면 True (세면서). 거절하면 그때부터 사유가 정해진다."""
+        if self.max_rows and self.rows >= self.max_rows:
+            self.check(); return False
+        self.rows += 1
+        return True
+
+    def take(self, rows):
+        """행 한도 안쪽만 (넘치는 부분은 버린다)."""
+        cut = self.max_rows and len(rows) > self.max_rows - self.rows
+        if cut: rows = rows[:max(0, self.max_rows - self.rows)]
+        self.rows += len(rows)
+        if cut: self.check()
+        return rows
+
+    def guard(self, fn):
+        """fn(fetcher, url) 앞에서 한도 확인 → 넘었으면 Stopped (DetailPool 에서는 결과 자리에 예외로)."""
+        def run(fetcher, url):
+            if self.check(): raise Stopped(self.reason)
+            return fn(fetcher, url)
+        return run
+
+    def describe(self):
+        parts = [f"{self.minutes}분" if self.minutes else "", f"{self.max_pages}쪽" if self.max_pages else "",
+                 f"{self.max_rows}건" if self.max_rows else ""]
+        return " / ".join(p for p in parts if p) or "없음"
@@ -0,0 +1,167 @@
+"""단계별 성능 계측: (사이트, 단계) 마다 횟수/지연 히스토그램, 이벤트 카운터, 실행 보고서, 프로파일러.
+
+    with METRICS.time("FMK", "page_load"): driver.get(url)
+    METRICS.count("FMK", "http_fallback")
+    snap = METRICS.snapshot(); ...; report = METRICS.report(since=snap)   # 이번 실행분만
+    write_report(path, report); write_prometheus(path)                      # JSON / Prometheus textfile
+
+단계 이름 (PHASES): 드라이버 기동, 페이지 로딩, 명시적 대기 + 브라우저 추출, HTTP 요청, 파싱, 속도 제한 대기,
+내보내기 쓰기/마무리(워터마크 포함). 사이트 라벨은 Fetcher 태그(FMK/DC/TQ), 사이트와 무관하면 "all".
+"""
+import os, json, time, threading
+from contextlib import contextmanager
+
+PHASES = {
+    "driver_start":  "Chrome 기동 (initialize_driver)",
+    "page_load":     "브라우저 driver.get",
+    "wait_extract":  "명시적 대기 + 브라우저 추출 (extract_driver_wait)",
+    "http_get":      "HTTP 요청",
+    "parse":         "HTML 파싱 + 행 만들기",
+    "rate_wait":     "속도 제한 대기",
+    "export_write":  "내보내기 파일에 행 쓰기",
+    "export_close":  "내보내기 마무리 (워터마크, 저장)",
+}
+# 히스토그램 경계 (초). 마지막은 +Inf
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Histogram:
+    __slots__ = ("counts", "n", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.n, self.sum, self.max = 0, 0.0, 0.0
+
+    def observe(self, v):
+        i = next((i for i, b in enumerate(BUCKETS) if v <= b), len(BUCKETS))
+        self.counts[i] += 1; self.n += 1; self.sum += v
+        if v > self.max: self.max = v
+
+    def copy(self):
+        h = Histogram()
+        h.counts, h.n, h.sum, h.max = list(self.counts), self.n, self.sum, self.max
+        return h
+
+    def minus(self, other):
+        """이번 실행분 (max 는 누적값 그대로 — 히스토그램에서 되돌릴 수 없음)."""
+        h = self.copy()
+        if other is not None:
+            h.counts = [a - b for a, b in zip(self.counts, other.counts)]
+            h.n, h.sum = self.n - other.n, self.sum - other.sum
+        return h
+
+    def quantile(self, q):
+        """버킷 안에서 선형 보간한 근사값 (초)."""
+        if not self.n: return 0.0
+        rank, acc = q * self.n, 0
+        for i, c in enumerate(self.counts):
+            if c and acc + c >= rank:
+                lo = BUCKETS[i - 1] if i else 0.0
+                hi = BUCKETS[i] if i < len(BUCKETS) else self.max
+                return min(self.max, lo + (hi - lo) * (rank - acc) / c)
+            acc += c
+        return self.max
+
+    def summary(self):
+        ms = lambda s: round(s * 1000, 1)
+        return {"count": self.n, "total_s": round(self.sum, 3), "mean_ms": ms(self.sum / self.n) if self.n else 0.0,
+                "p50_ms": ms(self.quantile(0.5)), "p95_ms": ms(self.quantile(0.95)), "max_ms": ms(self.max)}
+
+
+class Metrics:
+    """프로세스 하나에 하나 (METRICS). 여러 스레드/실행이 함께 쓴다."""
+    def __init__(self):
+        self._hist, self._counters = {}, {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def observe(self, site, phase, seconds):
+        with self._lock:
+            h = self._hist.get((site, phase))
+            if h is None: h = self._hist[(site, phase)] = Histogram()
+            h.observe(seconds)
+
+    @contextmanager
+    def time(self, site, phase):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(site, phase, time.perf_counter() - t0)
+
+    def count(self, site, name, n=1):
+        with self._lock:
+            self._counters[(site, name)] = self._counters.get((site, name), 0) + n
+
+    def snapshot(self):
+        with self._lock:
+            return {k: h.copy() for k, h in self._hist.items()}, dict(self._counters), time.time()
+
+    def report(self, since=None, **info):
+        """{"phases": {site: {phase: 요약}}, "counters": {site: {name: n}}} — since 이후 분만."""
+        hist0, cnt0, t0 = since or ({}, {}, self.started)
+        hist, cnt, t1 = self.snapshot()
+        phases, counters = {}, {}
+        for (site, phase), h in sorted(hist.items()):
+            d = h.minus(hist0.get((site, phase)))
+            if d.n: phases.setdefault(site, {})[phase] = d.summary()
+        for (site, name), n in sorted(cnt.items()):
+            d = n - cnt0.get((site, name), 0)
+            if d: counters.setdefault(site, {})[name] = d
+        return dict(info, started=_iso(t0), finished=_iso(t1), wall_s=round(t1 - t0, 3),
+                    phases=phases, counters=counters)
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition (누적값)."""
+        hist, cnt, _ = self.snapshot()
+        out = ["# HELP crawler_phase_seconds 단계별 소요 시간", "# TYPE crawler_phase_seconds histogram"]
+        for (site, phase), h in sorted(hist.items()):
+            lab = f'site="{site}",phase="{phase}"'
+            acc = 0
+            for b, c in zip(BUCKETS + ("+Inf",), h.counts):
+                acc += c
+                out.append(f'crawler_phase_seconds_bucket{{{lab},le="{b}"}} {acc}')
+            out.append(f"crawler_phase_seconds_sum{{{lab}}} {h.sum:.6f}")
+            out.append(f"crawler_phase_seconds_count{{{lab}}} {h.n}")
+        out += ["# HELP crawler_events_total 이벤트 수", "# TYPE crawler_events_total counter"]
+        for (site, name), n in sorted(cnt.items()):
+            out.append(f'crawler_events_total{{site="{site}",event="{name}"}} {n}')
+        return "\n".join(out) + "\n"
+
+
+def _iso(t):
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+
+
+def write_report(path, report):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+
+
+def write_prometheus(path, metrics=None):
+    """node_exporter textfile collector 용: 임시 파일에 쓰고 바꿔치기 (읽는 쪽이 반쯤 쓴 파일을 보지 않도록)."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write((metrics or METRICS).prometheus())
+    os.replace(tmp, path)
+
+
+@contextmanager
+def profiled(path, log=print, top=30):
+    """이 블록을 cProfile 로 돌려 path(.prof)와 path.txt(누적 시간 상위 top 개)를 남긴다.
+    프로파일러는 모든 함수 호출에 비용이 붙으므로 문제를 찾을 때 한 번만 켠다."""
+    import cProfile, pstats, io
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        yield prof
+    finally:
+        prof.disable()
+        prof.dump_stats(path)
+        buf = io.StringIO()
+        pstats.Stats(prof, stream=buf).sort_stats("cumulative").print_stats(top)
+        with open(path + ".txt", "w", encoding="utf-8") as f: f.write(buf.getvalue())
+        log(f"프로파일 저장: {path} (요약 {path}.txt)")
+
+
+METRICS = Metrics()
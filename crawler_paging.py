@@ -0,0 +1,87 @@
+"""목록 페이지 계획: 페이지를 지수적으로 건너뛰며(galloping) 찾은 뒤 이분 탐색으로 cutoff 경계 페이지를 찾는다.
+
+목록 행의 날짜만 보고 판단한다. 페이지마다 결과는 다음 넷 중 하나다.
+    IN        가장 오래된 글도 cutoff 이후 → 경계는 더 뒤
+    BOUNDARY  cutoff 전후 글이 섞여 있음 → 여기가 마지막 페이지
+    PAST      가장 최근 글도 cutoff 이전 → 경계는 더 앞
+    END       행이 없거나, 앞 페이지와 내용이 같음 (끝을 넘긴 page 번호에 마지막 페이지를 다시 주는 게시판)
+"""
+import hashlib
+
+MAX_PAGE_HARD = 5000      # galloping 상한 (무한 루프 방지용, 보통 닿지 않음)
+
+IN, BOUNDARY, PAST, END = "IN", "BOUNDARY", "PAST", "END"
+
+
+def fingerprint(keys) -> str:
+    """페이지 내용 지문 (글 링크/번호 목록)."""
+    return hashlib.sha1("\n".join(keys).encode("utf-8")).hexdigest()[:16]
+
+
+class ListPage:
+    """목록 한 페이지: items 와 같은 순서의 날짜 dts (없으면 None), 지문용 keys."""
+    def __init__(self, page, items, dts, keys):
+        self.page, self.items, self.dts = page, items, dts
+        dts = [d for d in dts if d is not None]
+        self.newest = max(dts) if dts else None
+        self.oldest = min(dts) if dts else None
+        self.fp = fingerprint(keys) if keys else None
+
+
+class PagePlanner:
+    """load(page) → ListPage. 읽은 페이지는 캐시해 두고, 본 수집에서 다시 쓰지 않는다."""
+    def __init__(self, load, cutoff, start=1, max_page=MAX_PAGE_HARD, log=None):
+        self.load, self.cutoff, self.start, self.max_page = load, cutoff, start, max_page
+        self.log = log or (lambda msg: None)
+        self.pages = {}           # page → ListPage
+        self._fps = {}            # 지문 → 처음 본 page
+
+    def get(self, page) -> ListPage:
+        lp = self.pages.get(page)
+        if lp is None:
+            lp = self.pages[page] = self.load(page)
+            if lp.fp is not None and page < self._fps.get(lp.fp, page + 1): self._fps[lp.fp] = page
+        return lp
+
+    def classify(self, page) -> str:
+        lp = self.get(page)
+        if lp.fp is None or self._fps.get(lp.fp, page) < page: return END
+        if lp.newest is None: return END
+        if lp.oldest >= self.cutoff: return IN
+        if lp.newest < self.cutoff: return PAST
+        return BOUNDARY
+
+    def last_page(self) -> int:
+        """cutoff 이후 글이 있는 마지막 page. 시작 페이지부터 이미 지났으면 start 를 준다."""
+        lo, step, p = None, 1, self.start
+        while True:                               # galloping: start, start+1, start+3, start+7, ...
+            c = self.classify(p)
+            self.log(f"탐색 page={p} → {c}")
+            if c == BOUNDARY: return p
+            if c != IN: break
+            lo = p
+            if p >= self.max_page: return p
+            p = min(self.max_page, self.start + 2 * step - 1); step *= 2
+        if lo is None: return self.start
+        hi, hi_c = p, c
+        while hi - lo > 1:                        # 이분 탐색: lo 는 IN, hi 는 PAST/END
+            mid = (lo + hi) // 2
+            c = self.classify(mid)
+            self.log(f"탐색 page={mid} → {c}")
+            if c == BOUNDARY: return mid
+            if c == IN: lo = mid
+            else: hi, hi_c = mid, c
+        # 게시판 끝: lo 가 바로 앞 페이지의 반복일 수 있다 (앞 페이지를 아직 안 읽었으면 IN 으로 보임)
+        while hi_c == END and lo > self.start:
+            self.get(lo - 1)
+            if self.classify(lo) != END: break
+            lo -= 1
+        return lo
+
+    def plan(self):
+        """→ (수집할 page 목록, 아직 안 읽은 page 목록). 경계 바로 다음 페이지를 이미 읽었으면 함께 넣는다
+        (목록 날짜가 조금 뒤섞여 있어도 놓치지 않도록, 추가 요청 없이)."""
+        last = self.last_page()
+        pages = list(range(self.start, last + 1))
+        if last + 1 in self.pages and self.classify(last + 1) != END: pages.append(last + 1)
+        return pages, [p for p in pages if p not in self.pages]
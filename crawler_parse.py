@@ -0,0 +1,241 @@
+"""사이트별 순수 파서: HTML 문자열(또는 lxml 문서) → 레코드. WebDriver 없이 실행/측정할 수 있다.
+
+    parse(site, kind, html, base_url, clock=None)      kind: "list" | "detail"
+    parse_fmk_list(html, base_url)  →  [엔트리] | None   (list_entry, None: 목록 틀 없음 → 브라우저)
+    parse_fmk_detail(html, base_url) → (제목, 날짜 텍스트, 조회수) | None
+    parse_dc_list(html, base_url)   →  [(href, 제목, 날짜 텍스트, 조회수)] | None
+    parse_tq_list(html, base_url)   →  [엔트리] | None
+    parse_tq_detail(html, base_url) →  글 dict | None
+
+모두 모듈 최상위 함수라 프로세스 풀(ProcessPoolExecutor)에도 넘길 수 있다. 브라우저에서는 같은 스펙을
+crawler_extract.extract_driver 로 평가한다 (crawler_core 의 *_driver 함수).
+시각 해석은 crawler_time: clock(RunClock)을 넘기면 그 실행의 기준 시각을, 안 넘기면 호출 시각을 쓴다.
+후보가 여럿인 스펙은 sel(crawler_selectors.Scope)을 넘기면 그 게시판에서 맞던 후보부터 시도한다.
+"""
+import re
+from crawler_extract import spec, extract_html
+from crawler_selectors import PLAIN
+from crawler_time import RunClock
+from crawler_ids import canonical_link
+
+
+# 삭제/없는 글 안내 문구 (XE 계열 공통). 상세 스펙에 레코드가 없을 때만 보므로 정상 글 본문/댓글에
+# 같은 문구가 있어도 상관없다 → 필수 필드를 timeout 까지 기다리지 않고 바로 PostGone.
+# 브라우저로 렌더링한 뒤에만 본다 (HTTP 응답에서 레코드가 없으면 렌더링 전일 수 있어 브라우저로 넘긴다).
+GONE_TEXTS = ("삭제된 게시물", "존재하지 않는 게시물", "대상을 찾을 수 없습니다", "권한이 없습니다")
+GONE = [("body", "text", t) for t in GONE_TEXTS]
+
+
+# 목록 틀: 행이 하나도 없을 때 틀이 있으면 정상적인 빈 페이지(게시판 끝) → [], 틀도 없으면 JS 렌더링/차단 → None
+def skeleton(sel):
+    return spec(fields={"list": [(sel, "exists")]}, required=["list"])
+
+def rows_or_none(rows, has_skeleton):
+    """has_skeleton() 은 행이 없을 때만 부른다 (보통은 한 번 더 훑지 않음)."""
+    return rows if rows or has_skeleton() else None
+
+
+def to_int_or_none(text):
+    try: return int(re.sub(r"[^\d]", "", str(text)))
+    except Exception: return None
+
+# ---------------- 목록 행 → 엔트리 (FMKorea / TheQoo 공통) ----------------
+_COUNT_SUFFIX_RE = re.compile(r"\s*[\[(]\d+[\])]$")
+
+def list_entry(site, href, title=None, date_text=None, views_text=None, clock=None):
+    """목록 행 하나 → 엔트리 dict. 날짜/조회수를 못 읽었으면 _exact=False (→ 상세). 시각 규칙은 crawler_time,
+    Link 는 사이트별 정식 주소 (crawler_ids)."""
+    dt, hi, exact = (clock or RunClock()).stamp(date_text, site)
+    views = to_int_or_none((views_text or "").replace(",", ""))
+    return {"Site": site, "Title": _COUNT_SUFFIX_RE.sub("", title or "").strip() or "제목 없음",
+            "Date": (date_text or "").strip(), "Views": views, "Link": canonical_link(site, href),
+            "_dt": dt, "_hi": hi, "_exact": exact and views is not None and bool(title)}
+
+# ---------------- FMKorea ----------------
+FM_LINK_PATTERNS = [
+    re.compile(r"/\d{5,}$"),
+    re.compile(r"[?&]document_srl=\d+"),
+]
+
+# 목록: 포텐 추천수 링크 → 없으면 모든 a[href] 중 글 링크 패턴
+SPEC_FMK_LIST = spec(
+    rows='.pc_voted_count.pc_voted_count_plus.pc_voted_count_short',
+    fields={"href": [("", "href")]}, required=["href"], name="fmk_voted")
+SPEC_FMK_LIST_ALL = spec(rows="a[href]", fields={"href": [("", "href")]}, required=["href"], name="fmk_all")
+# 목록 행 (일반 게시판 표 / 포텐 웹진형): 제목·시각·조회수
+SPEC_FMK_ROWS = spec(
+    rows="table.bd_lst tbody tr, .fm_best_widget li.li",
+    fields={
+        "href":  [("td.title a[href]", "href"), ("h3.title a[href]", "href")],
+        "title": [("td.title a[href]", "text"), ("h3.title a[href]", "text|title")],
+        "date":  [("td.time", "text"), (".regdate", "text")],
+        "views": [("td.m_no", "text"), (".count", "text")],
+        "poten": [(".STAR-BEST_T", "exists")],
+    },
+    required=["href"],
+    skip=[("", "class", "notice")],   # 공지
+    name="fmk_rows")
+SPEC_FMK_DETAIL = spec(
+    fields={
+        "title": [(".np_18px_span", "text")],
+        "poten": [("h1.np_18px > span.STAR-BEST_T", "exists")],
+        "date":  [(".date.m_no", "text")],
+        "views": [("//span[contains(text(), '조회 수')]/b", "text")],
+    },
+    required=["title", "date", "views"],
+    gone=GONE)
+
+def fmk_links(results):
+    voted, anchors = results
+    links, seen = [], set()
+    for r in voted:
+        href = canonical_link("FMKorea", r["href"])
+        if href not in seen:
+            seen.add(href); links.append(href)
+    if links: return links
+    for r in anchors:
+        href = canonical_link("FMKorea", r["href"])
+        if any(p.search(r["href"]) for p in FM_LINK_PATTERNS) and href not in seen:
+            seen.add(href); links.append(href)
+    return links
+
+def fmk_entries(results, clock=None):
+    """목록 행을 읽었으면 행 그대로, 아니면 글 링크만 (→ 전부 상세)."""
+    recs, voted, anchors = results
+    clock = clock or RunClock()
+    entries, seen = [], set()
+    for r in recs:
+        href = canonical_link("FMKorea", r["href"])
+        if href in seen or not any(p.search(r["href"]) for p in FM_LINK_PATTERNS): continue
+        seen.add(href)
+        title = f"포텐: {r['title']}" if r.get("poten") and r.get("title") else r.get("title")
+        entries.append(list_entry("FMKorea", href, title, r.get("date"), r.get("views"), clock))
+    return entries or [list_entry("FMKorea", h) for h in fmk_links([voted, anchors])]
+
+# 사슬: 앞 스펙에서 레코드가 나오면 뒤는 보지 않는다 (모든 a[href] 훑기는 마지막 수단)
+FMK_LIST_SPECS = [SPEC_FMK_ROWS, SPEC_FMK_LIST, SPEC_FMK_LIST_ALL]
+SKELETON_FMK_LIST = skeleton("table.bd_lst, .fm_best_widget")
+
+def fmk_collect_links_html(doc, base, text=None, clock=None, sel=None):
+    entries = fmk_entries((sel or PLAIN).extract_html(doc, base, text, FMK_LIST_SPECS, chain=True)[1], clock)
+    return rows_or_none(entries, lambda: extract_html(doc, base, text, [SKELETON_FMK_LIST])[1][0])
+
+def fmk_detail(rec):
+    title = rec["title"]
+    if rec.get("poten"): title = f"포텐: {title}"
+    return title, rec["date"], to_int_or_none(rec["views"])
+
+def fmk_parse_detail_html(doc, base=None, text=None):
+    recs = extract_html(doc, base, text, [SPEC_FMK_DETAIL])[1][0]
+    return fmk_detail(recs[0]) if recs else None   # 본문 미렌더링 → 브라우저 폴백
+
+# ---------------- DCInside ----------------
+SPEC_DC_LIST = spec(
+    rows="tr.ub-content.us-post",
+    fields={
+        "href":  [("td.gall_tit a[href]", "href")],
+        "title": [("td.gall_tit a[href]", "text|title")],
+        "date":  [("td.gall_date", "title|text")],
+        "views": [("td.gall_count", "text")],
+    },
+    required=["href", "date"])
+SKELETON_DC_LIST = skeleton("table.gall_list")
+
+def dc_rows(recs):
+    """목록 행 → [(href, title, date_text, views)]"""
+    return [(canonical_link("DCInside", r["href"]), r["title"] or "", r["date"], to_int_or_none(r["views"])) for r in recs]
+
+def dc_parse_rows_html(doc, base, text=None):
+    rows = dc_rows(extract_html(doc, base, text, [SPEC_DC_LIST])[1][0])
+    return rows_or_none(rows, lambda: extract_html(doc, base, text, [SKELETON_DC_LIST])[1][0])
+
+# ---------------- TheQoo (상세 + 공지 제외 + .side.fr span + 조회수 count_container) ----------------
+SPEC_TQ_LIST = spec(
+    rows="tr",
+    fields={
+        "href":  [("td.title a[href]:not(.replyNum)", "href")],
+        "title": [("td.title a[href]:not(.replyNum)", "text")],
+        "date":  [("td.time", "text")],
+        "views": [("td.m_no", "text")],
+    },
+    required=["href"],
+    skip=[("td.no strong", "text", "공지")])   # 공지 제외
+SKELETON_TQ_LIST = skeleton("table.bd_lst")
+SPEC_TQ_DETAIL = spec(
+    fields={
+        "title": [(s, "text") for s in ["h1.title", ".title h1", ".title", "h1", "h2"]],
+        "date":  [(s, "datetime|text") for s in [".side.fr span", ".date", ".regdate", ".time", "time[datetime]"]],
+        "views": [(".count_container", "text")],
+    },
+    regex={
+        "date_fb":  (r"\d{4}\.\d{2}\.\d{2}\s+\d{2}:\d{2}", "first", "html"),
+        # 백업: 페이지 전체 숫자에서 최대값 추정(원치 않으면 제거)
+        "views_fb": (r"\d{1,3}(?:,\d{3})*|\d+", "max", "html"),
+    },
+    required=["title", "date|date_fb"],
+    gone=GONE,
+    name="tq_detail")
+_NUM_RE = re.compile(r"\d{1,3}(?:,\d{3})*|\d+")
+
+def tq_entries(recs, clock=None):
+    """목록 행 → 엔트리 (시각/조회수 칸이 없는 게시판이면 전부 상세)."""
+    entries, seen, clock = [], set(), clock or RunClock()
+    for r in recs:
+        href = canonical_link("TheQoo", r["href"])
+        if href not in seen:
+            seen.add(href)
+            entries.append(list_entry("TheQoo", href, r.get("title"), r.get("date"), r.get("views"), clock))
+    return entries
+
+def theqoo_collect_detail_links_html(doc, base, text=None, clock=None):
+    entries = tq_entries(extract_html(doc, base, text, [SPEC_TQ_LIST])[1][0], clock)
+    return rows_or_none(entries, lambda: extract_html(doc, base, text, [SKELETON_TQ_LIST])[1][0])
+
+def theqoo_post(url, rec, clock=None):
+    title = (rec or {}).get("title") or "제목 없음"
+    date_text = (rec or {}).get("date") or (rec or {}).get("date_fb") or ""
+    # 조회수: .count_container 텍스트에서 첫 숫자
+    nums = _NUM_RE.findall((rec or {}).get("views") or "")
+    views = to_int_or_none(nums[0]) if nums else (rec or {}).get("views_fb")
+    dt = (clock or RunClock()).stamp(date_text, "TheQoo").dt
+    return {
+        "Site": "TheQoo",
+        "Title": title,
+        "Date": date_text,
+        "Views": views,
+        "Link": url,
+        "_dt": dt
+    }
+
+def theqoo_parse_detail_html(doc, base, text, url=None, clock=None, sel=None):
+    recs = (sel or PLAIN).extract_html(doc, base, text, [SPEC_TQ_DETAIL])[1][0]
+    return theqoo_post(url or base, recs[0], clock) if recs else None   # 렌더링 필요 → 브라우저 폴백
+
+# ---------------- parse(html, base_url) ----------------
+def _doc(html, base_url):
+    import lxml.html
+    return lxml.html.document_fromstring(html or "<html></html>", base_url=base_url)
+
+def parse_fmk_list(html, base_url, clock=None):
+    return fmk_collect_links_html(_doc(html, base_url), base_url, html, clock)
+
+def parse_fmk_detail(html, base_url, clock=None):
+    return fmk_parse_detail_html(_doc(html, base_url), base_url, html)
+
+def parse_dc_list(html, base_url, clock=None):
+    return dc_parse_rows_html(_doc(html, base_url), base_url, html)
+
+def parse_tq_list(html, base_url, clock=None):
+    return theqoo_collect_detail_links_html(_doc(html, base_url), base_url, html, clock)
+
+def parse_tq_detail(html, base_url, clock=None):
+    return theqoo_parse_detail_html(_doc(html, base_url), base_url, html, base_url, clock)
+
+PARSERS = {
+    "FMKorea":  {"list": parse_fmk_list, "detail": parse_fmk_detail},
+    "DCInside": {"list": parse_dc_list},
+    "TheQoo":   {"list": parse_tq_list, "detail": parse_tq_detail},
+}
+
+def parse(site, kind, html, base_url, clock=None):
+    return PARSERS[site][kind](html, base_url, clock)
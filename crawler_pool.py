@@ -0,0 +1,317 @@
+"""상세 페이지 병렬 수집용 워커 풀, 호스트별 동시 접속 상한, 실패한 상세 재시도 큐, 목록 페이지 미리 가져오기,
+실행 간 재사용하는 Chrome 드라이버 풀."""
+import os, time, threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+DEFAULT_HOST_CAP = 4
+# 실패한 상세 재시도: 게시판 끝에서 라운드 수, 첫 대기(초, 라운드마다 두 배)
+RETRY_ROUNDS  = 2
+RETRY_BACKOFF = 2.0
+# 목록 페이지 미리 가져오기: 지금 페이지의 상세를 처리하는 동안 이만큼 앞까지 (0 = 끔)
+LIST_PREFETCH = 1
+
+
+class HostGate:
+    """호스트별 동시 요청 수 상한. 같은 호스트를 치는 모든 워커/실행이 공유한다."""
+    def __init__(self, cap=DEFAULT_HOST_CAP):
+        self.cap = max(1, int(cap))
+        self._sems = {}
+        self._lock = threading.Lock()
+
+    def _sem(self, host):
+        with self._lock:
+            sem = self._sems.get(host)
+            if sem is None:
+                sem = self._sems[host] = threading.BoundedSemaphore(self.cap)
+            return sem
+
+    @contextmanager
+    def hold(self, url):
+        sem = self._sem(urlparse(url).netloc.lower())
+        with sem:
+            yield
+
+
+HOST_GATE = HostGate()
+
+
+class DetailPool:
+    """N개 워커 스레드가 각자 Fetcher(= 자기 드라이버)를 하나씩 가진다.
+    map() 결과는 입력 순서를 그대로 유지하고, 실패한 항목은 예외 객체로 채워 돌려준다."""
+    def __init__(self, make_fetcher, workers=4, gate=None):
+        self.workers = max(1, int(workers))
+        self.make_fetcher = make_fetcher
+        self.gate = gate or HOST_GATE
+        self._local = threading.local()
+        self._fetchers, self._lock = [], threading.Lock()
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="detail")
+
+    def _fetcher(self):
+        f = getattr(self._local, "fetcher", None)
+        if f is None:
+            f = self._local.fetcher = self.make_fetcher()
+            with self._lock: self._fetchers.append(f)
+        return f
+
+    def _run(self, fn, url):
+        try:
+            with self.gate.hold(url):
+                return fn(self._fetcher(), url)
+        except Exception as e:
+            return e
+
+    def map(self, fn, urls):
+        futures = [self._executor.submit(self._run, fn, u) for u in urls]
+        return [f.result() for f in futures]
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            fetchers, self._fetchers = self._fetchers, []
+        for f in fetchers:
+            try: f.close()
+            except Exception: pass
+
+
+class RetryQueue:
+    """실패한 상세 URL 을 바로 다시 열지 않고 모아 두었다가 게시판 끝에서 backoff 를 두고 다시 시도한다.
+    죽은 링크 몇 개가 목록 페이지 진행을 붙잡지 않도록 (tail latency)."""
+    def __init__(self, rounds=RETRY_ROUNDS, backoff=RETRY_BACKOFF, sleep=time.sleep):
+        self.rounds, self.backoff, self.sleep = rounds, backoff, sleep
+        self.failed = {}     # url → 마지막 실패 사유
+
+    def add(self, url, reason):
+        self.failed[url] = reason
+
+    def __len__(self):
+        return len(self.failed)
+
+    def drain(self, pool, fn, settled):
+        """라운드마다 backoff 만큼 쉬고 남은 URL 을 pool.map(fn) 으로 다시 연다.
+        settled(결과) 가 True 면 (성공 또는 다시 해도 소용없는 실패) 끝. → {url: 결과}
+        끝까지 안 된 URL 은 self.failed 에 남는다."""
+        done, delay = {}, self.backoff
+        for _ in range(self.rounds):
+            if not self.failed: break
+            self.sleep(delay); delay *= 2
+            urls = list(self.failed)
+            for url, res in zip(urls, pool.map(fn, urls)):
+                if settled(res): done[url] = res; del self.failed[url]
+                else: self.failed[url] = res if isinstance(res, Exception) else "결과 없음"
+        return done
+
+
+class ListPrefetch:
+    """목록 페이지를 한 스레드에서 차례로 가져온다: 크롤러가 page 의 상세를 처리하는 동안 ahead(page + 1) 로
+    다음 목록 요청을 미리 보내 두고, get(page + 1) 은 이미 와 있으면 기다리지 않는다.
+    fetch(page) 는 늘 이 스레드에서만 불리므로 목록용 Fetcher 하나를 그대로 써도 된다.
+    미리 가져온 페이지는 최대 depth 개 (그만큼만 메모리에 머문다). hits/wasted: 미리 가져와서 쓴/버린 페이지 수."""
+    def __init__(self, fetch, depth=LIST_PREFETCH):
+        self.fetch, self.depth = fetch, max(0, int(depth))
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="list")
+        self._ahead = {}     # page → Future
+        self.hits = self.wasted = 0
+
+    def ahead(self, page):
+        """page 를 미리 요청 (이미 요청했거나 depth 만큼 쌓여 있으면 무시)."""
+        if page not in self._ahead and len(self._ahead) < self.depth:
+            self._ahead[page] = self._executor.submit(self.fetch, page)
+
+    def get(self, page):
+        """page 의 결과 (미리 가져왔으면 그것). fetch 의 예외는 그대로 다시 발생."""
+        fut = self._ahead.pop(page, None)
+        if fut is not None: self.hits += 1
+        else: fut = self._executor.submit(self.fetch, page)
+        return fut.result()
+
+    def close(self):
+        """쓰지 않은 미리 가져오기는 취소 (이미 보낸 요청은 끝날 때까지 기다린다 → 그 뒤에 Fetcher 를 닫아도 안전)."""
+        for fut in self._ahead.values():
+            fut.cancel(); self.wasted += 1
+        self._ahead.clear()
+        self._executor.shutdown(wait=True)
+
+
+# ---------------- Chrome 드라이버 풀 ----------------
+try:
+    import psutil   # requirements.txt 에 포함 (RSS 기준 재활용). 없으면 그 기준만 건너뛴다
+except Exception:
+    psutil = None
+
+DRIVER_MAX_PAGES  = 300
+DRIVER_MAX_RSS_MB = 1500
+# Chrome 이 "프로필 사용 중" 으로 거절하면 다음 슬롯으로 (이만큼까지)
+PROFILE_TRIES     = 4
+
+
+class ProfileBusy(Exception):
+    """user-data-dir 을 다른 Chrome 이 쓰고 있어 세션을 못 만듦 (드라이버 버전 문제와 구분)."""
+
+
+def _lock_file(path):
+    """잠금 파일을 이 프로세스 것으로 → 열린 파일, 다른 프로세스가 잡고 있으면 None.
+    OS 잠금이라 프로세스가 죽으면 저절로 풀린다 (남은 .lock 파일은 그대로 다시 쓴다)."""
+    f = open(path, "a+")
+    try:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0); msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return f
+    except OSError:
+        f.close()
+        return None
+
+
+def _unlock_file(f):
+    try:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0); msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    except OSError:
+        pass
+    f.close()
+
+
+class DriverLease:
+    def __init__(self, driver, slot, show_browser, full=False):
+        self.driver, self.slot, self.show_browser = driver, slot, show_browser
+        self.full = full          # lean 옵션 없이 띄운 드라이버 (crawler_lean 전체 로딩 호스트용)
+        self.pages = 0
+
+
+def driver_rss_mb(driver):
+    """chromedriver + 하위 Chrome 프로세스 RSS 합계(MB). psutil 이 없으면 None."""
+    if psutil is None: return None
+    try:
+        proc = psutil.Process(driver.service.process.pid)
+        procs = [proc] + proc.children(recursive=True)
+        return sum(p.memory_info().rss for p in procs if p.is_running()) / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def driver_alive(driver) -> bool:
+    try:
+        driver.current_url
+        return bool(driver.window_handles)
+    except Exception:
+        return False
+
+
+class DriverPool:
+    """실행 간에 재사용하는 Chrome 풀.
+    factory(show_browser, profile_dir, full) 로 드라이버를 만들고 (full=True 면 lean 옵션 없이),
+    슬롯마다 고정된 user-data-dir 을 써서 정적 리소스가 디스크 캐시에 남게 한다. max_pages 페이지 또는 max_rss_mb 를 넘으면 새로 띄운다.
+    슬롯은 p{slot}.lock 파일 잠금으로 프로세스끼리도 나눠 쓴다 (GUI 와 CLI/데몬이 같은 프로필을 열지 않게)."""
+    def __init__(self, factory, profile_root=None, max_pages=DRIVER_MAX_PAGES,
+                 max_rss_mb=DRIVER_MAX_RSS_MB, max_idle=4, log=print):
+        self.factory, self.profile_root = factory, profile_root
+        self.max_pages, self.max_rss_mb, self.max_idle = max_pages, max_rss_mb, max_idle
+        self.log = log
+        self._idle = []          # [DriverLease]
+        self._slots = {}         # 사용 중인 프로필 슬롯 → 잠금 파일 (profile_root 가 없으면 None)
+        self._busy = []          # 잠금 밖의 Chrome 이 쓰던 슬롯: 이번 풀에서는 잡아 둔 채 건너뛴다
+        self._lock = threading.Lock()
+        self._closed = False
+        if max_rss_mb and psutil is None:
+            log("[풀] psutil 이 없어 메모리(RSS) 기준 재활용은 하지 않습니다. 설치:  pip install psutil")
+
+    def _profile_dir(self, slot):
+        if not self.profile_root: return None
+        d = os.path.join(self.profile_root, f"p{slot}")
+        os.makedirs(d, exist_ok=True)
+        return d
+
+    def _claim(self, slot):
+        """slot 을 이 프로세스 것으로 (self._lock 안에서). 다른 프로세스가 쓰는 중이면 False."""
+        if not self.profile_root:
+            self._slots[slot] = None; return True
+        os.makedirs(self.profile_root, exist_ok=True)
+        f = _lock_file(os.path.join(self.profile_root, f"p{slot}.lock"))
+        if f is None: return False
+        self._slots[slot] = f
+        return True
+
+    def _free(self, slot):
+        f = self._slots.pop(slot, None)
+        if f is not None: _unlock_file(f)
+
+    def _take_slot(self):
+        with self._lock:
+            slot = 0
+            while slot in self._slots or not self._claim(slot): slot += 1
+            return slot
+
+    def _spawn(self, show_browser, full=False):
+        for _ in range(PROFILE_TRIES):
+            slot = self._take_slot()
+            try:
+                return DriverLease(self.factory(show_browser, self._profile_dir(slot), full), slot, show_browser, full)
+            except ProfileBusy as e:
+                self.log(f"[풀] 프로필 p{slot} 을 다른 Chrome 이 사용 중 → 다음 슬롯 ({e})")
+                with self._lock: self._busy.append(slot)
+            except Exception:
+                with self._lock: self._free(slot)
+                raise
+        raise ProfileBusy(f"빈 프로필 슬롯을 찾지 못함 ({PROFILE_TRIES}회)")
+
+    def _discard(self, lease, free_slot=True):
+        try: lease.driver.quit()
+        except Exception: pass
+        if free_slot:
+            with self._lock: self._free(lease.slot)
+
+    def acquire(self, show_browser, full=False) -> DriverLease:
+        while True:
+            with self._lock:
+                idx = next((i for i, l in enumerate(self._idle)
+                            if l.show_browser == show_browser and l.full == full), None)
+                lease = self._idle.pop(idx) if idx is not None else None
+            if lease is None:
+                return self._spawn(show_browser, full)
+            if driver_alive(lease.driver):
+                return lease
+            self.log(f"[풀] 죽은 드라이버 교체 (slot={lease.slot})")
+            self._discard(lease)
+
+    def needs_recycle(self, lease) -> bool:
+        if lease.pages >= self.max_pages: return True
+        if self.max_rss_mb and lease.pages and lease.pages % 20 == 0:
+            rss = driver_rss_mb(lease.driver)
+            if rss is not None and rss > self.max_rss_mb: return True
+        return False
+
+    def renew(self, lease, reason=""):
+        """같은 슬롯(프로필)으로 드라이버를 다시 띄운다. 실행 도중 재활용/크래시 복구용."""
+        self.log(f"[풀] 드라이버 재시작 slot={lease.slot} pages={lease.pages} {reason}".rstrip())
+        self._discard(lease, free_slot=False)
+        try:
+            lease.driver = self.factory(lease.show_browser, self._profile_dir(lease.slot), lease.full)
+        except Exception:
+            with self._lock: self._free(lease.slot)
+            raise
+        lease.pages = 0
+        return lease
+
+    def release(self, lease):
+        if self._closed or not driver_alive(lease.driver) or self.needs_recycle(lease):
+            self._discard(lease); return
+        try: lease.driver.get("about:blank")
+        except Exception: self._discard(lease); return
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(lease); return
+        self._discard(lease)
+
+    def close(self):
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, []
+            for slot in self._busy: self._free(slot)
+            self._busy = []
+        for l in idle: self._discard(l)
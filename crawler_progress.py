@@ -0,0 +1,100 @@
+"""수집 진행 상황: 게시판마다 처리한 목록 페이지/행 수, 속도, cutoff 까지 남은 페이지 추정, 남은 시간.
+
+    track = PROGRESS.start("FMK", cutoff, now)       # 크롤러가 게시판 하나 시작할 때
+    track.page(page, rows, oldest)                   # 목록 페이지 하나 끝날 때 (_page_done)
+    track.plan(last_page)                            # 마지막 페이지를 이미 아는 경우 (DC 경계 탐색)
+    track.done()
+    PROGRESS.snapshot() → [dict]                     # GUI 가 타이머로 읽는다 (어느 스레드에서 불러도 됨)
+
+cutoff 페이지 추정: 지금까지 페이지 p 개가 (now - oldest) 만큼의 시간을 덮었으면 (now - cutoff) 를 덮는 데
+p × (now - cutoff) / (now - oldest) 페이지가 필요하다고 본다 (글이 고르게 올라온다는 가정).
+"""
+import time, threading
+
+KEEP_FINISHED = 32     # 끝난 게시판 기록은 이만큼만 남긴다 (데몬처럼 오래 도는 프로세스)
+
+
+class Track:
+    def __init__(self, tag, cutoff, now):
+        self.tag, self.cutoff, self.now = tag, cutoff, now
+        self.t0 = time.monotonic()
+        self.first = self.page_no = None
+        self.pages = self.rows = 0
+        self.oldest = None
+        self.last_page = None       # 확정된 마지막 페이지 (없으면 시각으로 추정)
+        self.finished = None
+        self._lock = threading.Lock()
+
+    def page(self, page, rows=0, oldest=None):
+        with self._lock:
+            if self.first is None: self.first = page
+            self.page_no, self.pages, self.rows = page, self.pages + 1, self.rows + rows
+            if oldest is not None and (self.oldest is None or oldest < self.oldest): self.oldest = oldest
+
+    def plan(self, last_page):
+        with self._lock: self.last_page = last_page
+
+    def done(self):
+        with self._lock: self.finished = time.monotonic()
+
+    def estimate(self):
+        """cutoff 에 닿을 것으로 보이는 페이지 (모르면 None)."""
+        if self.last_page is not None: return self.last_page
+        if self.page_no is None or self.oldest is None: return None
+        covered = (self.now - self.oldest).total_seconds()
+        if covered <= 0: return None
+        need = (self.now - self.cutoff).total_seconds()
+        return max(self.page_no, round(self.page_no * need / covered))
+
+    def snapshot(self):
+        with self._lock:
+            elapsed = max(1e-6, (self.finished or time.monotonic()) - self.t0)
+            est = self.estimate()
+            pages_s, rows_s = self.pages / elapsed, self.rows / elapsed
+            eta = None
+            if self.finished: eta = 0.0
+            elif est is not None and pages_s > 0: eta = max(0, est - (self.page_no or 0)) / pages_s
+            return {"tag": self.tag, "page": self.page_no, "est_page": est, "pages": self.pages, "rows": self.rows,
+                    "pages_s": pages_s, "rows_s": rows_s, "eta_s": eta, "elapsed_s": elapsed,
+                    "done": self.finished is not None}
+
+
+class Progress:
+    """프로세스 하나에 하나 (PROGRESS). 크롤러 스레드가 쓰고 화면 쪽이 읽는다."""
+    def __init__(self):
+        self._tracks = []
+        self._lock = threading.Lock()
+
+    def start(self, tag, cutoff, now) -> Track:
+        t = Track(tag, cutoff, now)
+        with self._lock:
+            done = [x for x in self._tracks if x.finished]
+            if len(done) > KEEP_FINISHED:
+                old = set(map(id, done[:len(done) - KEEP_FINISHED]))
+                self._tracks = [x for x in self._tracks if id(x) not in old]
+            self._tracks.append(t)
+        return t
+
+    def clear(self):
+        """끝난 게시판 기록을 지운다 (새 실행을 시작할 때)."""
+        with self._lock: self._tracks = [x for x in self._tracks if not x.finished]
+
+    def snapshot(self):
+        with self._lock: tracks = list(self._tracks)
+        return [t.snapshot() for t in tracks]
+
+
+def describe(s) -> str:
+    """'[FMK] page 3/~8 | 0.4쪽/s 12.0건/s | 누적 60건 | 남은 시간 ~0:13'"""
+    page = f"page {s['page'] or '-'}" + (f"/~{s['est_page']}" if s["est_page"] else "")
+    if s["done"]: tail = f"완료 {_clock(s['elapsed_s'])}"
+    else: tail = f"남은 시간 ~{_clock(s['eta_s'])}" if s["eta_s"] is not None else "남은 시간 추정 중"
+    return f"[{s['tag']}] {page} | {s['pages_s']:.2f}쪽/s {s['rows_s']:.1f}건/s | 누적 {s['rows']}건 | {tail}"
+
+
+def _clock(sec):
+    m, s = divmod(int(sec), 60)
+    return f"{m // 60}:{m % 60:02d}:{s:02d}" if m >= 60 else f"{m}:{s:02d}"
+
+
+PROGRESS = Progress()
@@ -0,0 +1,102 @@
+"""호스트별 적응형 요청 속도 제한 (토큰 버킷 + AIMD). 같은 호스트를 치는 모든 워커/실행이 한 버킷을 공유한다.
+
+- 응답이 빠르고 정상이면 초당 허용량을 조금씩 올리고 (additive increase)
+- 느린 응답/네트워크 오류면 줄이고, 429/5xx/챌린지 페이지면 절반으로 줄인 뒤 잠시 멈춘다 (multiplicative decrease, Retry-After 반영).
+"""
+import time, threading
+from urllib.parse import urlparse
+
+RATE_START = 2.0      # 요청/초
+RATE_MIN   = 0.2
+RATE_MAX   = 10.0
+RATE_STEP  = 0.25     # 정상 응답 하나마다 더하는 양
+BURST      = 2.0      # 쉬고 난 뒤 바로 보낼 수 있는 요청 수
+SLOW_S     = 3.0      # 이보다 느리면 무조건 '느림'
+SLOW_RATIO = 3.0      # 평소(EWMA) 응답 시간의 이 배수보다 느려도 '느림'
+COOLDOWN_MAX = 60.0   # 차단 응답 뒤 멈추는 최대 시간 (연속 차단마다 두 배)
+RETRY_AFTER_MAX = 300.0   # 서버가 준 Retry-After 는 이 시간까지 따른다
+REPORT_EVERY = 50     # 이 요청 수마다 상태를 로그로
+
+
+class HostRate:
+    def __init__(self, host, rate=RATE_START):
+        self.host, self.rate = host, rate
+        self.tokens, self.stamp = BURST, time.monotonic()
+        self.blocked_until = 0.0
+        self.strikes = 0          # 연속 차단 횟수
+        self.ewma = None          # 평소 응답 시간(초)
+        self.requests = self.slow = self.throttled = 0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(BURST, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+    def describe(self):
+        avg = f"{self.ewma * 1000:.0f}ms" if self.ewma is not None else "-"
+        return (f"{self.host} 속도 {self.rate:.2f}/s | 평균 응답 {avg} | 요청 {self.requests} "
+                f"(느림 {self.slow}, 차단 {self.throttled})")
+
+
+class RateLimiter:
+    def __init__(self, start=RATE_START, min_rate=RATE_MIN, max_rate=RATE_MAX):
+        self.start, self.min_rate, self.max_rate = start, min_rate, max_rate
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def host(self, url) -> HostRate:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            h = self._hosts.get(host)
+            if h is None:
+                h = self._hosts[host] = HostRate(host, self.start)
+            return h
+
+    def wait(self, url):
+        """토큰이 생길 때까지 기다린 뒤 하나 쓴다. 차단 뒤 쉬는 중이면 그 시간까지."""
+        h = self.host(url)
+        while True:
+            with h.lock:
+                now = time.monotonic()
+                h._refill(now)
+                if now >= h.blocked_until and h.tokens >= 1:
+                    h.tokens -= 1
+                    return
+                delay = max(h.blocked_until - now, (1 - h.tokens) / h.rate)
+            time.sleep(delay)
+
+    def feedback(self, url, elapsed, throttled=False, browser=False, retry_after=None):
+        """응답 하나 반영. elapsed=None 은 네트워크 오류/타임아웃.
+        브라우저 로딩 시간은 렌더링이 섞여 있어 평균/느림 판정에 쓰지 않는다 (타임아웃만 감속).
+        차단 응답에 retry_after(초)가 있으면 쉬는 시간을 최소 그만큼으로.
+        → 로그로 남길 문자열 (감속했거나 REPORT_EVERY 마다), 아니면 None."""
+        h = self.host(url)
+        with h.lock:
+            h.requests += 1
+            if throttled:
+                h.throttled += 1; h.strikes += 1
+                h.rate = max(self.min_rate, h.rate * 0.5)
+                pause = min(COOLDOWN_MAX, 2.0 ** h.strikes)
+                if retry_after: pause = max(pause, min(RETRY_AFTER_MAX, retry_after))
+                h.blocked_until = time.monotonic() + pause
+                h.tokens = 0.0
+                return f"차단 응답 → 감속, {pause:.0f}초 대기 | {h.describe()}"
+            slow = elapsed is None or not browser and (
+                elapsed > SLOW_S or h.ewma is not None and elapsed > SLOW_RATIO * h.ewma)
+            if elapsed is not None and not browser:
+                h.ewma = elapsed if h.ewma is None else 0.8 * h.ewma + 0.2 * elapsed
+            if slow:
+                h.slow += 1
+                h.rate = max(self.min_rate, h.rate * 0.75)
+                return f"느린 응답 → 감속 | {h.describe()}"
+            h.strikes = 0
+            h.rate = min(self.max_rate, h.rate + RATE_STEP)
+            return h.describe() if h.requests % REPORT_EVERY == 0 else None
+
+    def describe(self, url):
+        h = self.host(url)
+        with h.lock:
+            return h.describe()
+
+
+RATE_LIMITER = RateLimiter()
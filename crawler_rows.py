@@ -0,0 +1,96 @@
+"""열 단위 행 저장소: 글 하나를 dict 로 들고 있지 않고 열마다 배열 하나에 쌓는다.
+
+    rows = RowStore(); rows += page_rows              # dict 행을 받아 열로 나눠 넣는다
+    rows[mark:] → [dict]                               # 꺼낼 때만 dict 로 (저널/내보내기에 넘길 페이지분)
+    rows.span() → (가장 오래된 시각, 가장 최근 시각)
+    rows.to_arrow(schema)                              # 숫자/시각 열은 복사 없이 numpy 버퍼로 넘긴다
+
+열 형식:
+    Site      → 코드(array 'B') + 이름 표 (사이트 이름 문자열을 행마다 들지 않음)
+    Views     → array('q'), 없으면 NULL
+    _dt       → array('q') 1970-01-01 기준 초 (시간대 없음), 없으면 NULL → numpy datetime64[s] 로 그대로 보인다
+    Title / Date / Link → list[str]
+일주일치 DC 다중 게시판처럼 수십만 행이 쌓여도 행마다 dict(키 6개) 대신 문자열 3개 + 17바이트만 남는다.
+"""
+from array import array
+from datetime import datetime, timedelta
+
+COLUMNS = ("Site", "Title", "Date", "Views", "Link", "_dt")
+NULL = -(1 << 63)               # numpy datetime64 의 NaT 와 같은 값
+_EPOCH = datetime(1970, 1, 1)
+_SEC = timedelta(seconds=1)
+
+
+def _secs(dt):
+    return NULL if dt is None else (dt - _EPOCH) // _SEC
+
+def _from_secs(v):
+    return None if v == NULL else _EPOCH + timedelta(seconds=v)
+
+
+class RowStore:
+    """append/extend 는 한 스레드에서 (크롤러의 결과 목록). 여러 스레드가 쓰면 호출하는 쪽이 잠근다."""
+    __slots__ = ("_names", "_codes", "_site", "title", "date", "views", "link", "_ts")
+
+    def __init__(self, rows=()):
+        self._names, self._codes = [], {}
+        self._site, self.views, self._ts = array("B"), array("q"), array("q")
+        self.title, self.date, self.link = [], [], []
+        self.extend(rows)
+
+    def append(self, r):
+        site = r.get("Site")
+        code = self._codes.get(site)
+        if code is None:
+            code = self._codes[site] = len(self._names); self._names.append(site)
+        v = r.get("Views")
+        self._site.append(code)
+        self.title.append(r.get("Title")); self.date.append(r.get("Date")); self.link.append(r.get("Link"))
+        self.views.append(NULL if v is None else int(v))
+        self._ts.append(_secs(r.get("_dt")))
+
+    def extend(self, rows):
+        if isinstance(rows, RowStore): rows = iter(rows)
+        for r in rows: self.append(r)
+        return self
+
+    __iadd__ = extend
+
+    def __len__(self):
+        return len(self.link)
+
+    def row(self, i) -> dict:
+        v = self.views[i]
+        return {"Site": self._names[self._site[i]], "Title": self.title[i], "Date": self.date[i],
+                "Views": None if v == NULL else v, "Link": self.link[i], "_dt": _from_secs(self._ts[i])}
+
+    def __getitem__(self, i):
+        if isinstance(i, slice): return [self.row(j) for j in range(*i.indices(len(self)))]
+        return self.row(i)
+
+    def __iter__(self):
+        return (self.row(i) for i in range(len(self)))
+
+    def span(self):
+        """(가장 오래된, 가장 최근) 시각. 시각 있는 행이 없으면 (None, None)."""
+        ts = [t for t in self._ts if t != NULL]
+        return (_from_secs(min(ts)), _from_secs(max(ts))) if ts else (None, None)
+
+    # ---------------- Arrow ----------------
+    def _numpy(self):
+        import numpy as np
+        views = np.frombuffer(self.views, dtype="int64") if len(self) else np.zeros(0, "int64")
+        ts = np.frombuffer(self._ts, dtype="int64") if len(self) else np.zeros(0, "int64")
+        sites = np.array(self._names, dtype=object)[np.frombuffer(self._site, dtype="uint8")] \
+            if len(self) else np.zeros(0, object)
+        return views, ts.view("datetime64[s]"), sites
+
+    def to_arrow(self, schema):
+        """schema 의 열 이름/형식대로 pyarrow Table (ParquetSink 의 배치). 숫자/시각 열은 이 저장소의 버퍼를
+        그대로 쓰므로 Table 을 만든 뒤에는 이 저장소에 더 쌓지 않는다 (ParquetSink 는 배치마다 새 저장소)."""
+        import pyarrow as pa
+        views, ts, sites = self._numpy()
+        cols = {"Site": sites, "Title": self.title, "Date": self.date, "Views": views, "Link": self.link, "_dt": ts}
+        mask = {"Views": views == NULL}
+        return pa.Table.from_arrays([pa.array(cols[f.name], type=f.type, mask=mask.get(f.name), from_pandas=True)
+                                     for f in schema], schema=schema)
@@ -0,0 +1,196 @@
+"""선택자 후보 학습: 스펙 필드의 후보 여러 개(예: TheQoo 제목 h1.title → .title h1 → ...)와 목록 스펙 사슬
+(FMK 목록 행 → 포텐 링크 → 모든 a[href]) 중 실제로 맞은 것을 (사이트, 게시판, 스펙, 필드)마다 세어 두고,
+다음부터는 그 게시판에 없다고 알려진 후보(가장 많이 맞은 후보보다 앞인데 한 번도 맞지 않은 것)를 건너뛴다.
+통계는 실행 사이에 JSON 파일로 남는다.
+
+    sel = SELECTORS.scope("TQ", board, log)            # 크롤러가 게시판 하나 시작할 때
+    url, results = sel.extract_html(doc, base, text, [SPEC_TQ_DETAIL])
+    url, results = sel.extract_driver_wait(driver, FMK_LIST_SPECS, timeout, chain=True)
+    SELECTORS.save()                                   # 게시판이 끝날 때 (바뀐 게 있을 때만 쓴다)
+
+이름(spec(name=...))이 있는 스펙만 학습한다. 후보는 언제나 적힌 순서(우선순위)로 시도하므로 한 페이지에 여러 후보가
+맞으면 앞쪽 후보의 값이 이긴다 — 학습은 순서를 바꾸지 않고, 없다고 알려진 후보를 빼기만 한다 (결과가 같고 더 빠르다).
+chain=True: 스펙을 차례로 보고 레코드가 나온 스펙 다음은 건너뛴다 (뒤쪽은 빈 리스트) — 건너뛰는 규칙도 같다.
+PROBE_EVERY 번에 한 번은 아무것도 빼지 않고 적힌 그대로 (빠졌던 앞쪽 후보가 다시 맞기 시작했는지 확인).
+지금까지 가장 많이 맞던 후보가 LEAD_MISS_WARN 번 연속 맞지 않으면 한 번 경고한다 (사이트 구조 변경 신호).
+그보다 앞쪽 후보가 맞은 것은 놓친 것으로 세지 않는다.
+"""
+import os, json, threading
+
+from crawler_extract import extract_html, extract_driver_wait
+from crawler_metrics import METRICS
+
+PROBE_EVERY    = 25     # 학습한 순서 대신 적힌 순서로 보는 주기 (호출 수)
+LEAD_MISS_WARN = 20     # 1위 후보가 이만큼 연속으로 안 맞으면 경고 (목록은 행 하나가 한 번)
+MIN_HISTORY    = 20     # 1위로 인정하는 최소 적중 수 (처음 보는 게시판에서 바로 경고하지 않도록)
+DECAY_AT       = 2000   # 시도 수가 이만큼 되면 모든 수를 반으로 (오래된 기록이 새 구조를 가리지 않도록)
+CHAIN = "*"             # 스펙 사슬의 필드 이름
+
+
+class Scope:
+    """게시판 하나의 추출기. stats 가 None 이면 학습 없이 그대로 (PLAIN)."""
+    def __init__(self, stats, site, board, log=None):
+        self.stats, self.site, self.board, self.log = stats, site, board, log
+
+    def _key(self, sp, field):
+        return f"{self.site}|{self.board}|{sp['name']}|{field}"
+
+    def _plan(self, specs, chain):
+        """→ (실제로 시도할 스펙들, 원래 위치). 적힌 순서 그대로, 없다고 알려진 후보/스펙만 뺀 얕은 복사본."""
+        if self.stats is None or not any(sp.get("name") for sp in specs): return specs, list(range(len(specs)))
+        probe = self.stats.tick(self._key(specs[0], CHAIN)) % PROBE_EVERY == 0
+        out = []
+        for sp in specs:
+            if sp.get("name") and not probe:
+                sp = dict(sp, fields={f: self.stats.present(self._key(sp, f), c) if len(c) > 1 else c
+                                      for f, c in sp["fields"].items()})
+            out.append(sp)
+        order = list(range(len(specs)))
+        if chain and not probe:
+            keep = {n for n, _ in self.stats.present(self._key(specs[0], CHAIN), _chain_cands(specs))}
+            order = [i for i, (n, _) in enumerate(_chain_cands(specs)) if n in keep]
+        return [out[i] for i in order], order
+
+    def _learn(self, specs, run, order, results, chain):
+        """run: 실제로 시도한 스펙들 (selector_fallback 은 그중 첫 후보가 아닌 것이 맞은 경우만 센다)."""
+        for i, sp, recs in zip(order, run, results):
+            if not sp.get("name"): continue
+            multi = [f for f, c in specs[i]["fields"].items() if len(c) > 1]
+            for rec in recs:
+                hit = rec.pop("_hit", None) or {}       # 레코드에는 남기지 않는다
+                for f in multi if self.stats is not None else ():
+                    self._record(self._key(sp, f), sp["fields"][f], specs[i]["fields"][f], hit.get(f))
+        if chain and self.stats is not None:
+            won = next((specs[i] for i, recs in zip(order, results) if recs), None)
+            cands = _chain_cands(specs)
+            self._record(self._key(specs[0], CHAIN), [cands[i] for i in order], cands, won and won.get("name"))
+
+    def _record(self, key, tried, declared, winner):
+        warn = self.stats.record(key, winner, declared)
+        if winner is None: METRICS.count(self.site, "selector_miss")
+        elif winner != tried[0][0]: METRICS.count(self.site, "selector_fallback")
+        if warn and self.log:
+            lead, n = warn
+            self.log(f"[{self.site}] 선택자 경고: '{lead}' 가 최근 {n}번 연속 맞지 않음 → "
+                     f"{winner and repr(winner) or '맞는 후보 없음'} ({key.split('|', 2)[2]}) — 사이트 구조가 바뀌었을 수 있습니다.")
+
+    @staticmethod
+    def _restore(specs, order, results):
+        back = [[] for _ in specs]       # 뺀 스펙은 레코드 없음
+        for i, recs in zip(order, results): back[i] = recs
+        return back
+
+    def extract_html(self, doc, base, text, specs, chain=False):
+        run, order = self._plan(specs, chain)
+        url, results = extract_html(doc, base, text, run, chain=chain)
+        self._learn(specs, run, order, results, chain)
+        return url, self._restore(specs, order, results)
+
+    def extract_driver_wait(self, driver, specs, timeout=5.0, chain=False):
+        run, order = self._plan(specs, chain)
+        url, results = extract_driver_wait(driver, run, timeout, chain=chain)
+        self._learn(specs, run, order, results, chain)
+        return url, self._restore(specs, order, results)
+
+
+def _chain_cands(specs):
+    return [(sp.get("name") or str(i), "") for i, sp in enumerate(specs)]
+
+
+PLAIN = Scope(None, "", "")
+
+
+class SelectorStats:
+    """프로세스 하나에 하나 (SELECTORS). 키마다 {"tries", "hits": {선택자: 수}, "miss", "streak"}."""
+    def __init__(self):
+        self.path, self._stats, self._ticks = None, {}, {}
+        self._dirty, self._warned = False, set()
+        self._lock = threading.Lock()
+
+    def open(self, path, log=None):
+        """통계 파일을 처음 한 번 읽는다 (path 가 None 이면 저장하지 않는다). 깨진 파일은 버리고 새로."""
+        with self._lock:
+            if path is None or path == self.path: return
+            self.path = path
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._stats.update(json.load(f).get("stats") or {})
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                if log: log(f"선택자 통계를 읽지 못함 → 새로 시작: {e}")
+
+    def scope(self, site, board, log=None) -> Scope:
+        return Scope(self, site, board, log)
+
+    def tick(self, key):
+        with self._lock:
+            n = self._ticks[key] = self._ticks.get(key, -1) + 1
+            return n
+
+    def present(self, key, cands):
+        """적힌 순서 그대로, 1위 후보보다 앞인데 MIN_HISTORY 번 넘게 시도하는 동안 한 번도 맞지 않은 후보만 뺀다.
+        1위 뒤쪽 후보는 1위가 안 맞을 때만 시도되므로 그대로 둔다."""
+        with self._lock:
+            st = self._stats.get(key) or {}
+            hits, tries = dict(st.get("hits") or {}), st.get("tries", 0)
+        lead = _lead(hits)
+        if lead is None or tries < MIN_HISTORY: return cands
+        names = [c[0] for c in cands]
+        if lead not in names: return cands
+        cut = names.index(lead)
+        return [c for i, c in enumerate(cands) if i >= cut or hits.get(c[0])]
+
+    def record(self, key, winner, cands=()):
+        """winner(맞은 선택자, 없으면 None) 기록 → 경고할 때만 (1위 후보, 연속 실패 수).
+        cands(적힌 순서)에서 1위보다 앞쪽 후보가 맞았으면 1위가 놓친 것이 아니다 (연속 실패 수를 되돌린다)."""
+        with self._lock:
+            st = self._stats.setdefault(key, {"tries": 0, "hits": {}, "miss": 0, "streak": 0})
+            hits = st["hits"]
+            lead = _lead(hits)
+            names = [c[0] for c in cands]
+            ahead = winner is not None and lead in names and winner in names and names.index(winner) < names.index(lead)
+            st["tries"] += 1
+            if winner is None: st["miss"] += 1
+            else: hits[winner] = hits.get(winner, 0) + 1
+            st["streak"] = 0 if lead is None or winner == lead or ahead else st["streak"] + 1
+            if st["tries"] >= DECAY_AT:
+                st["tries"], st["miss"] = st["tries"] // 2, st["miss"] // 2
+                st["hits"] = {k: v // 2 for k, v in hits.items() if v // 2}
+            self._dirty = True
+            if st["streak"] < LEAD_MISS_WARN: self._warned.discard(key); return None
+            if key in self._warned: return None
+            self._warned.add(key)
+            return lead, st["streak"]
+
+    def rates(self, prefix=""):
+        """{키: {선택자: 적중률}} (키가 prefix 로 시작하는 것만, 'miss' 는 아무것도 안 맞은 비율)."""
+        with self._lock:
+            out = {}
+            for key, st in self._stats.items():
+                if key.startswith(prefix) and st["tries"]:
+                    out[key] = {k: round(v / st["tries"], 3) for k, v in st["hits"].items()}
+                    if st["miss"]: out[key]["miss"] = round(st["miss"] / st["tries"], 3)
+            return out
+
+    def save(self, log=None):
+        """바뀐 게 있을 때만 임시 파일에 쓰고 바꿔치기. 실패는 수집에 영향을 주지 않는다."""
+        with self._lock:
+            if not (self._dirty and self.path): return
+            data, self._dirty = json.dumps({"version": 1, "stats": self._stats}, ensure_ascii=False), False
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f: f.write(data)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            if log: log(f"선택자 통계 저장 실패: {e}")
+
+
+def _lead(hits):
+    """가장 많이 맞은 후보 (MIN_HISTORY 번 미만이면 아직 없음)."""
+    lead = max(hits, key=hits.get) if hits else None
+    return lead if lead is not None and hits[lead] >= MIN_HISTORY else None
+
+
+SELECTORS = SelectorStats()
@@ -0,0 +1,126 @@
+"""날짜/시각 정규화 엔진: 사이트별 형식 표 + 실행 단위 기준 시각(RunClock) + 일괄 처리.
+
+    clock = RunClock()                               # 실행 하나에 '지금' 하나
+    clock.stamp(text, site) → Stamp(dt, hi, exact)   # 같은 문자열은 실행 동안 한 번만 해석
+    normalize_many(texts, site, clock)               # 목록 한 페이지/열 전체 (pandas Series 도 받음)
+
+Stamp: dt 추정 시각, hi 가장 늦을 수 있는 시각 (cutoff 조기 종료 판단용), exact 분 단위로 확실한가.
+읽을 수 없으면 Stamp(None, None, False).
+
+'HH:MM', 'MM.DD', 'N 분 전' 처럼 연/일이 빠진 형식은 행마다 datetime.now() 를 부르지 않고 clock.now
+하나로 채운다 → 자정/새해 무렵 한 페이지 안에서 행마다 다른 날로 해석되지 않는다.
+행 안에서는 문자열 대신 datetime(_dt)을 들고 다니고, 문자열(ISO)은 인덱스/저널에 쓸 때만 만든다.
+"""
+import re
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+ISO = "%Y-%m-%d %H:%M:%S"
+Stamp = namedtuple("Stamp", "dt hi exact")
+NONE = Stamp(None, None, False)
+_DAY_END = timedelta(hours=23, minutes=59, seconds=59)
+_UNITS = {"초": timedelta(seconds=1), "분": timedelta(minutes=1), "시간": timedelta(hours=1), "일": timedelta(days=1)}
+
+
+def to_iso(dt):
+    return dt.strftime(ISO) if dt else None
+
+def from_iso(text):
+    try: return datetime.strptime(text, ISO) if text else None
+    except ValueError: return None
+
+
+class RunClock:
+    """한 실행 동안 고정된 기준 시각. 해석 결과도 이 기준에 묶여 있으므로 여기에 캐시한다."""
+    def __init__(self, now=None):
+        self.now = (now or datetime.now()).replace(microsecond=0)
+        self._cache = {}
+
+    def cutoff(self, hours):
+        return self.now - timedelta(hours=hours)
+
+    def stamp(self, text, site=None) -> Stamp:
+        key = (site, text)
+        s = self._cache.get(key)
+        if s is None:
+            s = self._cache[key] = normalize(text, site, self)
+        return s
+
+
+# ---------------- 형식별 변환: (match, clock) → Stamp | None ----------------
+def _full(m, clock):
+    y, M, d, h, mi, sec = m.groups()
+    try: dt = datetime(int(y), int(M), int(d), int(h), int(mi), int(sec or 0))
+    except ValueError: return None
+    return Stamp(dt, dt, True)
+
+def _hhmm(m, clock):
+    """오늘 HH:MM. 오늘로 보면 미래인 시각은 사이트의 '오늘'이 아직 어제인 것 (자정 직후)
+    → 어제로 추정하되 확실하지 않음, 가장 늦은 경우는 오늘 (조기 종료를 잘못 하지 않도록)."""
+    try: dt = clock.now.replace(hour=int(m.group(1)), minute=int(m.group(2)), second=0)
+    except ValueError: return None
+    if dt > clock.now + timedelta(minutes=1):
+        return Stamp(dt - timedelta(days=1), dt, False)
+    return Stamp(dt, dt, True)
+
+def _relative(m, clock):
+    unit = m.group(2)
+    dt = clock.now - int(m.group(1)) * _UNITS[unit]
+    return Stamp(dt, dt, unit in ("초", "분"))
+
+def _ymd(m, clock):
+    y, M, d = map(int, m.groups())
+    if y < 100: y += 2000
+    try: day = datetime(y, M, d)
+    except ValueError: return None
+    return Stamp(day, day + _DAY_END, False)
+
+def _md(m, clock):
+    """연도 없는 날짜: 올해로 보아 미래면 작년 (1월 초에 보이는 '12.31')."""
+    M, d = map(int, m.groups())
+    y = clock.now.year
+    try: day = datetime(y, M, d)
+    except ValueError: return None
+    if day > clock.now:
+        try: day = day.replace(year=y - 1)
+        except ValueError: return None     # 2/29
+    return Stamp(day, day + _DAY_END, False)
+
+
+FULL_DOT  = ("YYYY.MM.DD HH:MM", re.compile(r"^(\d{4})\.(\d{2})\.(\d{2})\s+(\d{1,2}):(\d{2})(?::(\d{2}))?$"), _full)
+FULL_DASH = ("YYYY-MM-DD HH:MM:SS", re.compile(r"^(\d{4})-(\d{2})-(\d{2})\s+(\d{1,2}):(\d{2})(?::(\d{2}))?$"), _full)
+HHMM      = ("HH:MM", re.compile(r"^(\d{1,2}):(\d{2})$"), _hhmm)
+RELATIVE  = ("N 분 전", re.compile(r"^(\d+)\s*(초|분|시간|일)\s*전$"), _relative)
+YMD       = ("YY(YY).MM.DD", re.compile(r"^(\d{2}|\d{4})[.-](\d{2})[.-](\d{2})$"), _ymd)
+MD        = ("MM.DD", re.compile(r"^(\d{2})[.-](\d{2})$"), _md)
+
+# 사이트 → 시도할 형식 (앞에서부터 처음 맞는 것). 새 사이트/형식은 여기에만 추가한다.
+FORMATS = {
+    "FMKorea":  (FULL_DOT, HHMM, RELATIVE, YMD, MD),   # 상세 '2024.08.15 12:39', 목록 '12:39' / '2024.08.15' / '3 분 전'
+    "DCInside": (FULL_DASH, FULL_DOT, HHMM, MD, YMD),  # 목록 title '2024-08-15 12:39:01', 표시 '12:39' / '08.15'
+    "TheQoo":   (FULL_DOT, HHMM, MD, YMD, RELATIVE),   # 상세 '2024.08.15 12:39', 목록 '12:39' / '08.15' / '24.08.15'
+}
+ALL_FORMATS = (FULL_DOT, FULL_DASH, HHMM, RELATIVE, YMD, MD)
+
+
+def normalize(text, site=None, clock=None) -> Stamp:
+    """문자열 하나 → Stamp. 캐시 없이 바로 해석 (보통은 clock.stamp 를 쓴다)."""
+    if not text: return NONE
+    s = text.strip()
+    clock = clock or RunClock()
+    for _, rx, conv in FORMATS.get(site, ALL_FORMATS):
+        m = rx.match(s)
+        if m: return conv(m, clock) or NONE
+    return NONE
+
+
+def normalize_many(values, site=None, clock=None):
+    """여러 문자열을 한 번에: 서로 다른 값만 해석한다 (목록의 날짜 열은 반복이 많다).
+    리스트 → [Stamp], pandas Series → 같은 index 의 DataFrame(dt, hi, exact)."""
+    clock = clock or RunClock()
+    if hasattr(values, "unique") and hasattr(values, "map"):
+        import pandas as pd
+        table = {v: clock.stamp(v, site) for v in values.dropna().unique()}
+        stamps = values.map(lambda v: table.get(v, NONE))
+        return pd.DataFrame(stamps.tolist(), index=values.index, columns=Stamp._fields)
+    return [clock.stamp(v, site) for v in values]
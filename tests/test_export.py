@@ -0,0 +1,39 @@
+import csv, json, os
+
+from crawler_export import open_sink, meta_path
+
+PAYLOAD = {"user": "tester", "dev": "dev-1", "exp": "2027-01-01"}
+ROWS = [{"Site": "DCInside", "Title": "a, \"b\"", "Date": "10.17", "Views": 3, "Link": "https://gall.dcinside.com/1"},
+        {"Site": "DCInside", "Title": "c", "Date": "10.17", "Views": None, "Link": "https://gall.dcinside.com/2"}]
+
+
+def _read(path):
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_csv_holds_only_header_and_rows(tmp_path):
+    path = str(tmp_path / "out.csv")
+    with open_sink(path, PAYLOAD) as sink:
+        sink.write_rows(ROWS)
+        sink.mark_partial("행 한도 2건")
+    assert _read(path) == [["Site", "Title", "Date", "Views", "Link"],
+                           ["DCInside", "a, \"b\"", "10.17", "3", "https://gall.dcinside.com/1"],
+                           ["DCInside", "c", "10.17", "", "https://gall.dcinside.com/2"]]
+    meta = json.load(open(meta_path(path), encoding="utf-8"))
+    assert meta["license"] == {"user": "tester", "device": "dev-1", "exp": "2027-01-01"}
+    assert meta["partial"] == {"reason": "행 한도 2건", "rows": 2}
+
+
+def test_csv_sidecar_only_when_needed(tmp_path):
+    path = str(tmp_path / "out.csv")
+    open(meta_path(path), "w").write("{}")          # 같은 이름의 이전 결과
+    with open_sink(path) as sink:
+        sink.write_rows(ROWS)
+    assert len(_read(path)) == 3 and not os.path.exists(meta_path(path))
+
+
+def test_csv_discard_removes_sidecar(tmp_path):
+    path = str(tmp_path / "out.csv")
+    open_sink(path, PAYLOAD).discard()
+    assert not os.path.exists(path) and not os.path.exists(meta_path(path))
@@ -0,0 +1,14 @@
+import lxml.html
+
+from crawler_extract import extract_html
+from crawler_parse import SPEC_TQ_DETAIL, parse
+
+SHELL = """<html><body><aside><ul><li>삭제된 게시물 복구 안내</li></ul></aside>
+<div id="app"></div><script>render()</script></body></html>"""
+
+
+def test_http_path_never_drops_a_post_on_gone_text():
+    """렌더링 전 HTML 의 사이드바 문구로 PostGone 을 내지 않는다 → 레코드 없음 (브라우저로 넘긴다)."""
+    doc = lxml.html.document_fromstring(SHELL, base_url="https://theqoo.net/hot/1")
+    assert extract_html(doc, "https://theqoo.net/hot/1", SHELL, [SPEC_TQ_DETAIL]) == ("https://theqoo.net/hot/1", [[]])
+    assert not parse("TheQoo", "detail", SHELL, "https://theqoo.net/hot/1")
@@ -0,0 +1,31 @@
+import time
+
+from crawler_http import HttpPage, needs_browser, transient, _retry_after
+from crawler_rate import RateLimiter
+
+URL = "https://www.fmkorea.com/best"
+
+
+def test_throttle_and_server_errors_retry_over_http():
+    for status in (429, 500, 502, 503, 504):
+        page = HttpPage(URL, status, "<html><body>error</body></html>", 0.1)
+        assert transient(page) and not needs_browser(page)
+    assert not transient(HttpPage(URL, 200, "<html></html>", 0.1)) and not transient(None)
+
+
+def test_only_challenge_or_empty_goes_to_browser():
+    challenge = HttpPage(URL, 503, "<html><title>Just a moment...</title></html>", 0.1)
+    assert needs_browser(challenge) and not transient(challenge)
+    assert needs_browser(HttpPage(URL, 200, "", 0.1)) and needs_browser(None)
+    assert not needs_browser(HttpPage(URL, 403, "<html><body>forbidden</body></html>", 0.1))   # 골격 없음 → 파서가 None
+
+
+def test_retry_after_header():
+    assert _retry_after("7") == 7.0 and _retry_after(None) is None and _retry_after("soon") is None
+    assert _retry_after("Thu, 01 Jan 1970 00:00:00 GMT") == 0.0   # 지난 시각
+
+
+def test_cooldown_honours_retry_after():
+    lim = RateLimiter()
+    lim.feedback(URL, 0.1, throttled=True, retry_after=30)
+    assert lim.host(URL).blocked_until - time.monotonic() > 25
@@ -0,0 +1,37 @@
+from crawler_ids import canonical_link, post_id, PostDedup
+
+
+def test_fmk_document_srl_and_path_forms_agree():
+    a = canonical_link("FMKorea", "https://WWW.fmkorea.com/index.php?mid=best&document_srl=7654321&page=2#comment")
+    b = canonical_link("FMKorea", "https://www.fmkorea.com/best/7654321")
+    assert a == b == "https://www.fmkorea.com/best/7654321"
+    assert canonical_link("FMKorea", "https://www.fmkorea.com/index.php?document_srl=7654321") == \
+        "https://www.fmkorea.com/7654321"
+    assert post_id("FMKorea", a) == post_id("FMKorea", "https://www.fmkorea.com/7654321") == "7654321"
+
+
+def test_dc_keeps_only_gallery_and_post_number():
+    url = "https://gall.dcinside.com/board/view/?id=stock&no=1234&page=3&search_head=0#c"
+    assert canonical_link("DCInside", url) == "https://gall.dcinside.com/board/view/?id=stock&no=1234"
+    assert post_id("DCInside", url) == "stock:1234"
+    assert post_id("DCInside", "https://gall.dcinside.com/board/view/?id=other&no=1234") == "other:1234"
+
+
+def test_theqoo_short_and_long_forms_agree():
+    assert canonical_link("TheQoo", "https://theqoo.net/index.php?mid=hot&document_srl=3456789") == \
+        canonical_link("TheQoo", "https://theqoo.net/hot/3456789#comment_1") == "https://theqoo.net/hot/3456789"
+
+
+def test_links_without_post_number_only_lose_fragment():
+    assert canonical_link("FMKorea", "https://www.fmkorea.com/best?page=2#top") == "https://www.fmkorea.com/best?page=2"
+    assert canonical_link("DCInside", "https://gall.dcinside.com/board/lists/?id=stock") == \
+        "https://gall.dcinside.com/board/lists/?id=stock"
+    assert canonical_link("TheQoo", "") == "" and post_id("TheQoo", None) is None
+
+
+def test_dedup_matches_by_post_number():
+    d = PostDedup()
+    d.claim("FMKorea", "https://www.fmkorea.com/best/7654321")
+    assert d.seen("FMKorea", "https://www.fmkorea.com/index.php?mid=humor&document_srl=7654321")
+    assert not d.seen("TheQoo", "https://theqoo.net/hot/7654321")
+    assert d.hits == 1 and len(d) == 1
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+
+from crawler_index import PostIndex, BoardRun
+
+URL = "https://www.fmkorea.com/index.php?mid=humor&page=3"
+NOW = datetime(2026, 10, 17, 12, 0)
+CUTOFF = NOW - timedelta(hours=6)
+
+
+def _row(n, minutes):
+    return {"Site": "FMKorea", "Title": f"글 {n}", "Date": "", "Views": n,
+            "Link": f"https://www.fmkorea.com/humor/{7000000 + n}", "_dt": NOW - timedelta(minutes=minutes)}
+
+
+def _crawl(index, rows, missed=(), cutoff=CUTOFF):
+    run = BoardRun(index, "FMKorea", URL, cutoff)
+    for r in rows: run.seen(r, r["_dt"])
+    run.store(rows)
+    for r in missed: run.miss(r["Link"])
+    run.finish(run.oldest)
+    return run
+
+
+def test_covered_until_after_a_clean_run(tmp_path):
+    index = PostIndex(str(tmp_path / "posts.db"))
+    assert BoardRun(index, "FMKorea", URL, CUTOFF).covered_until() is None
+    _crawl(index, [_row(n, n * 10) for n in range(40)])                 # 12:00 ~ 05:30 (cutoff 06:00 넘음)
+    assert BoardRun(index, "FMKorea", URL.replace("page=3", "page=1"), CUTOFF).covered_until() == NOW
+    assert BoardRun(index, "FMKorea", URL, CUTOFF - timedelta(hours=2)).covered_until() is None   # 더 넓은 구간
+    index.close()
+
+
+def test_failed_details_leave_coverage_unchanged(tmp_path):
+    index = PostIndex(str(tmp_path / "posts.db"))
+    rows = [_row(n, n * 10) for n in range(40)]
+    run = _crawl(index, rows[:20] + rows[21:], missed=[rows[20]])
+    assert run.missed == 1
+    assert BoardRun(index, "FMKorea", URL, CUTOFF).covered_until() is None
+    # 이전 범위가 있으면 그대로 (빠진 글이 있는 실행은 넓히지 않는다)
+    _crawl(index, rows)
+    later = [_row(n, -n * 10) for n in range(1, 7)]                     # 12:10 ~ 13:00 새 글
+    _crawl(index, later[:3] + later[4:], missed=[later[3]])
+    assert BoardRun(index, "FMKorea", URL, CUTOFF).covered_until() == NOW
+    index.close()
+
+
+def test_runs_that_do_not_reach_cutoff_do_not_cover(tmp_path):
+    index = PostIndex(str(tmp_path / "posts.db"))
+    _crawl(index, [_row(n, n * 10) for n in range(10)])                 # 12:00 ~ 10:30 까지만
+    assert BoardRun(index, "FMKorea", URL, CUTOFF).covered_until() is None
+    index.close()
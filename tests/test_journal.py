@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+
+from crawler_journal import CrawlJournal
+
+CUTOFF = datetime(2026, 10, 17, 6, 0)
+URL = "https://www.fmkorea.com/best"
+
+
+def _open(root, resume=True, cutoff=CUTOFF):
+    return CrawlJournal.open(str(root), "FMKorea", URL, URL, cutoff, resume)
+
+
+def _rows(page, n=2):
+    return [{"Site": "FMKorea", "Title": f"p{page}-{i}", "Date": "", "Views": i,
+             "Link": f"https://www.fmkorea.com/{page}{i:05d}", "_dt": CUTOFF + timedelta(hours=page, minutes=i)}
+            for i in range(n)]
+
+
+def test_resume_restores_finished_pages(tmp_path):
+    j = _open(tmp_path, resume=False)
+    j.page_done(1, _rows(1)); j.page_done(2, _rows(2), stale_pages=0)
+    j.close()
+    r = _open(tmp_path, cutoff=CUTOFF + timedelta(hours=3))
+    assert r.resumed and r.last_page == 2 and r.cutoff == CUTOFF
+    assert [x["Title"] for x in r.rows] == ["p1-0", "p1-1", "p2-0", "p2-1"]
+    assert r.rows[0]["_dt"] == CUTOFF + timedelta(hours=1)
+    r.close()
+
+
+def test_torn_tail_is_cut_before_appending(tmp_path):
+    j = _open(tmp_path, resume=False)
+    j.page_done(1, _rows(1))
+    j._f.write('{"t": "row", "row": {"Title": "unfinished"}}\n{"t": "pa'); j.close()   # 기록 도중 죽음
+    r = _open(tmp_path)
+    assert r.last_page == 1 and len(r.rows) == 2
+    r.page_done(2, _rows(2)); r.close()
+    again = _open(tmp_path)
+    assert again.last_page == 2
+    assert [x["Title"] for x in again.rows] == ["p1-0", "p1-1", "p2-0", "p2-1"]
+    again.close()
+
+
+def test_start_only_journal_starts_fresh_with_new_cutoff(tmp_path):
+    _open(tmp_path, resume=False).close()
+    new_cutoff = CUTOFF + timedelta(hours=5)
+    r = _open(tmp_path, cutoff=new_cutoff)
+    assert not r.resumed and r.cutoff == new_cutoff
+    r.page_done(1, _rows(1)); r.close()
+    again = _open(tmp_path)
+    assert again.cutoff == new_cutoff and again.last_page == 1
+    again.close()
+
+
+def test_finished_journal_is_not_resumed(tmp_path):
+    j = _open(tmp_path, resume=False)
+    j.page_done(1, _rows(1)); j.finish()
+    r = _open(tmp_path)
+    assert not r.resumed and len(r.rows) == 0
+    r.close()
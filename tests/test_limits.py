@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from crawler_limits import Limits, Stopped
+
+
+def test_no_limits():
+    lim = Limits()
+    for _ in range(1000): lim.page(); assert lim.allow()
+    assert lim.check() is None and lim.pages_left() is None and lim.more_pages() and lim.describe() == "없음"
+
+
+def test_page_limit():
+    lim = Limits(pages=3)
+    assert lim.pages_left() == 3 and lim.more_pages()
+    lim.page(); lim.page()
+    assert lim.pages_left() == 1 and not lim.more_pages() and lim.check() is None
+    lim.page()
+    assert lim.check() == "페이지 한도 3쪽" and lim.pages_left() == 0
+
+
+def test_row_limit_allow_and_take():
+    lim = Limits(rows=5)
+    assert [lim.allow() for _ in range(3)] == [True] * 3 and lim.check() is None
+    assert lim.take(list("abcd")) == ["a", "b"]
+    assert lim.check() == "행 한도 5건" and not lim.allow() and lim.take(["x"]) == []
+
+
+def test_row_limit_refusal_sets_reason():
+    lim = Limits(rows=1)
+    assert lim.allow() and not lim.allow()
+    assert lim.reason == "행 한도 1건"
+
+
+def test_deadline(monkeypatch):
+    lim = Limits(minutes=1)
+    assert lim.check() is None
+    later = time.monotonic() + 61
+    monkeypatch.setattr(time, "monotonic", lambda: later)
+    assert lim.check() == "시간 한도 1분"
+
+
+def test_cancel_is_shared_and_first_reason_sticks():
+    lim = Limits(rows=1)
+    job = lim.fresh(pages=2)
+    assert job.cancel is lim.cancel and job.max_rows == 1 and job.max_pages == 2
+    job.halt("목록 page=4 읽기 실패")
+    lim.stop()
+    assert job.check() == "목록 page=4 읽기 실패"   # 한 번 정해진 사유는 바뀌지 않는다
+    assert lim.check() == "취소" and lim.fresh().check() == "취소"
+
+
+def test_fresh_zero_turns_an_inherited_limit_off():
+    lim = Limits(minutes=30, pages=5, rows=100)
+    job = lim.fresh(minutes=0, rows=0)
+    assert job.max_pages == 5 and job.minutes is None and job.max_rows is None and job.deadline is None
+    assert lim.fresh().describe() == "30분 / 5쪽 / 100건"
+
+
+def test_guard_raises_stopped_once_limited():
+    lim = Limits()
+    fetch = lim.guard(lambda fetcher, url: url.upper())
+    assert fetch(None, "a") == "A"
+    lim.stop()
+    with pytest.raises(Stopped):
+        fetch(None, "b")
+
+
+def test_describe():
+    assert Limits(minutes=50, pages=10, rows=5000).describe() == "50분 / 10쪽 / 5000건"
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+from crawler_paging import ListPage, PagePlanner, IN, BOUNDARY, PAST, END
+
+NOW = datetime(2026, 10, 17, 12, 0)
+PER_PAGE = 10
+
+
+class Board:
+    """글 n 개, 1분 간격 (page 1 이 최신). past_end: 끝을 넘긴 page 에 "empty" 빈 목록, "repeat" 마지막 페이지."""
+    def __init__(self, posts, past_end="empty"):
+        self.posts, self.past_end, self.loads = posts, past_end, []
+        self.last = max(1, -(-posts // PER_PAGE))
+
+    def load(self, page):
+        self.loads.append(page)
+        if page > self.last:
+            if self.past_end == "empty": return ListPage(page, [], [], [])
+            page = self.last
+        ns = range((page - 1) * PER_PAGE, min(page * PER_PAGE, self.posts))
+        return ListPage(page, list(ns), [NOW - timedelta(minutes=n) for n in ns], [str(n) for n in ns])
+
+
+def _plan(board, minutes, start=1):
+    planner = PagePlanner(board.load, NOW - timedelta(minutes=minutes), start)
+    pages, todo = planner.plan()
+    return planner, pages, todo
+
+
+def test_boundary_page_is_found_and_every_page_read_once():
+    board = Board(1000)
+    planner, pages, todo = _plan(board, 235)          # 글 0..235 → page 1..24
+    assert pages[:24] == list(range(1, 25)) and pages[-1] <= 25
+    assert sorted(set(board.loads)) == sorted(board.loads)
+    assert set(todo) | set(planner.pages) >= set(pages) and not set(todo) & set(planner.pages)
+    assert len(board.loads) < 24                      # 탐색은 전부 읽지 않는다
+
+
+def test_classify():
+    board = Board(100)
+    planner = PagePlanner(board.load, NOW - timedelta(minutes=25))
+    assert [planner.classify(p) for p in (1, 3, 5, 11)] == [IN, BOUNDARY, PAST, END]
+
+
+def test_empty_board_plans_the_start_page():
+    board = Board(0)
+    _, pages, todo = _plan(board, 60)
+    assert pages == [1] and todo == [] and board.loads == [1]
+
+
+def test_short_board_ends_at_last_page_when_past_end_is_empty():
+    board = Board(35)                                  # page 1..4, 5 부터 빈 목록
+    _, pages, _ = _plan(board, 10_000)
+    assert pages == [1, 2, 3, 4]
+
+
+def test_short_board_ends_at_last_page_when_past_end_repeats():
+    board = Board(35, past_end="repeat")               # page 5, 6, ... 은 page 4 의 반복
+    _, pages, _ = _plan(board, 10_000)
+    assert pages == [1, 2, 3, 4]
+
+
+def test_resume_start_past_cutoff_plans_only_start():
+    board = Board(1000)
+    _, pages, todo = _plan(board, 30, start=8)
+    assert pages == [8] and todo == []
@@ -0,0 +1,46 @@
+from crawler_pool import DriverPool, ProfileBusy
+
+
+class FakeDriver:
+    current_url, window_handles = "about:blank", ["w"]
+
+    def __init__(self, profile_dir, full=False):
+        self.profile_dir, self.full, self.closed = profile_dir, full, False
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.closed = True
+
+
+def _pool(root, busy=()):
+    def factory(show, profile_dir, full=False):
+        if profile_dir in busy: raise ProfileBusy("user data directory is already in use")
+        return FakeDriver(profile_dir, full)
+    return DriverPool(factory, str(root), log=lambda msg: None)
+
+
+def test_slots_are_locked_across_pools(tmp_path):
+    gui, daemon = _pool(tmp_path), _pool(tmp_path)     # 프로세스 둘과 같은 조건 (잠금 파일을 따로 연다)
+    a, b = gui._spawn(False), daemon._spawn(False)
+    assert (a.slot, b.slot) == (0, 1) and a.driver.profile_dir != b.driver.profile_dir
+    gui._discard(a)
+    assert daemon._spawn(False).slot == 0               # 풀린 슬롯은 다시 쓴다
+
+
+def test_profile_in_use_moves_to_next_slot(tmp_path):
+    pool = _pool(tmp_path, busy={str(tmp_path / "p0")})
+    lease = pool._spawn(False)
+    assert lease.slot == 1 and pool._busy == [0]
+    pool.close()
+    assert pool._busy == [] and _pool(tmp_path)._spawn(False).slot == 0
+
+
+def test_full_load_driver_is_leased_separately(tmp_path):
+    pool = _pool(tmp_path)
+    lean = pool.acquire(False); pool.release(lean)
+    full = pool.acquire(False, full=True)
+    assert full.full and full.driver.full and full.slot != lean.slot
+    pool.release(full)
+    assert pool.acquire(False, full=True) is full and pool.acquire(False) is lean
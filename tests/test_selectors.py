@@ -0,0 +1,44 @@
+from crawler_extract import spec
+from crawler_parse import _doc
+from crawler_selectors import SelectorStats, PROBE_EVERY
+
+SPEC = spec(fields={"title": [("h1.title", "text"), (".title", "text")]}, required=["title"], name="detail")
+CHAIN = [spec(rows="li.row", fields={"v": [("", "text")]}, required=["v"], name="rows"),
+         spec(rows="a", fields={"v": [("", "text")]}, required=["v"], name="all")]
+BASE = "https://theqoo.net/hot"
+
+
+def _title(scope, html):
+    return scope.extract_html(_doc(html, BASE), BASE, html, [SPEC])[1][0][0]["title"]
+
+
+def test_higher_priority_candidate_wins_after_learning():
+    warnings = []
+    scope = SelectorStats().scope("TQ", "hot", warnings.append)
+    for i in range(100):
+        assert _title(scope, f'<div class="title">게시판 {i}</div>') == f"게시판 {i}"
+    both = '<div class="title">게시판</div><h1 class="title">글 제목</h1>'
+    got = [_title(scope, both) for _ in range(200)]
+    assert got.count("글 제목") >= 200 - PROBE_EVERY          # 빠졌던 후보는 다음 확인에서 되살아난다
+    assert got[-100:] == ["글 제목"] * 100
+    assert warnings == []                                       # 앞쪽 후보가 맞은 것은 1위가 놓친 것이 아님
+
+
+def test_absent_candidate_is_skipped_and_lead_miss_warns():
+    sp = spec(fields={"title": SPEC["fields"]["title"], "body": [("p", "text")]}, required=["body"], name="d2")
+    stats, warnings = SelectorStats(), []
+    scope = stats.scope("TQ", "hot", warnings.append)
+    run = lambda html: scope.extract_html(_doc(html, BASE), BASE, html, [sp])[1][0][0]
+    for _ in range(30): run('<div class="title">t</div><p>b</p>')
+    assert stats.present(scope._key(sp, "title"), sp["fields"]["title"]) == [(".title", "text")]
+    for _ in range(25): assert run("<p>b</p>")["title"] is None
+    assert len(warnings) == 1 and "'.title'" in warnings[0]
+
+
+def test_chain_keeps_declared_priority():
+    scope = SelectorStats().scope("FMK", "best")
+    for _ in range(40):
+        assert scope.extract_html(_doc('<a href="/1">a</a>', BASE), BASE, "", CHAIN, chain=True)[1] == [[], [{"v": "a"}]]
+    html = '<ul><li class="row">r</li></ul><a href="/1">a</a>'
+    got = [scope.extract_html(_doc(html, BASE), BASE, html, CHAIN, chain=True)[1] for _ in range(60)]
+    assert got[-30:] == [[[{"v": "r"}], []]] * 30
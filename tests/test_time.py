@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from crawler_time import RunClock, Stamp, NONE, normalize, normalize_many
+
+
+def test_full_timestamps_are_exact():
+    clock = RunClock(datetime(2026, 10, 17, 12, 0))
+    assert clock.stamp("2026-10-17 11:58:07", "DCInside") == Stamp(datetime(2026, 10, 17, 11, 58, 7),
+                                                                    datetime(2026, 10, 17, 11, 58, 7), True)
+    assert clock.stamp("2026.10.17 09:05", "FMKorea").dt == datetime(2026, 10, 17, 9, 5)
+
+
+def test_hhmm_after_midnight_belongs_to_yesterday():
+    clock = RunClock(datetime(2026, 10, 18, 0, 3))
+    s = clock.stamp("23:58", "TheQoo")
+    assert s.dt == datetime(2026, 10, 17, 23, 58) and not s.exact
+    assert s.hi == datetime(2026, 10, 18, 23, 58)    # 가장 늦은 경우(오늘)로는 조기 종료하지 않는다
+    assert clock.stamp("00:01", "TheQoo") == Stamp(datetime(2026, 10, 18, 0, 1), datetime(2026, 10, 18, 0, 1), True)
+
+
+def test_month_day_on_new_year_is_last_year():
+    clock = RunClock(datetime(2027, 1, 1, 0, 10))
+    s = clock.stamp("12.31", "DCInside")
+    assert s.dt == datetime(2026, 12, 31) and s.hi == datetime(2026, 12, 31, 23, 59, 59) and not s.exact
+    assert clock.stamp("01.01", "DCInside").dt == datetime(2027, 1, 1)
+
+
+def test_relative_and_short_year():
+    clock = RunClock(datetime(2026, 10, 17, 12, 0))
+    assert clock.stamp("3 분 전", "FMKorea") == Stamp(datetime(2026, 10, 17, 11, 57), datetime(2026, 10, 17, 11, 57), True)
+    assert not clock.stamp("2 시간 전", "FMKorea").exact
+    assert clock.stamp("24.08.15", "TheQoo").dt == datetime(2024, 8, 15)
+
+
+def test_unreadable_text():
+    assert normalize("", "FMKorea") == NONE
+    assert normalize("어제", "FMKorea") == NONE
+    assert normalize("02.30", "DCInside", RunClock(datetime(2026, 3, 1))) == NONE
+
+
+def test_one_page_uses_one_now_across_midnight():
+    """같은 실행에서는 자정이 지나도 clock.now 하나로 해석한다 (행마다 다른 날이 되지 않음)."""
+    clock = RunClock(datetime(2026, 12, 31, 23, 59, 30))
+    stamps = normalize_many(["23:59", "23:58", "23:59"], "DCInside", clock)
+    assert [s.dt for s in stamps] == [datetime(2026, 12, 31, 23, 59), datetime(2026, 12, 31, 23, 58),
+                                      datetime(2026, 12, 31, 23, 59)]
+    assert all(s.exact for s in stamps)